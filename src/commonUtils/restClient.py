@@ -6,7 +6,10 @@
 Description: Module which performs the REST Operations
 """
 
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 import requests
 import urllib3
@@ -14,6 +17,13 @@ import urllib3
 # Wait time for server to send data
 REQUEST_TIMEOUT = 300
 
+# Number of hosts and number of connections per host kept alive for reuse
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 75
+
+# HTTP methods retried on failed connection or 502/503/504 response
+RETRY_ALLOWED_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
 class RestAPIClient():
     """
     Description: Class that performs all REST CRUD Operations
@@ -30,6 +40,21 @@ class RestAPIClient():
         self.auth = HTTPBasicAuth(username, password)
         self.verify = verify
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # session keeps TCP/TLS connections alive across requests, cookies are not persisted as every request
+        # carries its own authorization headers
+        # session is shared by worker threads, it is safe as requests only read session attributes here i.e. no
+        # session auth, headers or adapters are changed after this point, connection pool of adapter is thread safe
+        # and cookie jar guards itself with a lock apart from rejecting all cookies
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # only requests without side effects are retried, PUT/POST/DELETE may start vCD/NSX tasks which must not be
+        # sent again, read timeouts are not retried as each of them already takes REQUEST_TIMEOUT
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=3, read=0, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                              allowed_methods=RETRY_ALLOWED_METHODS, raise_on_status=False))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def get(self, url, headers=None, auth=None, **kwargs):
         """
@@ -39,8 +64,8 @@ class RestAPIClient():
                     kwargs      - (OPTIONAL) parameters used in REST request. (DICTIONARY)
         Returns: Response object
         """
-        # get api call of requests module
-        responseData = requests.get(url=url, headers=headers, auth=auth, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
+        # get api call of requests session
+        responseData = self.session.get(url=url, headers=headers, auth=auth, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
         return responseData
 
     def post(self, url, headers=None, auth=None, **kwargs):
@@ -55,8 +80,8 @@ class RestAPIClient():
         if 'data' in kwargs:
             kwargs['data'] = kwargs['data'].encode('utf-8')
 
-        # post api call of requests module
-        responseData = requests.post(url=url, headers=headers, auth=auth, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
+        # post api call of requests session
+        responseData = self.session.post(url=url, headers=headers, auth=auth, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
         return responseData
 
     def put(self, url, headers=None, **kwargs):
@@ -71,8 +96,8 @@ class RestAPIClient():
         if 'data' in kwargs:
             kwargs['data'] = kwargs['data'].encode('utf-8')
 
-        # put api call of requests module
-        responseData = requests.put(url=url, headers=headers, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
+        # put api call of requests session
+        responseData = self.session.put(url=url, headers=headers, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
         return responseData
 
     def patch(self, url, headers=None, **kwargs):
@@ -87,8 +112,8 @@ class RestAPIClient():
         if 'data' in kwargs:
             kwargs['data'] = kwargs['data'].encode('utf-8')
 
-        # patch api call of requests module
-        responseData = requests.patch(url=url, headers=headers, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
+        # patch api call of requests session
+        responseData = self.session.patch(url=url, headers=headers, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
         return responseData
 
     def delete(self, url, headers=None, **kwargs):
@@ -99,6 +124,6 @@ class RestAPIClient():
                       kwargs    - (OPTIONAL) parameters used in REST request. (DICTIONARY)
         Returns     : Response object
         """
-        # delete api call of requests module
-        responseData = requests.delete(url=url, headers=headers, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
+        # delete api call of requests session
+        responseData = self.session.delete(url=url, headers=headers, verify=self.verify, timeout=REQUEST_TIMEOUT, **kwargs)
         return responseData
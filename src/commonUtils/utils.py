@@ -37,6 +37,38 @@ def urn_id(_id, _type):
     return _id if _id.startswith('urn') else f"urn:vcloud:{_type}:{_id}"
 
 
+def mergeRanges(ranges):
+    """
+    Description : Merges overlapping and adjacent inclusive integer ranges
+    Parameters  : ranges - (start, end) tuples of inclusive integer ranges (LIST)
+    Returns     : Sorted list of non overlapping and non adjacent (start, end) tuples (LIST)
+    """
+    mergedRanges = list()
+    for start, end in sorted(ranges):
+        if mergedRanges and start <= mergedRanges[-1][1] + 1:
+            if end > mergedRanges[-1][1]:
+                mergedRanges[-1] = (mergedRanges[-1][0], end)
+        else:
+            mergedRanges.append((start, end))
+    return mergedRanges
+
+
+def getNestedValue(data, *keys, default=None):
+    """
+    Description : Walks nested dicts of parsed API response along the keys
+    Parameters  : data - parsed API response (DICT)
+                  keys - keys of nested dicts in order (STRING)
+                  default - value returned if any key is absent or its value is empty (ANY)
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
 class Utilities():
     """
     Description :   This class provides commonly used methods for vCloud Director NSXV to NSXT
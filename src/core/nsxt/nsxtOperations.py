@@ -25,7 +25,7 @@ import src.core.nsxt.nsxtConstants as nsxtConstants
 from src.constants import rootDir
 from src.commonUtils.sshUtils import SshUtils
 from src.commonUtils.restClient import RestAPIClient
-from src.commonUtils.utils import Utilities, listify
+from src.commonUtils.utils import Utilities, listify, mergeRanges
 from src.core.vcd.vcdValidations import description
 
 
@@ -1890,15 +1890,15 @@ class NSXTOperations():
         except Exception:
             raise
 
-    def getNsxtVniPoolIds(self):
+    def getNsxtVniPoolRanges(self):
         """
-            Description :   Fetch VNI pool ids from NSXT
-            Returns     :   Set of unique VNI pool ids present in NSXT(SET)
+            Description :   Fetch VNI pool ranges from NSXT
+            Returns     :   Sorted list of merged (start, end) VNI ranges present in NSXT(LIST)
         """
         try:
             logger.debug("Fetching NSX-T VNI Pool id's")
-            # List to store the VNI pool id's
-            vniPoolIds = list()
+            # List to store the VNI pool ranges
+            vniPoolRanges = list()
 
             # URL to fetch VNI pools from NSXT
             poolRetrievalUrl = nsxtConstants.NSXT_HOST_API_URL.format(self.ipAddress,
@@ -1917,12 +1917,13 @@ class NSXTOperations():
                 # Iterating over the VNI pool ranges present in NSXT
                 for result in responseDict['results']:
                     for poolRange in result['ranges']:
-                        # Creating ID's from pool range and extending it to final result list
-                        vniPoolIds.extend(list(range(poolRange['start'], poolRange['end'] + 1)))
+                        # Ranges are kept as is instead of expanding them to individual ID's
+                        if poolRange['start'] <= poolRange['end']:
+                            vniPoolRanges.append((poolRange['start'], poolRange['end']))
             else:
                 raise Exception('Failed to retrieve VNI pool ranges from NSX-T')
-            # Returning unique id's
-            return set(vniPoolIds)
+            # Returning ranges merged into non overlapping ranges
+            return mergeRanges(vniPoolRanges)
         except:
             raise
 
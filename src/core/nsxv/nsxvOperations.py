@@ -16,6 +16,7 @@ from src.commonUtils.certUtils import generateRSAKey, decryptCertPrivateKey, dec
 import src.core.nsxv.nsxvConstants as nsxvConstants
 
 from src.commonUtils.restClient import RestAPIClient
+from src.commonUtils.utils import mergeRanges
 
 logger = logging.getLogger('mainLogger')
 
@@ -186,15 +187,15 @@ class NSXVOperations():
             if os.path.exists(self.pemFileName):
                 os.remove(self.pemFileName)
 
-    def getNsxvVniPoolIds(self):
+    def getNsxvVniPoolRanges(self):
         """
-            Description :   Fetch VNI pool ids from NSXV
-            Returns     :   Set of unique VNI pool ids present in NSXV(SET)
+            Description :   Fetch VNI pool ranges from NSXV
+            Returns     :   Sorted list of merged (start, end) VNI ranges present in NSXV(LIST)
         """
         try:
             logger.debug("Fetching NSX-V VNI Pool id's")
-            # List to store the VNI pool id's
-            vniPoolIds = list()
+            # List to store the VNI pool ranges
+            vniPoolRanges = list()
 
             # URL to fetch VNI pools from NSXV
             poolRetrievalUrl = nsxvConstants.NSXV_HOST_API_URL.format(self.ipAddress,
@@ -210,11 +211,12 @@ class NSXVOperations():
             if apiResponse.status_code == requests.codes.ok:
                 logger.debug('Successfully retrieved VNI pool ranges from NSX-V')
                 for poolRange in responseDict.get('segmentRanges', []):
-                    # Creating ID's from pool range and extending it to final result list
-                    vniPoolIds.extend(list(range(poolRange['begin'], poolRange['end'] + 1)))
+                    # Ranges are kept as is instead of expanding them to individual ID's
+                    if poolRange['begin'] <= poolRange['end']:
+                        vniPoolRanges.append((poolRange['begin'], poolRange['end']))
             else:
                 raise Exception('Failed to retrieve VNI pool ranges from NSX-V')
-            # Returning unique id's
-            return set(vniPoolIds)
+            # Returning ranges merged into non overlapping ranges
+            return mergeRanges(vniPoolRanges)
         except:
             raise
\ No newline at end of file
@@ -252,6 +252,14 @@ VCD_CREATION_TIMEOUT = 360.0
 # vcd task operations interval
 VCD_CREATION_INTERVAL = 10.0
 
+# vcd task status polling interval grows from initial to max interval by backoff factor
+VCD_TASK_POLL_INITIAL_INTERVAL = 1.0
+VCD_TASK_POLL_MAX_INTERVAL = 20.0
+VCD_TASK_POLL_BACKOFF = 1.5
+
+# seconds for which vcd is asked to hold task status request till task changes its state
+VCD_TASK_LONG_POLL_WAIT = 20
+
 # api template names:-
 # create org vdc network template name used in template.json
 CREATE_ORG_VDC_NETWORK_TEMPLATE = 'createOrgVDCNetwork'
@@ -429,7 +437,11 @@ ASSIGN_COMPUTE_POLICY_TO_VDC = 'vdcComputePolicies/{}/vdcs'
 DELETE_VAPP_TASK_NAME = 'vdcDeleteVapp'
 
 # page size for port group
-PORT_GROUP_PAGE_SIZE = 50
+PORT_GROUP_PAGE_SIZE = 128
+ORG_VDC_PAGE_SIZE = 128
+
+# page size for org vdc networks
+ORG_VDC_NETWORK_PAGE_SIZE = 128
 
 # enable org vdc by id uri
 ENABLE_ORG_VDC = 'vdc/{}/action/enable'
@@ -481,6 +493,11 @@ CREATE_APPLICATION_PORT_PROFILE_TASK_NAME = 'createAppPortProfile'
 
 # validate dedicated external network filter api uri
 VALIDATE_DEDICATED_EXTERNAL_NETWORK_FILTER = '?filter=edgeGatewayUplinks.uplinkId=={}'
+EDGE_GATEWAY_UPLINK_ID_FILTER = 'edgeGatewayUplinks.uplinkId=={}'
+VALIDATE_DEDICATED_EXTERNAL_NETWORKS_FILTER = '?filter=({})&page={}&pageSize={}'
+# external networks per edge gateway query, keeps the filter within url length limit
+DEDICATED_EXTERNAL_NETWORK_BATCH_SIZE = 20
+DEDICATED_EXTERNAL_NETWORK_PAGE_SIZE = 128
 
 # validate external network ip space
 VALIDATE_EXTERNAL_NETWORK_IP_SPACES = "?filter=externalNetworkRef.id=={}"
@@ -530,6 +547,9 @@ RENAME_CATALOG_TEMPLATE = 'renameCatalog'
 # page size for org vdc compute policy
 ORG_VDC_COMPUTE_POLICY_PAGE_SIZE = 25
 
+# number of org vdc compute policy pages fetched in parallel
+ORG_VDC_COMPUTE_POLICY_PAGE_FETCH_WORKERS = 8
+
 # cidr dict constant
 CIDR_DICT = {"1": "32", "2": "31", "4": "30", "8": "29", "16": "28", "32": "27", "64": "26", "128": "25", "256": "24"}
 
@@ -555,6 +575,12 @@ CONNECTION_PROPERTIES_CONFIG = '/{}/connectionProperties'
 DISTRIBUTED_FIREWALL_OBJECT_LIST = ['IPSet', 'Network', 'Ipv4Address']
 DISTRIBUTED_FIREWALL_OBJECT_LIST_ANDROMEDA = ['IPSet', 'Network', 'Ipv4Address', 'VirtualMachine', 'SecurityGroup']
 
+# load balancer pool algorithms supported on target
+LOAD_BALANCER_SUPPORTED_ALGORITHMS = frozenset({'round-robin', 'leastconn'})
+
+# load balancer application profile persistence methods supported on target
+LOAD_BALANCER_SUPPORTED_PERSISTENCE = frozenset({'cookie', 'sourceip'})
+
 # ike version dict
 CONNECTION_PROPERTIES_IKE_VERSION = {"ikev1": "IKE_V1", "ikev2": "IKE_V2", "ike-flex": "IKE_FLEX"}
 
@@ -628,6 +654,9 @@ GET_MEDIA_INFO = 'query?type=media'
 # page size for media
 MEDIA_PAGE_SIZE = 50
 
+# number of media pages fetched in parallel
+MEDIA_PAGE_FETCH_WORKERS = 8
+
 # vm references from the affinity rules template names
 VM_REFERENCES_TEMPLATE_NAME = 'vmReferenceAffinityRules'
 
@@ -662,6 +691,18 @@ VAPP_STATUS = {
     'INCONSISTENT_STATE': '9'
 }
 
+# status codes of VMs supported by migration
+VM_SUPPORTED_STATUS = frozenset(
+    VAPP_STATUS[state] for state in ('FAILED_CREATION', 'UNRESOLVED', 'POWERED_ON', 'UNRECOGNIZED', 'POWERED_OFF',
+                                     'INCONSISTENT_STATE'))
+
+# status codes of vApps which are not moved by migration
+VAPP_UNSUPPORTED_STATUS_NAMES = ('FAILED_CREATION', 'UNRESOLVED', 'UNRECOGNIZED', 'INCONSISTENT_STATE')
+VAPP_UNSUPPORTED_STATUS = frozenset(VAPP_STATUS[state] for state in VAPP_UNSUPPORTED_STATUS_NAMES)
+
+# gateway of vApp network without parent network which is not treated as isolated vApp network
+VAPP_DHCP_NETWORK_GATEWAY = '196.254.254.254'
+
 #ipset scope url
 IPSET_SCOPE_URL = 'scope/{}'
 
@@ -743,6 +784,9 @@ GET_PORTGROUP_VLAN_ID ='query?type=portgroup&filter=(moref=={})'
 # Default page size for query APIs
 DEFAULT_QUERY_PAGE_SIZE = 25
 
+# number of external network names combined in a single filter
+EXTERNAL_NETWORK_NAME_FILTER_BATCH_SIZE = 25
+
 # Query API and Page size for named disk
 GET_NAMED_DISK_BY_VDC = 'query?type=disk&filter=(((vdc=={})))'
 
@@ -769,6 +813,10 @@ VAPP_DATA_URL = 'https://{}/api/query?type=vApp&format=records'
 # Query to get vApp data
 VAPP_INFO_QUERY = 'query?type=vApp'
 
+# Query to get vApps of org vdc along with their status and VM count
+ADMIN_VAPP_BY_VDC_QUERY = 'query?type=adminVApp&filter=(vdc=={})'
+VAPP_QUERY_PAGE_SIZE = 128
+
 # max orgVdc count for shared network migration
 MAX_ORGVDC_COUNT = 16
 
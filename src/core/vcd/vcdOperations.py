@@ -1363,6 +1363,8 @@ class VCloudDirectorOperations(ConfigureEdgeGatewayServices):
         # list of networks disconnected successfully
         networkDisconnectedList = []
         orgVDCNetworksErrorList = []
+        # vnics of source edge gateway changes after this operation
+        self.clearEdgeGatewayVnicCache()
 
         try:
             # Check if source org vdc network disconnection was performed
@@ -1501,6 +1503,8 @@ class VCloudDirectorOperations(ConfigureEdgeGatewayServices):
                         connect             -   Defaults to True meaning reconnects the source edge gateway (BOOL)
                                             -   if set False meaning disconnects the source edge gateway (BOOL)
         """
+        # vnics of source edge gateway changes after this operation
+        self.clearEdgeGatewayVnicCache()
         try:
             # Check if services configuration or network switchover was performed or not
             if connect and not self.rollback.metadata.get("configureTargetVDC", {}).get("reconnectOrDisconnectSourceEdgeGateway"):
@@ -2438,6 +2442,8 @@ class VCloudDirectorOperations(ConfigureEdgeGatewayServices):
                 if sourceOrgVDCNetwork['name'] + '-v2t' == network['name']:
                     return sourceOrgVDCNetwork['connection']['connectionTypeValue'] == 'DISTRIBUTED'
 
+        # vnics of source edge gateway changes after this operation
+        self.clearEdgeGatewayVnicCache()
         try:
             if not self.rollback.apiData['targetEdgeGateway']:
                 logger.debug('Reconnecting target Org VDC Networks as edge gateway '
@@ -4974,10 +4980,7 @@ class VCloudDirectorOperations(ConfigureEdgeGatewayServices):
             logger.info('vApp {} is not moved as vApp does not have any VMs'.format(vApp['@name']))
             return
             # skip moving vApp in case of unsupported states
-        if responseDict['VApp']["@status"] in [
-            code for state, code in vcdConstants.VAPP_STATUS.items()
-            if state in ['FAILED_CREATION', 'UNRESOLVED', 'UNRECOGNIZED', 'INCONSISTENT_STATE']
-        ]:
+        if responseDict['VApp']["@status"] in vcdConstants.VAPP_UNSUPPORTED_STATUS:
             logger.warning('vApp {} is not moved as vApp is in FAILED_CREATION/UNRESOLVED/UNRECOGNIZED/INCONSISTENT_STATE state'.format(vApp['@name']))
             return
         vAppData = responseDict['VApp']
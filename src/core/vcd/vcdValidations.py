@@ -7,13 +7,16 @@
 Description : Module performs VMware Cloud Director validations related for NSX-V To NSX-T
 """
 
+import bisect
 import inspect
 from functools import wraps
-from collections import OrderedDict, defaultdict, Counter
+from collections import OrderedDict, defaultdict
 from pkg_resources._vendor.packaging import version
 import copy
+import io
 import json
 import logging
+import math
 import os
 import re
 import threading
@@ -22,16 +25,40 @@ import traceback
 
 import ipaddress
 import requests
+import xml.etree.ElementTree as ElementTree
 
 import src.core.vcd.vcdConstants as vcdConstants
 
 from src.commonUtils.restClient import RestAPIClient
 from src.commonUtils.certUtils import verifyCertificateAgainstCa
-from src.commonUtils.utils import Utilities, listify, urn_id
+from src.commonUtils.threadUtils import Thread
+from src.commonUtils.utils import Utilities, getNestedValue, listify, mergeRanges, urn_id
 
 logger = logging.getLogger('mainLogger')
 endStateLogger = logging.getLogger("endstateLogger")
 
+# VCD API versions parsed once for comparison with VCDMigrationValidation.versionNumber
+ZEUS_VERSION = float(vcdConstants.API_VERSION_ZEUS)
+ANDROMEDA_VERSION = float(vcdConstants.API_VERSION_ANDROMEDA)
+ANDROMEDA_10_3_1_VERSION = float(vcdConstants.API_VERSION_ANDROMEDA_10_3_1)
+ANDROMEDA_10_3_3_VERSION = float(vcdConstants.API_VERSION_ANDROMEDA_10_3_3)
+BETELGEUSE_10_4_VERSION = float(vcdConstants.API_VERSION_BETELGEUSE_10_4)
+CASTOR_10_4_1_VERSION = float(vcdConstants.API_VERSION_CASTOR_10_4_1)
+
+# edge gateway CIDR input fields with their expected IP version and error message for other versions
+EDGE_GATEWAY_CIDR_FIELDS = (
+    ('LoadBalancerVIPSubnet', 4, "LoadBalancerVIPSubnetData field has invalid IPV4 IP."),
+    ('LoadBalancerServiceNetwork', 4, "LoadBalancerServiceNetwork field has invalid IPV4 IP."),
+    ('LoadBalancerServiceNetworkIPv6', 6, "LoadBalancerServiceNetworkIPv6 field has invalid IPV6 IP."),
+)
+
+# edge gateway boolean input fields with the name used in error message
+EDGE_GATEWAY_BOOLEAN_FIELDS = (
+    ('AdvertiseRoutedNetworks', 'AdvertiseRoutedNetworks'),
+    ('SkipBGPMigration', 'SkipBGPMigration'),
+    ('NonDistributedNetworks', 'NonDistributedNetwork'),
+)
+
 
 def getSession(self):
     if hasattr(self, '__threadname__') and self.__threadname__:
@@ -44,6 +71,67 @@ def getSession(self):
         self.vcdLogin()
 
 
+def isIPv6Address(ipAddress):
+    """
+        Description : Checks whether the given IP address is an IPv6 address
+                      IPv4 addresses are short-circuited by the ':' check without parsing them
+        Parameters  : ipAddress - IP address to be checked (STRING)
+    """
+    return ':' in ipAddress and isinstance(ipaddress.ip_address(ipAddress), ipaddress.IPv6Address)
+
+
+# local names of namespace qualified XML tags and attributes keyed by their qualified names
+_xmlLocalNames = dict()
+
+
+def xmlLocalName(qualifiedName):
+    """
+        Description : Returns name of XML tag or attribute without its namespace
+                      Names are split once and looked up afterwards as the same few tags repeat across documents
+        Parameters  : qualifiedName - tag or attribute name in '{namespace}name' form (STRING)
+    """
+    localName = _xmlLocalNames.get(qualifiedName)
+    if localName is None:
+        localName = _xmlLocalNames[qualifiedName] = qualifiedName.rsplit('}', 1)[-1]
+    return localName
+
+
+def isIPv4AddressInRanges(ipAddress, ipRanges):
+    """
+        Description : Checks whether the given IPv4 address is present in any of the IP ranges
+        Parameters  : ipAddress - IP address to be checked (STRING)
+                      ipRanges - sorted list of non overlapping (start, end) integer values of IPv4 address ranges (LIST)
+    """
+    ipAddress = ipaddress.ip_address(ipAddress)
+    if ipAddress.version != 4:
+        return False
+    ipAddress = int(ipAddress)
+    # index of last range starting at or before the ip address
+    index = bisect.bisect_right(ipRanges, (ipAddress, float('inf'))) - 1
+    return index >= 0 and ipRanges[index][1] >= ipAddress
+
+
+def overlappingNetworkPairs(networks):
+    """
+        Description : Finds all pairs of overlapping networks by sweeping over networks sorted by address
+                      CIDR blocks are either nested or disjoint, so networks containing the current one form a stack
+        Parameters  : networks - IPv4/IPv6 networks (LIST)
+        Returns     : sorted (i, j) index pairs with i < j of overlapping networks (LIST)
+    """
+    intervals = sorted(
+        (network.version, int(network.network_address), -int(network.broadcast_address), index)
+        for index, network in enumerate(networks))
+    pairs = list()
+    containingNetworks = list()
+    for ipVersion, start, negatedEnd, index in intervals:
+        # dropping networks that end before the current one starts or are of other IP version
+        while containingNetworks and (containingNetworks[-1][0] != ipVersion or containingNetworks[-1][1] < start):
+            containingNetworks.pop()
+        pairs.extend((min(index, otherIndex), max(index, otherIndex)) for _, _, otherIndex in containingNetworks)
+        containingNetworks.append((ipVersion, -negatedEnd, index))
+    return sorted(pairs)
+
+
 def isSessionExpired(func):
     """
         Description : decorator to check and get vcd Rest API session
@@ -224,12 +312,44 @@ class VCDMigrationValidation:
         self.thread = threadObj
         self.rollback = rollback
         self.version = self._getAPIVersion()
+        # numeric value of api version used for version comparisons
+        self.versionNumber = float(self.version)
         self.nsxVersion = None
         self.nsxManagerId = None
         self.networkProviderScope = None
         self.l3DfwRules = None
         self.dfwSecurityTags = dict()
         self._isSharedNetworkPresent = None
+        # vnic details of source edge gateways keyed by edge gateway id
+        self._edgeGatewayVnicDetails = dict()
+        # service engine groups keyed by name, fetched once per run
+        self._serviceEngineGroupsByName = None
+        # source edge gateway list from apiData along with its index by id
+        self._sourceEdgeGatewayIndex = (None, dict())
+        # result of verification of NSX-V service certificate against CA keyed by (certObjectId, caObjectId)
+        self._certificateCaVerification = dict()
+        # details of networks used by routed vApp networks, cleared on every routed vApp network validation
+        self._overlayBackedNetworkCheck = dict()
+        self._directNetworkCountByExternalNetwork = dict()
+        self._externalNetworksByName = dict()
+        self._parentNetworksById = dict()
+        # vApps of org VDC and parsed vApp details keyed by vApp href, shared by vApp validations of the org VDC
+        # whose id is kept along, they are cleared when vApps of another org VDC are validated
+        self._vAppCacheOrgVdcId = None
+        self._vAppsListByOrgVdc = dict()
+        self._vAppDetails = dict()
+        # (ETag, parsed details) of vApps of the same org VDC keyed by vApp href, kept across validations of the org
+        # VDC to revalidate details
+        self._vAppDetailsByEtag = dict()
+        # vCD version fetched from vCD cells, does not change during a run
+        self._vcdVersion = None
+        # backing type and details of network pools keyed by network pool id
+        self._networkPoolBackingById = dict()
+        self._networkPoolDetailsById = dict()
+        # backing type of org vdcs keyed by org vdc id
+        self._orgVDCBackingTypes = dict()
+        # IP Spaces of provider gateways keyed by provider gateway id, shared by validations of a run
+        self._providerGatewayIpSpaces = dict()
         vcdConstants.VCD_API_HEADER = vcdConstants.VCD_API_HEADER.format(self.version)
         vcdConstants.GENERAL_JSON_ACCEPT_HEADER = vcdConstants.GENERAL_JSON_ACCEPT_HEADER.format(self.version)
         vcdConstants.OPEN_API_CONTENT_TYPE = vcdConstants.OPEN_API_CONTENT_TYPE.format(self.version)
@@ -1088,7 +1208,7 @@ class VCDMigrationValidation:
             logger.debug("Getting Org VDC vApps List and checking whether any vApp violates the 118 character limit for vApp name") 
             longNameVappList = list() 
             orgVDCId = orgVDCId.split(':')[-1] 
-            sourceVappsList = self.getOrgVDCvAppsList(orgVDCId) 
+            sourceVappsList = self._getVappsListForValidation(orgVDCId) 
             if not sourceVappsList: 
                 return 
             
@@ -1173,7 +1293,7 @@ class VCDMigrationValidation:
         """
         try:
             vAppFencingList = list()
-            allVappList = self.getOrgVDCvAppsList(sourceOrgVDCId)
+            allVappList = self._getVappsListForValidation(sourceOrgVDCId)
 
             # iterating over the vapps in the source org vdc
             for eachVapp in allVappList:
@@ -1581,7 +1701,7 @@ class VCDMigrationValidation:
                     for externalGateway, externalPrefixLength in sourceExternalGatewayAndPrefixList]
                 if targetExternalNetwork.get("usingIpSpace"):
                     # Fetch all IP Spaces details connected as an uplink to Provider Gateway
-                    ipSpaces = self.getProviderGatewayIpSpaces(targetExternalNetwork)
+                    ipSpaces = self._getProviderGatewayIpSpacesForValidation(targetExternalNetwork)
                     # Create a list of Target networks from internal scopes of all IP Spaces connected as an uplink to Provider Gateway
                     targetNetworkAddressList = [ipaddress.ip_network('{}'.format(internalScope), strict=False)
                                              for ipSpace in ipSpaces for internalScope in ipSpace.get("ipSpaceInternalScope", [])]
@@ -1606,7 +1726,7 @@ class VCDMigrationValidation:
                     data['isT0Connected'][edgeGateway['name']] = {extNetName: sourceExternalGatewayAndPrefixList}
 
             if errorList:
-                if float(self.version) >= float(vcdConstants.API_VERSION_CASTOR_10_4_1):
+                if self.versionNumber >= CASTOR_10_4_1_VERSION:
                     segmentErrorList = self.validateSegmentBackedNetwork(gatewayErrorList)
                     if segmentErrorList:
                         raise Exception('; '.join(errorList + segmentErrorList))
@@ -1643,7 +1763,7 @@ class VCDMigrationValidation:
             targetExternalNetwork = self.rollback.apiData['targetExternalNetwork'][t0Gateway]
             if targetExternalNetwork.get("usingIpSpace"):
                 # Fetch all IP Spaces details connected as an uplink to Provider Gateway
-                ipSpaces = self.getProviderGatewayIpSpaces(targetExternalNetwork)
+                ipSpaces = self._getProviderGatewayIpSpacesForValidation(targetExternalNetwork)
                 # Create a list of Target networks from internal scopes of all IP Spaces connected as an uplink to Provider Gateway
                 targetNetworkAddressList = [ipaddress.ip_network('{}'.format(internalScope), strict=False)
                                             for ipSpace in ipSpaces for internalScope in ipSpace.get("ipSpaceInternalScope", [])]
@@ -1745,6 +1865,16 @@ class VCDMigrationValidation:
             ipSpaceList.append(self.fetchIpSpace(ipSpaceId))
         return ipSpaceList
 
+    def _getProviderGatewayIpSpacesForValidation(self, gatewayInfo):
+        """
+        Description : Get Provider Gateway IP Spaces, IP Spaces are retrieved once per provider gateway and shared by
+                      validations, migration steps modifying IP Spaces use getProviderGatewayIpSpaces
+        Parameters :  gatewayInfo - Provider Gateay Info (DICT)
+        """
+        if gatewayInfo["id"] not in self._providerGatewayIpSpaces:
+            self._providerGatewayIpSpaces[gatewayInfo["id"]] = self.getProviderGatewayIpSpaces(gatewayInfo)
+        return self._providerGatewayIpSpaces[gatewayInfo["id"]]
+
     @isSessionExpired
     def fetchIpSpace(self, ipSpaceId):
         """
@@ -1838,23 +1968,21 @@ class VCDMigrationValidation:
             networkList += vcdObj.getOrgVDCNetworks(vcdObj.rollback.apiData.get("sourceOrgVDC", {}).get("@id"),
                                                     'sourceOrgVDCNetworks', saveResponse=False)
         # List of non-direct networks i.e Routed, Isolated since direct networks are irrelevant in IP Space context
-        filteredList = list(filter(lambda network: network['networkType'] != 'DIRECT', networkList))
+        filteredList = [network for network in networkList if network['networkType'] != 'DIRECT']
         # Checking for clashing subnets from all the networks fetched above
-        for i in range(len(filteredList)):
-            n1 = ipaddress.ip_network("{}/{}".format(filteredList[i]["subnets"]["values"][0]["gateway"],
-                                                     filteredList[i]["subnets"]["values"][0]["prefixLength"]), strict=False)
-            for j in range(i + 1, len(filteredList)):
-                n2 = ipaddress.ip_network("{}/{}".format(filteredList[j]["subnets"]["values"][0]["gateway"],
-                                                         filteredList[j]["subnets"]["values"][0]["prefixLength"]), strict=False)
-                if n1.overlaps(n2):
-                    if filteredList[i]["orgVdc"]["id"] == vdcId:
-                        errorList.append(
-                            "Org VDC network - {} from Org VDC {} has Overlapping subnets with Org VDC network {} from Org VDC {}\n".format(
-                                filteredList[i]["name"], self.vdcName, filteredList[j]["name"], filteredList[j]["orgVdc"]["name"]))
-                    elif filteredList[j]["orgVdc"]["id"] == vdcId:
-                        errorList.append(
-                            "Org VDC network - {} from Org VDC {} has Overlapping subnets with Org VDC network {} from Org VDC {}\n".format(
-                                filteredList[j]["name"], self.vdcName, filteredList[i]["name"], filteredList[i]["orgVdc"]["name"]))
+        networkAddressList = [
+            ipaddress.ip_network("{}/{}".format(network["subnets"]["values"][0]["gateway"],
+                                                network["subnets"]["values"][0]["prefixLength"]), strict=False)
+            for network in filteredList]
+        for i, j in overlappingNetworkPairs(networkAddressList):
+            if filteredList[i]["orgVdc"]["id"] == vdcId:
+                errorList.append(
+                    "Org VDC network - {} from Org VDC {} has Overlapping subnets with Org VDC network {} from Org VDC {}\n".format(
+                        filteredList[i]["name"], self.vdcName, filteredList[j]["name"], filteredList[j]["orgVdc"]["name"]))
+            elif filteredList[j]["orgVdc"]["id"] == vdcId:
+                errorList.append(
+                    "Org VDC network - {} from Org VDC {} has Overlapping subnets with Org VDC network {} from Org VDC {}\n".format(
+                        filteredList[j]["name"], self.vdcName, filteredList[i]["name"], filteredList[i]["orgVdc"]["name"]))
         if errorList:
             raise Exception(errorList)
 
@@ -2224,15 +2352,12 @@ class VCDMigrationValidation:
         try:
             if float(self.version) <= float(vcdConstants.API_VERSION_PRE_ZEUS):
                 key = 'orgVdc'
-                urlForNetworks = "{}{}?filter=({}.id=={})&sortAsc=name"
                 urlForNetworksPagenation = "{}{}?page={}&pageSize={}&sortAsc=name&filter=({}.id=={})"
             elif float(self.version) >= float(vcdConstants.API_VERSION_ZEUS) and sharedNetwork:
                 key = 'ownerRef'
-                urlForNetworks = "{}{}?sortAsc=name&filter=(({}.id=={});(_context==includeAccessible))"
                 urlForNetworksPagenation = "{}{}?page={}&pageSize={}&filter=(({}.id=={});(_context==includeAccessible))&sortAsc=name"
             else:
                 key = 'ownerRef'
-                urlForNetworks = "{}{}?filter=({}.id=={})&sortAsc=name"
                 urlForNetworksPagenation = "{}{}?page={}&pageSize={}&filter=({}.id=={})&sortAsc=name"
 
             ownerRefslist = self.rollback.apiData['OrgVDCGroupID'].values() if self.rollback.apiData.get(
@@ -2247,28 +2372,16 @@ class VCDMigrationValidation:
             logger.debug("Getting Org VDC network details")
 
             for orgVDCId in orgVDCIdList:
-                # url to retrieve all the org vdc networks of the specified org vdc
-                url = urlForNetworks.format(
-                    vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                    vcdConstants.ALL_ORG_VDC_NETWORKS, key, orgVDCId)
-                # get api call to retrieve all the org vdc networks of the specified org vdc
-                response = self.restClientObj.get(url, self.headers)
-                responseDict = response.json()
-
-                if response.status_code == requests.codes.ok:
-                    logger.debug("Retrieved Org VDC Network details successfully")
-                    resultTotal = responseDict['resultTotal']
-                else:
-                    raise Exception('Failed to get Org VDC network details due to: {}'.format(responseDict['message']))
-
+                # first page also gives the total count of org vdc networks, so no separate count request is made
                 pageNo = 1
                 pageSizeCount = 0
+                resultTotal = 1
                 resultList = []
                 logger.debug('Getting Org VDC Networks')
                 while resultTotal > 0 and pageSizeCount < resultTotal:
                     url = urlForNetworksPagenation.format(vcdConstants.OPEN_API_URL.format(self.ipAddress),
                                                             vcdConstants.ALL_ORG_VDC_NETWORKS, pageNo,
-                                                            15, key, orgVDCId)
+                                                            vcdConstants.ORG_VDC_NETWORK_PAGE_SIZE, key, orgVDCId)
                     getSession(self)
                     response = self.restClientObj.get(url, self.headers)
                     if response.status_code == requests.codes.ok:
@@ -2995,45 +3108,32 @@ class VCDMigrationValidation:
 
                 # getting the dhcp config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayDhcpConfig, gatewayId, v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting the dhcp relay config details of specified edge gateway
                 self.thread.spawnThread(self.getDhcpRelayForNonDR, gatewayId, gatewayName, v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting the firewall config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayFirewallConfig, gatewayId)
-                time.sleep(2)
                 # getting the nat config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayNatConfig, gatewayId)
-                time.sleep(2)
                 # getting the ipsec config details of specified edge gateway
                 self.thread.spawnThread(
                     self.getEdgeGatewayIpsecConfig, gatewayId, gatewayName, nsxvObj=nsxvObj,
                     v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting the bgp config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgegatewayBGPconfig, gatewayId, validation=True, nsxtObj=nsxtObj, v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting the routing config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayRoutingConfig, gatewayId, gatewayName, precheck=preCheckMode)
-                time.sleep(2)
                 # getting the load balancer config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayLoadBalancerConfig, gatewayId, gatewayName, nsxvObj=nsxvObj, v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting the l2vpn config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayL2VPNConfig, gatewayId)
-                time.sleep(2)
                 # getting the sslvpn config details of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewaySSLVPNConfig, gatewayId)
-                time.sleep(2)
                 # getting the dns config of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayDnsConfig, gatewayId)
-                time.sleep(2)
                 # getting the syslog config of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewaySyslogConfig, gatewayId, v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting the ssh config of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewaySSHConfig, gatewayId, v2tAssessmentMode=v2tAssessmentMode)
-                time.sleep(2)
                 # getting gre tunnel configuration of specified edge gateway
                 self.thread.spawnThread(self.getEdgeGatewayGreTunnel, gatewayId)
 
@@ -3374,7 +3474,7 @@ class VCDMigrationValidation:
         # Check for explicit case scenario.
         networkNames = list()
         if self.orgVdcInput['EdgeGateways'][edgeGatewayName]['NonDistributedNetworks'] and \
-            float(self.version) < float(vcdConstants.API_VERSION_CASTOR_10_4_1):
+            self.versionNumber < CASTOR_10_4_1_VERSION:
             # get Non-Dist routing flag from user input and if enabled then raise exception.
             for sourceOrgVDCNetwork in sourceOrgvdcNetworks:
                 if sourceOrgVDCNetwork['networkType'] != 'NAT_ROUTED':
@@ -3402,7 +3502,7 @@ class VCDMigrationValidation:
 
             if (self.orgVdcInput['EdgeGateways'][edgeGatewayName]['NonDistributedNetworks']
                     or sourceOrgVDCNetwork['id'] in implicitNetworks) and \
-                    float(self.version) < float(vcdConstants.API_VERSION_CASTOR_10_4_1):
+                    self.versionNumber < CASTOR_10_4_1_VERSION:
                 errorList.append(
                     "DHCP Relay service configured on source edge gateway {} is not supported on target because, OrgVDC network {} will be configured as non-distributed after migration. DHCP Relay is not supported on non-distibuted routed networks.\n".format(
                         edgeGatewayName, sourceOrgVDCNetwork['name']))
@@ -3726,7 +3826,7 @@ class VCDMigrationValidation:
                         lbData - Load balancer api call data
                         v2tAssessmentMode - bool the sets whether v2tAssessmentMode is executing this method or not (BOOLEAN)
         """
-        if float(self.version) < float(vcdConstants.API_VERSION_CASTOR_10_4_1):
+        if self.versionNumber < CASTOR_10_4_1_VERSION:
             return ['Transparent Load balancer mode is configured in the Source edge gateway {} but not supported '
                     'in the Target\n'.format(gatewayName)]
 
@@ -3846,15 +3946,13 @@ class VCDMigrationValidation:
             serviceEngineGroupResultList = self.getServiceEngineGroupDetails()
             serviceEngineGroupName = self.orgVdcInput['EdgeGateways'][gatewayName]['ServiceEngineGroupName']
             if serviceEngineGroupResultList:
-                serviceEngineGroupDetails = [serviceEngineGroup for serviceEngineGroup in
-                                             serviceEngineGroupResultList if
-                                             serviceEngineGroup['name'] == serviceEngineGroupName]
-                if serviceEngineGroupDetails[0].get('haMode') != 'LEGACY_ACTIVE_STANDBY':
+                serviceEngineGroupDetails = self.getServiceEngineGroupByName(serviceEngineGroupName)
+                if serviceEngineGroupDetails.get('haMode') != 'LEGACY_ACTIVE_STANDBY':
                     transparentErrors.append("Service engine group {} should be in Active-Standby mode when transparent"
                                              " mode is enabled on Edge Gateway {}\n".format(serviceEngineGroupName, edgeGatewayId))
 
                 # Validating AVI version at least 21.1.4 for transparent
-                serviceCloudId = serviceEngineGroupDetails[0]['serviceEngineGroupBacking']['loadBalancerCloudRef']['id']
+                serviceCloudId = serviceEngineGroupDetails['serviceEngineGroupBacking']['loadBalancerCloudRef']['id']
                 logger.debug(
                     "Getting NSX-T Cloud details backing the service engine group '{}'".format(serviceEngineGroupName))
                 cloudUrl = '{}{}'.format(vcdConstants.OPEN_API_URL.format(self.ipAddress),
@@ -3977,25 +4075,8 @@ class VCDMigrationValidation:
         """
         try:
             loadBalancerErrorList = []
-            loadBalancerConfigDict = {
-                'Virtual server IP is already getting used by VM/GatewayIP of orgvdc network on edge gateway': [],
-                'Application rules': [],
-                'Unsupported values in monitor': [],
-                'Virtual Server without default pool': [],
-                'Unsupported persistence in application profile': [],
-                'Unsupported algorithm in LB pool': [],
-                'Application profile is not added in virtual Server':[],
-                'Pool member IP overlapping DNAT': [],
-                'Pool member IP address IPV6': [],
-                'Pool members using different ports': [],
-                'Virtual server IP address IPV6': [],
-                'Virtual server IP address used in DNAT': [],
-                'Virtual server IP address used in SNAT': [],
-                'Virtual server IP address used in IPSEC sites': [],
-                'Pools are mixed transparent and non transparent': [],
-            }
-            supportedLoadBalancerAlgo = ['round-robin', 'leastconn']
-            supportedLoadBalancerPersistence = ['cookie', 'sourceip']
+            # issues of each category are added on first occurrence, assessment report reads only the present ones
+            loadBalancerConfigDict = defaultdict(list)
             loadBalancerServiceNetwork = self.orgVdcInput['EdgeGateways'][gatewayName].get(
                 'LoadBalancerServiceNetwork') if not v2tAssessmentMode else None
             loadBalancerServiceNetworkIPv6 = self.orgVdcInput['EdgeGateways'][gatewayName].get(
@@ -4014,9 +4095,13 @@ class VCDMigrationValidation:
                 responseDict = self.vcdUtils.parseXml(response.content)
                 # checking if load balancer is enabled, if so raising exception
                 if responseDict['loadBalancer']['enabled'] == "true":
-                    if not v2tAssessmentMode and not float(self.version) >= float(vcdConstants.API_VERSION_ZEUS):
+                    if not v2tAssessmentMode and not self.versionNumber >= ZEUS_VERSION:
                         return ["Load Balancer service is configured in the Source edge gateway but not supported in the Target\n"]
 
+                    # Normalizing load balancer sub-configurations to lists once
+                    lbPoolsData = listify(responseDict['loadBalancer'].get('pool'))
+                    lbMonitorsData = listify(responseDict['loadBalancer'].get('monitor'))
+                    applicationProfiles = listify(responseDict['loadBalancer'].get('applicationProfile'))
                     applicationRules = responseDict['loadBalancer'].get('applicationRule', [])
 
                     if applicationRules:
@@ -4025,7 +4110,7 @@ class VCDMigrationValidation:
                             for applicationRule in listify(applicationRules):
                                 loadBalancerConfigDict['Application rules'].append(applicationRule['name'])
 
-                    for pool in listify(responseDict['loadBalancer'].get('pool', [])):
+                    for pool in lbPoolsData:
                         # setting a flag for transparent
                         if pool.get('transparent') == 'true':
                             isTransparentPoolPresent = True
@@ -4033,12 +4118,12 @@ class VCDMigrationValidation:
                         for member in listify(pool.get('member', [])):
                             if not v2tAssessmentMode and \
                                     not loadBalancerServiceNetworkIPv6 and \
-                                    isinstance(ipaddress.ip_address(member['ipAddress']), ipaddress.IPv6Address) \
+                                    isIPv6Address(member['ipAddress']) \
                                     and not pool.get('transparent') == 'true':
                                 poolsWithIpv6Configured.append(pool['name'])
                                 break
 
-                        for monitor in listify(responseDict['loadBalancer'].get('monitor')):
+                        for monitor in lbMonitorsData:
                             if pool['monitorId'] == monitor['monitorId']:
                                 if monitor['type'] in ['tcp', 'http', 'https', 'icmp']:
                                     if any(key in monitor and monitor[key] for key in ['expected', 'send', 'receive', 'extension']) or \
@@ -4063,25 +4148,24 @@ class VCDMigrationValidation:
                     if response.status_code == requests.codes.ok:
                         virtualServersData = self.vcdUtils.parseXml(response.content)
                         if virtualServersData['loadBalancer']:
-                            virtualServersData = virtualServersData['loadBalancer']['virtualServer'] if isinstance(
-                                virtualServersData['loadBalancer']['virtualServer'], list) else \
-                                [virtualServersData['loadBalancer']['virtualServer']]
+                            virtualServersData = listify(virtualServersData['loadBalancer']['virtualServer'])
                         else:
                             virtualServersData = []
                     else:
                         return ['Failed to get source edge gateway load balancer virtual servers configuration with error code {} \n'.format(response.status_code)]
 
+                    # Indexing application profiles by id for lookup from virtual servers
+                    applicationProfilesById = {
+                        profile['applicationProfileId']: profile for profile in applicationProfiles if profile}
+
+                    isVersionLessThanBetelgeuse = self.versionNumber < BETELGEUSE_10_4_VERSION
+                    virtualServersWithIpv6Vip = list()
                     for virtualServer in virtualServersData:
+                        virtualServerName = virtualServer['name']
+                        applicationProfileId = virtualServer.get('applicationProfileId')
                         # check if SSL Passthrough is enabled
-                        if virtualServer.get('applicationProfileId'):
-                            applicationProfileId = virtualServer['applicationProfileId']
-                            applicationProfiles = responseDict['loadBalancer'].get('applicationProfile') \
-                                if isinstance(responseDict['loadBalancer'].get('applicationProfile'), list) \
-                                else [responseDict['loadBalancer'].get('applicationProfile')]
-
-                            applicationProfileData = list(filter(
-                                lambda profile: profile['applicationProfileId'] == applicationProfileId,
-                                applicationProfiles))[0]
+                        if applicationProfileId:
+                            applicationProfileData = applicationProfilesById.get(applicationProfileId)
                             if applicationProfileData and applicationProfileData.get('sslPassthrough') == 'true':
                                 logger.warning("SSL Passthrough enabled with HTTPS protocol in application profile "
                                                "'{}'. During Migration, Virtual Server '{}' having Application Profile '{}' attached will have its HTTPS protocol auto changed to "
@@ -4092,57 +4176,49 @@ class VCDMigrationValidation:
 
                         # check for default pool
                         if not virtualServer.get('defaultPoolId', None):
-                            loadBalancerErrorList.append("Default pool is not configured in load balancer virtual server '{}'\n".format(virtualServer['name']))
-                            loadBalancerConfigDict['Virtual Server without default pool'].append(virtualServer['name'])
+                            loadBalancerErrorList.append(f"Default pool is not configured in load balancer virtual server '{virtualServerName}'\n")
+                            loadBalancerConfigDict['Virtual Server without default pool'].append(virtualServerName)
 
+                        isIpv6VirtualServer = isIPv6Address(virtualServer['ipAddress'])
                         # check for IPV6 Addr for virtual server and LoadBalancerServiceNetworkIPv6 configured or not.
                         if not v2tAssessmentMode and \
                                 not loadBalancerServiceNetworkIPv6 and \
-                                isinstance(ipaddress.ip_address(virtualServer['ipAddress']), ipaddress.IPv6Address)\
+                                isIpv6VirtualServer \
                                 and not isTransparentPoolPresent:
-                            virtualServersWithIpv6Configured.append(virtualServer['name'])
+                            virtualServersWithIpv6Configured.append(virtualServerName)
+
+                        # check for IPV6 Address used as VIP for virtual server
+                        if isVersionLessThanBetelgeuse and isIpv6VirtualServer:
+                            virtualServersWithIpv6Vip.append(virtualServerName)
 
                         # Check for application profile configured or not.
-                        if not(virtualServer.get('applicationProfileId')):
-                            loadBalancerErrorList.append("Application profile is not added in virtual Server '{}'\n".format(virtualServer['name']))
-                            loadBalancerConfigDict['Application profile is not added in virtual Server'].append(virtualServer['name'])
+                        if not applicationProfileId:
+                            loadBalancerErrorList.append(f"Application profile is not added in virtual Server '{virtualServerName}'\n")
+                            loadBalancerConfigDict['Application profile is not added in virtual Server'].append(virtualServerName)
 
-                        if ',' in virtualServer.get('port') or '-' in virtualServer.get('port'):
+                        virtualServerPort = virtualServer.get('port') or ''
+                        if ',' in virtualServerPort or '-' in virtualServerPort:
                             loadBalancerErrorList.append(
-                                "Multiple service ports are not supported on virtual service '{}' on edge gateway '{}'."
-                                "\n".format(virtualServer['name'], gatewayName))
+                                f"Multiple service ports are not supported on virtual service '{virtualServerName}' on edge "
+                                f"gateway '{gatewayName}'.\n")
 
                     if virtualServersWithIpv6Configured:
                         loadBalancerErrorList.append(
                             "Load balancer virtual server : '{}', has IPV6 configured on edge gateway {}, But 'LoadBalancerServiceNetworkIPv6' field is not configured/present in user input YAML file.\n".format(
                                 ','.join(virtualServersWithIpv6Configured), gatewayName))
 
-                    if float(self.version) < float(vcdConstants.API_VERSION_BETELGEUSE_10_4):
-                        for virtualServer in virtualServersData:
-                            # check for IPV6 Address for virtual server
-                            if type(ipaddress.ip_address(virtualServer['ipAddress'])) is ipaddress.IPv6Address:
-                                loadBalancerErrorList.append("IPV6 Address used as VIP in virtual Server '{}'\n".format(virtualServer['name']))
-
-                    # Fetching application profiles data from response
-                    if responseDict['loadBalancer'].get('applicationProfile'):
-                        applicationProfiles = responseDict['loadBalancer'].get('applicationProfile') \
-                            if isinstance(responseDict['loadBalancer'].get('applicationProfile'), list) \
-                            else [responseDict['loadBalancer'].get('applicationProfile')]
-                    else:
-                        applicationProfiles = []
+                    for virtualServerName in virtualServersWithIpv6Vip:
+                        loadBalancerErrorList.append("IPV6 Address used as VIP in virtual Server '{}'\n".format(virtualServerName))
 
                     for profile in applicationProfiles:
-                        if profile.get('persistence') and profile['persistence']['method'] not in supportedLoadBalancerPersistence:
+                        if profile.get('persistence') and profile['persistence']['method'] not in vcdConstants.LOAD_BALANCER_SUPPORTED_PERSISTENCE:
                             loadBalancerErrorList.append("Unsupported persistence type '{}' provided in application profile '{}'\n".format(profile['persistence']['method'], profile['name']))
                             loadBalancerConfigDict['Unsupported persistence in application profile'].append(profile['name'])
                     # fetching load balancer pools data
-                    if responseDict['loadBalancer'].get('pool', []):
-                        lbPoolsData = responseDict['loadBalancer'].get('pool', [])
-                        lbPoolsData = lbPoolsData if isinstance(lbPoolsData, list) else [lbPoolsData]
-                        for pool in lbPoolsData:
-                            if pool['algorithm'] not in supportedLoadBalancerAlgo:
-                                loadBalancerErrorList.append("Unsupported algorithm '{}' provided in load balancer pool '{}'\n".format(pool['algorithm'], pool['name']))
-                                loadBalancerConfigDict['Unsupported algorithm in LB pool'].append(pool['name'])
+                    for pool in lbPoolsData:
+                        if pool['algorithm'] not in vcdConstants.LOAD_BALANCER_SUPPORTED_ALGORITHMS:
+                            loadBalancerErrorList.append("Unsupported algorithm '{}' provided in load balancer pool '{}'\n".format(pool['algorithm'], pool['name']))
+                            loadBalancerConfigDict['Unsupported algorithm in LB pool'].append(pool['name'])
                     if not v2tAssessmentMode and not nsxvObj.ipAddress and not nsxvObj.username:
                         loadBalancerErrorList.append("NSX-V LoadBalancer service is enabled on Source Edge Gateway {}, but NSX-V details are not provided in user input file\n".format(edgeGatewayId))
 
@@ -4152,13 +4228,13 @@ class VCDMigrationValidation:
                         if serviceEngineGroupResultList:
                             if not serviceEngineGroupName:
                                 loadBalancerErrorList.append("NSX-V LoadBalancer service is enabled on Source Edge Gateway {}, Service Engine Group must be present in userInput yaml\n".format(edgeGatewayId))
-                            serviceEngineGroupDetails = [serviceEngineGroup for serviceEngineGroup in serviceEngineGroupResultList if serviceEngineGroup['name'] == serviceEngineGroupName]
+                            serviceEngineGroupDetails = self.getServiceEngineGroupByName(serviceEngineGroupName)
 
                             if not serviceEngineGroupDetails:
                                 loadBalancerErrorList.append("Service Engine Group {} does not exist in Avi.\n".format(serviceEngineGroupName))
                             else:
-                                if serviceEngineGroupDetails[0].get('haMode') != 'LEGACY_ACTIVE_STANDBY':
-                                    logger.warning("Service engine group has HA MODE '{}', if you keep using this you may incur some extra charges.".format(serviceEngineGroupDetails[0].get('haMode')))
+                                if serviceEngineGroupDetails.get('haMode') != 'LEGACY_ACTIVE_STANDBY':
+                                    logger.warning("Service engine group has HA MODE '{}', if you keep using this you may incur some extra charges.".format(serviceEngineGroupDetails.get('haMode')))
                         else:
                            loadBalancerErrorList.append("Service Engine Group {} doesn't exist in Avi.\n".format(serviceEngineGroupName))
                     # validating if transparent lB found
@@ -4185,16 +4261,17 @@ class VCDMigrationValidation:
                 """
         try:
             staticRoutesData = self.rollback.apiData.get('sourceStaticRoutes') or dict()
-            # url to retrieve the routing config info
-            url = "{}{}/{}{}".format(vcdConstants.XML_VCD_NSX_API.format(self.ipAddress),
-                                  vcdConstants.NETWORK_EDGES, edgeGatewayID, vcdConstants.VNIC)
-            # get api call to retrieve the edge gateway config info
-            response = self.restClientObj.get(url, self.headers)
-            if response.status_code == requests.codes.ok:
-                responseDict = self.vcdUtils.parseXml(response.content)
-                vNicsDetails = responseDict['vnics']['vnic']
-            else:
-                raise Exception("Failed to get edge gateway {} vnic details".format(edgeGatewayID))
+            vNicsDetails = self.getEdgeGatewayVnicDetails(edgeGatewayID)
+            # Networks of the connected vnics are computed once and reused for every static route
+            vnicNetworks = [
+                (vnicData, ipaddress.ip_network('{}/{}'.format(
+                    vnicData['addressGroups']['addressGroup']['primaryAddress'],
+                    vnicData['addressGroups']['addressGroup']['subnetMask']), strict=False))
+                for vnicData in vNicsDetails
+                if "portgroupName" in vnicData and vnicData['addressGroups']['addressGroup'].get('subnetMask')
+            ]
+            vnicsByIndex = {vnicData['index']: vnicData for vnicData in vNicsDetails}
+            t1Connected = self.rollback.apiData.get('isT1Connected', {}).get(edgeGatewayName, {})
             internalStaticRoutes = list()
             externalStaticRoutes = list()
             staticRouteMetadataList = list()
@@ -4203,13 +4280,9 @@ class VCDMigrationValidation:
                 vnic = staticRoute.get('vnic')
                 if not vnic:
                     # When static route interface is set to none i.e vnic is none
-                    for vnicData in vNicsDetails:
-                        if "portgroupName" not in vnicData.keys():
-                            continue
-                        primaryAddress = vnicData['addressGroups']['addressGroup']['primaryAddress']
-                        subnetMask = vnicData['addressGroups']['addressGroup']['subnetMask']
-                        if subnetMask and ipaddress.ip_address(nextHopIp) in ipaddress.ip_network(
-                            '{}/{}'.format(primaryAddress, subnetMask), strict=False):
+                    nextHopAddress = ipaddress.ip_address(nextHopIp)
+                    for vnicData, vnicNetwork in vnicNetworks:
+                        if nextHopAddress in vnicNetwork:
                             # Checking next hop IP in internal Org VDC network
                             if vnicData["type"] == "internal":
                                 staticRoute['interface'] = None
@@ -4217,7 +4290,7 @@ class VCDMigrationValidation:
                                 staticRouteMetadataList.append({"network": staticRoute["network"], "nextHop": staticRoute["nextHop"]})
                             # Checking next hop IP in external network
                             if vnicData["type"] == "uplink":
-                                if vnicData["portgroupName"] in self.rollback.apiData.get('isT1Connected', {}).get(edgeGatewayName, {}):
+                                if vnicData["portgroupName"] in t1Connected:
                                     staticRoute['interface'] = None
                                     internalStaticRoutes.append(staticRoute)
                                     staticRouteMetadataList.append({"network": staticRoute["network"], "nextHop": staticRoute["nextHop"], "interface": staticRoute["interface"]})
@@ -4225,22 +4298,24 @@ class VCDMigrationValidation:
                                     externalStaticRoutes.append(staticRoute)
                 else:
                     # When static route interface is set as external/orgVDC network
-                    for vnicData in vNicsDetails:
-                        # Checking whether edge gateway interface is internal
-                        if vnicData["index"] == vnic and vnicData["type"] == "internal":
-                            # Checking whether the static route is auto plumbed or DLR is used as interface
-                            if "portgroupName" in vnicData.keys() and "DLR_to_EDGE" not in vnicData['portgroupName']:
-                                staticRoute['interface'] = vnicData["portgroupName"]
-                                internalStaticRoutes.append(staticRoute)
-                                staticRouteMetadataList.append({"network": staticRoute["network"], "nextHop": staticRoute["nextHop"], "interface": staticRoute["interface"]})
-                        # Checking whether the edge gateway interface is external
-                        if vnicData["index"] == vnic and vnicData["type"] == "uplink":
-                            if vnicData["portgroupName"] in self.rollback.apiData.get('isT1Connected', {}).get(edgeGatewayName, {}):
-                                staticRoute['interface'] = vnicData["portgroupName"]
-                                internalStaticRoutes.append(staticRoute)
-                                staticRouteMetadataList.append({"network": staticRoute["network"], "nextHop": staticRoute["nextHop"], "interface": staticRoute["interface"]})
-                            else:
-                                externalStaticRoutes.append(staticRoute)
+                    vnicData = vnicsByIndex.get(vnic)
+                    if not vnicData:
+                        continue
+                    # Checking whether edge gateway interface is internal
+                    if vnicData["type"] == "internal":
+                        # Checking whether the static route is auto plumbed or DLR is used as interface
+                        if "portgroupName" in vnicData.keys() and "DLR_to_EDGE" not in vnicData['portgroupName']:
+                            staticRoute['interface'] = vnicData["portgroupName"]
+                            internalStaticRoutes.append(staticRoute)
+                            staticRouteMetadataList.append({"network": staticRoute["network"], "nextHop": staticRoute["nextHop"], "interface": staticRoute["interface"]})
+                    # Checking whether the edge gateway interface is external
+                    if vnicData["type"] == "uplink":
+                        if vnicData["portgroupName"] in t1Connected:
+                            staticRoute['interface'] = vnicData["portgroupName"]
+                            internalStaticRoutes.append(staticRoute)
+                            staticRouteMetadataList.append({"network": staticRoute["network"], "nextHop": staticRoute["nextHop"], "interface": staticRoute["interface"]})
+                        else:
+                            externalStaticRoutes.append(staticRoute)
             logger.debug("Internal Static Routes - {}".format(internalStaticRoutes))
             logger.debug("External Static Routes - {}".format(externalStaticRoutes))
 
@@ -4260,8 +4335,11 @@ class VCDMigrationValidation:
     def getEdgeGatewayVnicDetails(self, edgeGatewayId):
         """
         Description :   Gets the vnic details of the Edge Gateway
+                        Details are cached per edge gateway till clearEdgeGatewayVnicCache is called
         Parameters  :   edgeGatewayId   -   Id of the Edge Gateway  (STRING)
         """
+        if edgeGatewayId in self._edgeGatewayVnicDetails:
+            return self._edgeGatewayVnicDetails[edgeGatewayId]
         # url to retrieve the routing config info
         url = "{}{}/{}{}".format(vcdConstants.XML_VCD_NSX_API.format(self.ipAddress),
                                  vcdConstants.NETWORK_EDGES,
@@ -4269,12 +4347,57 @@ class VCDMigrationValidation:
         # get api call to retrieve the edge gateway config info
         response = self.restClientObj.get(url, self.headers)
         if response.status_code == requests.codes.ok:
-            responseDict = self.vcdUtils.parseXml(response.content)
-            vNicsDetails = responseDict['vnics']['vnic']
+            vNicsDetails = self._parseEdgeGatewayVnics(response.content)
+            self._edgeGatewayVnicDetails[edgeGatewayId] = vNicsDetails
             return vNicsDetails
         else:
             raise Exception("Failed to get edge gateway {} vnic details".format(edgeGatewayId))
 
+    @staticmethod
+    def _xmlElementToDict(element):
+        """
+        Description :   Converts XML element to dict in the same shape as parseXml i.e. repeated tags become list
+        Parameters  :   element -   XML element to be converted (ELEMENT)
+        """
+        children = list(element)
+        if not children:
+            return (element.text or '').strip() or None
+        elementDict = dict()
+        repeatedTags = set()
+        for child in children:
+            tag = xmlLocalName(child.tag)
+            value = VCDMigrationValidation._xmlElementToDict(child)
+            if tag not in elementDict:
+                elementDict[tag] = value
+            elif tag in repeatedTags:
+                elementDict[tag].append(value)
+            else:
+                elementDict[tag] = [elementDict[tag], value]
+                repeatedTags.add(tag)
+        return elementDict
+
+    @staticmethod
+    def _parseEdgeGatewayVnics(content):
+        """
+        Description :   Parses vnics XML response of edge gateway by streaming over vnic elements
+                        Each vnic subtree is released once converted so that whole document is not kept in memory
+        Parameters  :   content -   XML content of vnics API response (BYTES)
+        Returns     :   List of vnic details (LIST)
+        """
+        vNicsDetails = list()
+        for _, element in ElementTree.iterparse(io.BytesIO(content), events=('end',)):
+            if xmlLocalName(element.tag) == 'vnic':
+                vNicsDetails.append(VCDMigrationValidation._xmlElementToDict(element))
+                element.clear()
+        return vNicsDetails
+
+    def clearEdgeGatewayVnicCache(self):
+        """
+        Description :   Clears the cached vnic details of source edge gateways
+                        Needs to be called whenever networks are connected/disconnected on source edge gateways
+        """
+        self._edgeGatewayVnicDetails.clear()
+
     @isSessionExpired
     def getEdgeGatewayRoutingConfig(self, edgeGatewayId, edgeGatewayName, validation=True, precheck=False):
         """
@@ -4304,7 +4427,7 @@ class VCDMigrationValidation:
                         networkList = [route["network"] for route in staticRoutes]
                         if len(set(networkList)) < len(networkList):
                             logger.warning("Multiple static routes to same network are present on edge gateway - {}.".format(edgeGatewayName))
-                        if float(self.version) < float(vcdConstants.API_VERSION_BETELGEUSE_10_4):
+                        if self.versionNumber < BETELGEUSE_10_4_VERSION:
                             routeType = ''
                             staticRoutesList = self.staticRouteCheck(edgeGatewayId, edgeGatewayName, staticRoutes, routeType=routeType)
                         else:
@@ -4368,18 +4491,25 @@ class VCDMigrationValidation:
 
         errorList = list()
         nsxvCertificateStore = None
+        caCertificates = listify(responseDict['global'].get('caCertificates', {}).get('caCertificate'))
+        # NAT rules of edge gateway do not depend on site, so fetching them once only if policy based site exists
+        natRulesPresent = None
         for site in listify(responseDict['sites']['sites']):
             if site['ipsecSessionType'] == "policybasedsession":
-                natErrorList, natRulesPresent, _ = self.getEdgeGatewayNatConfig(edgeGatewayId)
+                if natRulesPresent is None:
+                    _, natRulesPresent, _ = self.getEdgeGatewayNatConfig(edgeGatewayId)
                 localSubnets = site.get('localSubnets')
+                localNetworks = [
+                    (subnet, ipaddress.ip_network(subnet, strict=False)) for subnet in localSubnets.get('subnets')]
                 for natrule in natRulesPresent:
                     if natrule['action'] == 'dnat' and natrule['ruleType'] == 'user':
-                        for subnet in localSubnets.get('subnets'):
-                            if "-" in natrule['translatedAddress']:
-                                translatedAddress = natrule['translatedAddress'].split("-")[0]
-                            else:
-                                translatedAddress = natrule['translatedAddress'].split('/')[0]
-                            if ipaddress.ip_address(translatedAddress) in ipaddress.ip_network(subnet, strict=False):
+                        if "-" in natrule['translatedAddress']:
+                            translatedAddress = natrule['translatedAddress'].split("-")[0]
+                        else:
+                            translatedAddress = natrule['translatedAddress'].split('/')[0]
+                        translatedIp = ipaddress.ip_address(translatedAddress)
+                        for subnet, localNetwork in localNetworks:
+                            if translatedIp in localNetwork:
                                 if not v2tAssessmentMode:
                                     logger.warning('The tier-1 gateway has policy based IPsec VPN configured with local subnet {} that overlaps DNAT rule with translated IP {} . This configuration is supported only with NSX-T 4.0 or later.\n'.format(
                                         subnet,natrule['translatedAddress']))
@@ -4397,7 +4527,7 @@ class VCDMigrationValidation:
                     site['encryptionAlgorithm']))
 
             if site['authenticationMode'] == 'x.509' and not v2tAssessmentMode:
-                if float(self.version) < float(vcdConstants.API_VERSION_ANDROMEDA_10_3_1):
+                if self.versionNumber < ANDROMEDA_10_3_1_VERSION:
                     errorList.append('Authentication mode as Certificate is not supported in target edge gateway\n')
 
                 elif not nsxvObj.ipAddress and not nsxvObj.username:
@@ -4414,9 +4544,13 @@ class VCDMigrationValidation:
                         nsxvCertificateStore = nsxvObj.getNsxvCertificateStore()
                     # Identify CA certificate for service certificate
                     certObjectId = site['certificate']
-                    for caObjectId in listify(responseDict['global'].get('caCertificates', {}).get('caCertificate')):
-                        if verifyCertificateAgainstCa(
-                                nsxvCertificateStore.get(certObjectId), nsxvCertificateStore.get(caObjectId)):
+                    siteCertificate = nsxvCertificateStore.get(certObjectId)
+                    for caObjectId in caCertificates:
+                        # Verification result is reused for sites sharing the same service certificate
+                        if (certObjectId, caObjectId) not in self._certificateCaVerification:
+                            self._certificateCaVerification[(certObjectId, caObjectId)] = verifyCertificateAgainstCa(
+                                siteCertificate, nsxvCertificateStore.get(caObjectId))
+                        if self._certificateCaVerification[(certObjectId, caObjectId)]:
                             site['caCertificate'] = caObjectId
                             break
                     else:
@@ -4427,6 +4561,20 @@ class VCDMigrationValidation:
         logger.debug("IPSEC configuration of Source Edge Gateway retrieved successfully")
         return errorList
 
+    def getSourceEdgeGatewayById(self, edgeGatewayId):
+        """
+        Description :   Gets the source edge gateway details saved in apiData using its id
+                        Index is rebuilt whenever the source edge gateway list in apiData changes
+        Parameters  :   edgeGatewayId   -   Id of the Edge Gateway  (STRING)
+        Returns     :   Details of source edge gateway (DICT)
+        """
+        sourceEdgeGateways = self.rollback.apiData['sourceEdgeGateway']
+        indexedEdgeGateways, sourceEdgeGatewaysById = self._sourceEdgeGatewayIndex
+        if indexedEdgeGateways is not sourceEdgeGateways or len(sourceEdgeGatewaysById) != len(sourceEdgeGateways):
+            sourceEdgeGatewaysById = {edgeGateway['id']: edgeGateway for edgeGateway in sourceEdgeGateways}
+            self._sourceEdgeGatewayIndex = (sourceEdgeGateways, sourceEdgeGatewaysById)
+        return sourceEdgeGatewaysById[urn_id(edgeGatewayId, 'gateway')]
+
     @isSessionExpired
     def getEdgegatewayBGPconfig(self, edgeGatewayId, validation=True, nsxtObj=None, v2tAssessmentMode=False):
         """
@@ -4451,9 +4599,7 @@ class VCDMigrationValidation:
 
             # Get external network details mapped to edgeGateway
             targetExternalNetwork = self.getExternalNetworkMappedToEdgeGateway(edgeGatewayId)
-            sourceEdgeGatewayName = list(
-                filter(lambda edgeGatewayData: edgeGatewayData['id'] == "urn:vcloud:gateway:{}".format(edgeGatewayId),
-                       self.rollback.apiData['sourceEdgeGateway']))[0]['name']
+            sourceEdgeGatewayName = self.getSourceEdgeGatewayById(edgeGatewayId)['name']
             if not targetExternalNetwork:
                 raise Exception(
                     "Failed to get target ExternalNetwork details mapped to SourceEdgeGateway - {}.".format(
@@ -4473,7 +4619,7 @@ class VCDMigrationValidation:
                         return responseDict['bgp']
                     # validate vrf lite  only if source bgp is enabled
                     if responseDict['bgp']['enabled'] != 'false':
-                        if not v2tAssessmentMode and float(self.version) >= float(vcdConstants.API_VERSION_ZEUS):
+                        if not v2tAssessmentMode and self.versionNumber >= ZEUS_VERSION:
                             # get the target external network backed Tier-0 gateway
                             targetExternalBackingTypeValue = targetExternalNetwork['networkBackings']['values'][0]['backingTypeValue']
                             # validate only if backing type is VRF
@@ -4509,11 +4655,16 @@ class VCDMigrationValidation:
             raise
 
     @isSessionExpired
-    def _checkTaskStatus(self, taskUrl, returnOutput=False, timeoutForTask=vcdConstants.VCD_CREATION_TIMEOUT, entityName=''):
+    def _checkTaskStatus(self, taskUrl, returnOutput=False, timeoutForTask=vcdConstants.VCD_CREATION_TIMEOUT, entityName='',
+                         initialWait=vcdConstants.VCD_TASK_POLL_INITIAL_INTERVAL,
+                         maxWait=vcdConstants.VCD_TASK_POLL_MAX_INTERVAL, backoff=vcdConstants.VCD_TASK_POLL_BACKOFF):
         """
         Description : Checks status of a task in VDC
         Parameters  : taskUrl   - Url of the task monitored (STRING)
                       timeOutForTask - Timeout value to check the task status (INT)
+                      initialWait - Interval before first re-check of the task status in seconds (FLOAT)
+                      maxWait - Maximum interval between two checks of the task status in seconds (FLOAT)
+                      backoff - Factor by which interval between two checks grows (FLOAT)
         """
         if self.headers.get("Content-Type", None):
             del self.headers['Content-Type']
@@ -4521,14 +4672,25 @@ class VCDMigrationValidation:
         if entityName:
             entityName = f" for {entityName}"
 
-        timeout = 0.0
+        headers = {'Authorization': self.headers['Authorization'],
+                   'Accept': vcdConstants.GENERAL_JSON_ACCEPT_HEADER}
+        startTime = time.monotonic()
+        delay = initialWait
+        # Ask vcd to hold the request till task changes its state, fall back to client side polling if not supported
+        longPollUrl = "{}{}timeout={}".format(
+            taskUrl, '&' if '?' in taskUrl else '?', vcdConstants.VCD_TASK_LONG_POLL_WAIT)
         # Get the task details
         output = ''
         try:
-            while timeout < timeoutForTask:
-                headers = {'Authorization': self.headers['Authorization'],
-                           'Accept': vcdConstants.GENERAL_JSON_ACCEPT_HEADER}
-                response = self.restClientObj.get(url=taskUrl, headers=headers)
+            while time.monotonic() - startTime < timeoutForTask:
+                # token changes if session is re-created by other thread while waiting for the task
+                headers['Authorization'] = self.headers['Authorization']
+                requestTime = time.monotonic()
+                response = self.restClientObj.get(url=longPollUrl or taskUrl, headers=headers)
+                if longPollUrl and response.status_code == requests.codes.bad_request:
+                    logger.debug("Long polling of task status is not supported, polling task status periodically")
+                    longPollUrl = None
+                    continue
                 if response.status_code == requests.codes.ok:
                     responseDict = response.json()
                     logger.debug("Checking status for task : {}{}".format(responseDict["operationName"], entityName))
@@ -4548,19 +4710,27 @@ class VCDMigrationValidation:
                         raise Exception(responseDict['details'])
                     msg = "Task {}{} is in running state".format(responseDict["operationName"], entityName)
                     logger.debug(msg)
-                time.sleep(vcdConstants.VCD_CREATION_INTERVAL)
-                timeout += vcdConstants.VCD_CREATION_INTERVAL
+                    # vcd held the request for the whole wait, so task status can be requested again right away
+                    if longPollUrl and time.monotonic() - requestTime >= vcdConstants.VCD_TASK_LONG_POLL_WAIT:
+                        continue
+                time.sleep(delay)
+                delay = min(maxWait, delay * backoff)
             raise Exception('Task {}{} could not complete in the allocated time.'.format(
                 responseDict["operationName"], entityName))
         except:
             raise
 
     @isSessionExpired
-    def _checkJobStatus(self, taskUrl, timeoutForTask=vcdConstants.VCD_CREATION_TIMEOUT, entityName=''):
+    def _checkJobStatus(self, taskUrl, timeoutForTask=vcdConstants.VCD_CREATION_TIMEOUT, entityName='',
+                        initialWait=vcdConstants.VCD_TASK_POLL_INITIAL_INTERVAL,
+                        maxWait=vcdConstants.VCD_TASK_POLL_MAX_INTERVAL, backoff=vcdConstants.VCD_TASK_POLL_BACKOFF):
         """
         Description : Checks status of a task in VDC
         Parameters  : taskUrl   - Url of the task monitored (STRING)
                       timeOutForTask - Timeout value to check the task status (INT)
+                      initialWait - Interval before first re-check of the task status in seconds (FLOAT)
+                      maxWait - Maximum interval between two checks of the task status in seconds (FLOAT)
+                      backoff - Factor by which interval between two checks grows (FLOAT)
         """
         taskUrl = "{}{}".format("https://{}".format(self.ipAddress), taskUrl)
 
@@ -4570,12 +4740,15 @@ class VCDMigrationValidation:
         if entityName:
             entityName = f" for {entityName}"
 
-        timeout = 0.0
+        headers = {'Authorization': self.headers['Authorization'],
+                   'Accept': vcdConstants.GENERAL_JSON_ACCEPT_HEADER}
+        startTime = time.monotonic()
+        delay = initialWait
 
         try:
-            while timeout < timeoutForTask:
-                headers = {'Authorization': self.headers['Authorization'],
-                           'Accept': vcdConstants.GENERAL_JSON_ACCEPT_HEADER}
+            while time.monotonic() - startTime < timeoutForTask:
+                # token changes if session is re-created by other thread while waiting for the job
+                headers['Authorization'] = self.headers['Authorization']
                 response = self.restClientObj.get(url=taskUrl, headers=headers)
                 if response.status_code == requests.codes.ok:
                     responseDict = response.json()
@@ -4590,47 +4763,77 @@ class VCDMigrationValidation:
                         raise Exception(responseDict['details'])
                     msg = "Task {}{} is in running state".format(responseDict["message"], entityName)
                     logger.debug(msg)
-                time.sleep(vcdConstants.VCD_CREATION_INTERVAL)
-                timeout += vcdConstants.VCD_CREATION_INTERVAL
+                time.sleep(delay)
+                delay = min(maxWait, delay * backoff)
             raise Exception('Task {}{} could not complete in the allocated time.'.format(
                 responseDict["message"], entityName))
         except:
             raise
 
+    def _getPagesInParallel(self, getPage, pageSize, numberOfThreads, totalKey, valuesKey, entityName):
+        """
+        Description :   Gets results of all the pages, pages after the first one are retrieved in parallel once
+                        total result count is known
+                        Retrieval is retried if total result count changes while the pages are retrieved
+        Parameters  :   getPage - method retrieving a single page, page number is passed as its argument (METHOD)
+                        pageSize - number of results in a page (INT)
+                        numberOfThreads - maximum number of threads retrieving the pages (INT)
+                        totalKey - key of total result count in page (STRING)
+                        valuesKey - key of results in page (STRING)
+                        entityName - name of the retrieved entities used in messages (STRING)
+        Returns     :   Results of all the pages in order of page numbers (LIST)
+        """
+        for _ in range(3):
+            responseDict = getPage(1)
+            resultTotal = responseDict[totalKey]
+            resultList = listify(responseDict.get(valuesKey))
+            numberOfPages = math.ceil(resultTotal / pageSize)
+            if numberOfPages <= 1:
+                return resultList
+            # separate thread object is used as pages are also retrieved from worker threads of thread object
+            threadObj = Thread(maxNumberOfThreads=numberOfThreads)
+            for pageNo in range(2, numberOfPages + 1):
+                threadObj.spawnThread(getPage, pageNo, saveOutputKey=pageNo,
+                                      threadName=threading.current_thread().name)
+            # halt the current thread till all the pages are retrieved
+            threadObj.joinThreads()
+            if threadObj.stop():
+                raise Exception('Failed to get {}'.format(entityName))
+            pages = [threadObj.returnValues[pageNo] for pageNo in range(2, numberOfPages + 1)]
+            for page in pages:
+                resultList.extend(listify(page.get(valuesKey)))
+            if all(page[totalKey] == resultTotal for page in pages):
+                return resultList
+            logger.debug('{} changed while retrieving them, retrieving again'.format(entityName))
+        raise Exception('Failed to get {} as they kept changing while retrieving them'.format(entityName))
+
+    def _getOrgVDCComputePoliciesPage(self, pageNo):
+        """
+        Description :   Gets a single page of VDC Compute Policies
+        Parameters  :   pageNo  -   number of the page to be retrieved (INT)
+        Returns     :   Response of the compute policies page (DICT)
+        """
+        url = "{}{}?page={}&pageSize={}&sortAsc=name".format(vcdConstants.OPEN_API_URL.format(self.ipAddress),
+                                                             vcdConstants.VDC_COMPUTE_POLICIES, pageNo,
+                                                             vcdConstants.ORG_VDC_COMPUTE_POLICY_PAGE_SIZE)
+        response = self.restClientObj.get(url, self.headers)
+        if response.status_code != requests.codes.ok:
+            raise Exception('Failed to get Org VDC Compute Policies page {} with error code {}'.format(
+                pageNo, response.status_code))
+        return response.json()
+
     def getOrgVDCComputePolicies(self):
         """
         Description :   Gets VDC Compute Policies
+                        Pages after the first one are retrieved in parallel once total result count is known
         """
         try:
-            logger.debug("Getting Org VDC Compute Policies Details")
-            # url to retrieve org vdc compute policies
-            url = "{}{}".format(vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                                vcdConstants.VDC_COMPUTE_POLICIES)
-            # get api call to retrieve org vdc compute policies
-            response = self.restClientObj.get(url, self.headers)
-            if response.status_code == requests.codes.ok:
-                logger.debug("Retrieved Org VDC Compute Policies details successfully")
-                # returning the list of org vdc compute policies
-                responseDict = response.json()
-                # return responseDict['values']
-                resultTotal = responseDict['resultTotal']
-            pageNo = 1
-            pageSizeCount = 0
-            resultList = []
             logger.debug('Getting Org VDC Compute Policies')
-            while resultTotal > 0 and pageSizeCount < resultTotal:
-                url = "{}{}?page={}&pageSize={}&sortAsc=name".format(vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                                                        vcdConstants.VDC_COMPUTE_POLICIES, pageNo,
-                                                        vcdConstants.ORG_VDC_COMPUTE_POLICY_PAGE_SIZE)
-                getSession(self)
-                response = self.restClientObj.get(url, self.headers)
-                if response.status_code == requests.codes.ok:
-                    responseDict = response.json()
-                    resultList.extend(responseDict['values'])
-                    pageSizeCount += len(responseDict['values'])
-                    logger.debug('Org VDC Compute Policies result pageSize = {}'.format(pageSizeCount))
-                    pageNo += 1
-                    resultTotal = responseDict['resultTotal']
+            getSession(self)
+            resultList = self._getPagesInParallel(
+                self._getOrgVDCComputePoliciesPage, vcdConstants.ORG_VDC_COMPUTE_POLICY_PAGE_SIZE,
+                vcdConstants.ORG_VDC_COMPUTE_POLICY_PAGE_FETCH_WORKERS, 'resultTotal', 'values',
+                'Org VDC Compute Policies')
             logger.debug('Total Org VDC Compute Policies result count = {}'.format(len(resultList)))
             logger.debug('All Org VDC Compute Policies successfully retrieved')
             return resultList
@@ -4647,7 +4850,7 @@ class VCDMigrationValidation:
             data = self.rollback.apiData
             # enabling the source org vdc only if it was previously enabled, else not
             if data['sourceOrgVDC']['IsEnabled'] == "true":
-                logging.info("RollBack: Enabling Source Org-Vdc")
+                logger.info("RollBack: Enabling Source Org-Vdc")
                 sourceOrgVdcId = sourceOrgVdcId.split(':')[-1]
                 # url to enable source org vdc
                 url = "{}{}".format(vcdConstants.XML_ADMIN_API_URL.format(self.ipAddress),
@@ -4665,36 +4868,167 @@ class VCDMigrationValidation:
             raise
 
     @isSessionExpired
+    def _validateVappsInParallel(self, validator, vAppList, errorMessage, *args):
+        """
+        Description :   Runs vApp validator for every vApp on the worker threads of thread object
+                        Thread object spawns at most its configured number of threads irrespective of number of vApps
+        Parameters  :   validator - method validating single vApp, vApp is passed as its first argument (METHOD)
+                        vAppList - list of vApps to be validated (LIST)
+                        errorMessage - message of exception raised if validation of any vApp fails (STRING)
+                        args - additional arguments of validator
+        Returns     :   Values returned by validator keyed by vApp name (DICT)
+        """
+        for vApp in vAppList:
+            self.thread.spawnThread(validator, vApp, *args, saveOutputKey=vApp['@name'])
+        # halt the main thread till all the threads complete execution
+        self.thread.joinThreads()
+        if self.thread.stop():
+            raise Exception(errorMessage)
+        return dict(self.thread.returnValues)
+
+    def _getVappDetails(self, vApp):
+        """
+        Description :   Gets the details of vApp, details are retrieved once and shared by vApp validations
+                        Details from earlier validation are revalidated using ETag of vApp instead of fetching them again
+        Parameters  :   vApp - data related to a vApp (DICT)
+        Returns     :   Details of vApp (DICT)
+        """
+        vAppHref = vApp['@href']
+        vAppData = self._vAppDetails.get(vAppHref)
+        if vAppData is None:
+            headers = self.headers
+            etag, cachedVappData = self._vAppDetailsByEtag.get(vAppHref, (None, None))
+            if etag:
+                headers = dict(self.headers, **{'If-None-Match': etag})
+            # vApp XML is parsed while it is being received instead of holding whole response in memory
+            response = self.restClientObj.get(vAppHref, headers, stream=True)
+            try:
+                if etag and response.status_code == requests.codes.not_modified:
+                    vAppData = cachedVappData
+                elif response.status_code == requests.codes.ok:
+                    response.raw.decode_content = True
+                    vAppData = self._parseVappDetails(response.raw)
+                    if response.headers.get('ETag'):
+                        self._vAppDetailsByEtag[vAppHref] = (response.headers['ETag'], vAppData)
+                else:
+                    # only message attribute of Error root element is needed, so it is read without building a dict
+                    raise Exception("Failed to get vapp {} details due to {}".format(
+                        vApp['@name'], ElementTree.fromstring(response.content).get('message')))
+            finally:
+                response.close()
+            self._vAppDetails[vAppHref] = vAppData
+        return vAppData
+
+    @staticmethod
+    def _parseXmlElement(element):
+        """
+        Description :   Parses XML element to dict using parseXml so that it has the same shape as in parsed document
+        Parameters  :   element -   XML element to be parsed (ELEMENT)
+        Returns     :   Parsed element (DICT)
+        """
+        tag = xmlLocalName(element.tag)
+        elementDict = Utilities.parseXml(ElementTree.tostring(element))[tag]
+        # namespaces are declared on this element once it is serialized separately from its document
+        elementDict.pop('@xmlns', None)
+        return elementDict
+
+    @staticmethod
+    def _parseVappDetails(xmlStream):
+        """
+        Description :   Parses vApp XML response keeping only the details read by vApp validations i.e. vApp
+                        attributes, InMaintenanceMode, NetworkConfigSection and name, status, StorageProfile and
+                        VmSpecSection of VMs
+                        VM subtrees are released as soon as they are parsed as they form bulk of the document
+        Parameters  :   xmlStream -   file like object of XML content of vApp API response (OBJECT)
+        Returns     :   Details of vApp in the same shape as parseXml (DICT)
+        """
+        vAppData = dict()
+        vmList = list()
+        depth = 0
+        for event, element in ElementTree.iterparse(xmlStream, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    vAppData.update({
+                        '@{}'.format(xmlLocalName(attribute)): value
+                        for attribute, value in element.attrib.items()})
+                continue
+
+            depth -= 1
+            tag = xmlLocalName(element.tag)
+            # VApp/Children/Vm
+            if depth == 2 and tag == 'Vm':
+                vm = {'@name': element.get('name'), '@status': element.get('status')}
+                for child in element:
+                    childTag = xmlLocalName(child.tag)
+                    if childTag == 'StorageProfile':
+                        vm[childTag] = {
+                            '@{}'.format(xmlLocalName(attribute)): value
+                            for attribute, value in child.attrib.items()}
+                    elif childTag == 'VmSpecSection':
+                        vm[childTag] = VCDMigrationValidation._parseXmlElement(child)
+                vmList.append(vm)
+                element.clear()
+            # Direct children of VApp
+            elif depth == 1:
+                if tag == 'InMaintenanceMode':
+                    vAppData[tag] = element.text
+                elif tag == 'NetworkConfigSection':
+                    vAppData[tag] = VCDMigrationValidation._parseXmlElement(element)
+                element.clear()
+
+        if vmList:
+            vAppData['Children'] = {'Vm': vmList}
+        return vAppData
+
+    def clearVappDetailsCache(self, orgVDCId=None):
+        """
+        Description :   Clears the cached vApps list and details of vApps
+                        Needs to be called before validating vApps which might have changed since last validation
+        Parameters  :   orgVDCId - Id of the Org VDC whose vApps are validated next (STRING)
+        """
+        orgVDCId = orgVDCId.split(':')[-1] if orgVDCId else None
+        self._vAppsListByOrgVdc.clear()
+        self._vAppDetails.clear()
+        # details to be revalidated are kept only while vApps of the same org VDC are validated again
+        if orgVDCId != self._vAppCacheOrgVdcId:
+            self._vAppDetailsByEtag.clear()
+        self._vAppCacheOrgVdcId = orgVDCId
+
+    def _getVappsListForValidation(self, orgVDCId):
+        """
+        Description :   Gets the list of vApps in the Org VDC, list is retrieved once and shared by vApp validations
+        Parameters  :   orgVDCId - Id of the Org VDC (STRING)
+        Returns     :   Returns vapps list (LIST)
+        """
+        orgVDCId = orgVDCId.split(':')[-1]
+        # same object validates multiple org VDCs in assessment modes, details of vApps of previous org VDC are not
+        # kept in memory or reused for this one
+        if orgVDCId != self._vAppCacheOrgVdcId:
+            self.clearVappDetailsCache(orgVDCId)
+        if orgVDCId not in self._vAppsListByOrgVdc:
+            self._vAppsListByOrgVdc[orgVDCId] = self.getOrgVDCvAppsList(orgVDCId)
+        return self._vAppsListByOrgVdc[orgVDCId]
+
     def _checkSuspendedVMsInVapp(self, vApp):
         """
         Description :   Send get request for vApp and check for suspended VM in response
         Parameters  :   vApp - data related to a vApp (DICT)
         """
-        vAppResponse = self.restClientObj.get(vApp['@href'], self.headers)
-        responseDict = self.vcdUtils.parseXml(vAppResponse.content)
-        if not vAppResponse.status_code == requests.codes.ok:
-            raise Exception("Failed to get vapp details to validate suspended VM "
-                            "due to {}".format(responseDict['Error']['@message']))
-            # checking if the vapp has vms present in it
-        if not responseDict['VApp'].get('Children'):
+        vAppData = self._getVappDetails(vApp)
+        # checking if the vapp has vms present in it
+        if not vAppData.get('Children'):
             logger.debug('Source vApp {} has no VM present in it.'.format(vApp['@name']))
             return
         # retrieving vms of the vapp
-        vmList = responseDict['VApp']['Children']['Vm'] if isinstance(responseDict['VApp']['Children']['Vm'],
-                                                                      list) else [
-            responseDict['VApp']['Children']['Vm']]
-        vApp_state = [
-            code for state, code in vcdConstants.VAPP_STATUS.items()
-            if state in ['FAILED_CREATION', 'UNRESOLVED', 'POWERED_ON', 'UNRECOGNIZED', 'POWERED_OFF',
-                         'INCONSISTENT_STATE']
-        ]
+        vmList = listify(vAppData['Children']['Vm'])
         # iterating over the vms in the vapp
         for vm in vmList:
-            if vm["@status"] not in vApp_state:
+            if vm["@status"] not in vcdConstants.VM_SUPPORTED_STATUS:
                 self.unsupportedVAppList.append(vm['@name'])
 
-        if responseDict['VApp'].get('InMaintenanceMode') == 'true':
-            self.unsupportedVAppList.append(responseDict['VApp']['@name'])
+        if vAppData.get('InMaintenanceMode') == 'true':
+            self.unsupportedVAppList.append(vAppData['@name'])
 
     def validateSourceSuspendedVMsInVapp(self, sourceOrgVDCId):
         """
@@ -4703,16 +5037,13 @@ class VCDMigrationValidation:
         """
         try:
             self.unsupportedVAppList = list()
-            sourceVappsList = self.getOrgVDCvAppsList(sourceOrgVDCId)
+            sourceVappsList = self._getVappsListForValidation(sourceOrgVDCId)
             if not sourceVappsList:
                 return
 
-            # iterating over the source vapps
-            for vApp in sourceVappsList:
-                self.thread.spawnThread(self._checkSuspendedVMsInVapp, vApp)
-            self.thread.joinThreads()
-            if self.thread.stop():
-                raise Exception("Failed to validate vapp for suspended VM. Check log file for errors")
+            self._validateVappsInParallel(
+                self._checkSuspendedVMsInVapp, sourceVappsList,
+                "Failed to validate vapp for suspended VM. Check log file for errors")
             if self.unsupportedVAppList:
                 raise ValidationError(
                     "VApp/VMs: {} are in state like (suspended, partially suspended, maintenance mode) which are not supported by migration".format(
@@ -4728,13 +5059,7 @@ class VCDMigrationValidation:
         Parameters  :   vApp - data related to a vApp (DICT)
         """
         # TODO pranshu: remove use of migration=False argument.
-        # get api call to retrieve the vapp details
-        response = self.restClientObj.get(vApp['@href'], self.headers)
-        responseDict = self.vcdUtils.parseXml(response.content)
-        if not response.status_code == requests.codes.ok:
-            raise Exception("Failed to get vapp {} details for own network due "
-                            "to {}".format(vApp['@name'], responseDict['Error']['@message']))
-        vAppData = responseDict['VApp']
+        vAppData = self._getVappDetails(vApp)
         # checking if the networkConfig is present in vapp's NetworkConfigSection
         if vAppData['NetworkConfigSection'].get('NetworkConfig'):
             vAppNetworkList = listify(vAppData['NetworkConfigSection']['NetworkConfig'])
@@ -4746,70 +5071,140 @@ class VCDMigrationValidation:
             if routedVappNetworks:
                 self.vAppNetworkDict[vApp['@name']] = routedVappNetworks
 
-    def _checkOverlayBackedNetwork(self, nsxtObj, parentNetwork):
-        externalNetworkName = f"{parentNetwork['parentNetworkId']['name']}-v2t"
-        response = self.restClientObj.get(
-            url="{}{}?filter=(name=={})".format(
-                vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                vcdConstants.ALL_EXTERNAL_NETWORKS,
-                externalNetworkName,
-            ),
-            headers=self.headers,
-        )
-        externalNetwork = response.json()
-        if not response.status_code == requests.codes.ok:
-            raise Exception(
-                f"Unable to get external network {externalNetworkName} details: {externalNetwork['message']}")
+    def clearVappNetworkCaches(self):
+        """
+        Description :   Clears the cached details of networks used by routed vApp networks
+        """
+        self._overlayBackedNetworkCheck.clear()
+        self._directNetworkCountByExternalNetwork.clear()
+        self._externalNetworksByName.clear()
+        self._parentNetworksById.clear()
+
+    def _getParentNetwork(self, vAppNetwork):
+        """
+        Description :   Gets details of parent network of vApp network
+                        Details are cached per parent network as many vApp networks share the same parent network
+        Parameters  :   vAppNetwork - details of vApp network (DICT)
+        Returns     :   Details of parent org VDC network (DICT)
+        """
+        # id is used as cache key as it is so that urn is built only when parent network is retrieved
+        parentNetworkId = vAppNetwork['Configuration']['ParentNetwork']['@id']
+        if parentNetworkId not in self._parentNetworksById:
+            response = self.restClientObj.get(
+                url="{}{}".format(
+                    vcdConstants.OPEN_API_URL.format(self.ipAddress),
+                    vcdConstants.GET_ORG_VDC_NETWORK_BY_ID.format(urn_id(parentNetworkId, _type='network'))
+                ),
+                headers=self.headers
+            )
+            parentNetwork = response.json()
+            if not response.status_code == requests.codes.ok:
+                raise Exception(
+                    f"Unable to get parent network {vAppNetwork['Configuration']['ParentNetwork']['@name']}"
+                    f" details: {parentNetwork['message']}")
+            self._parentNetworksById[parentNetworkId] = parentNetwork
+        return self._parentNetworksById[parentNetworkId]
 
-        # Result should contain single result as we are getting by name
-        if externalNetwork['resultTotal'] != 1:
+    def _getExternalNetworksByName(self, externalNetworkNames):
+        """
+        Description :   Retrieves details of external networks which are not retrieved yet using their names
+                        Names are combined in batches in a single filter to retrieve many networks per request
+        Parameters  :   externalNetworkNames - names of external networks (SET)
+        """
+        pendingNames = sorted(name for name in externalNetworkNames if name not in self._externalNetworksByName)
+        # names having reserved characters of filter are not combined with other names
+        batches = [[name] for name in pendingNames if any(char in name for char in ',;()')]
+        batchNames = [name for name in pendingNames if not any(char in name for char in ',;()')]
+        batchSize = vcdConstants.EXTERNAL_NETWORK_NAME_FILTER_BATCH_SIZE
+        batches.extend(batchNames[index:index + batchSize] for index in range(0, len(batchNames), batchSize))
+
+        for names in batches:
+            response = self.restClientObj.get(
+                url="{}{}?filter=({})&pageSize={}".format(
+                    vcdConstants.OPEN_API_URL.format(self.ipAddress),
+                    vcdConstants.ALL_EXTERNAL_NETWORKS,
+                    ','.join('name=={}'.format(name) for name in names),
+                    batchSize,
+                ),
+                headers=self.headers,
+            )
+            responseDict = response.json()
+            if not response.status_code == requests.codes.ok:
+                raise Exception(
+                    f"Unable to get external network {', '.join(names)} details: {responseDict['message']}")
+
+            # Networks absent in result do not exist
+            self._externalNetworksByName.update(dict.fromkeys(names))
+            self._externalNetworksByName.update(
+                {externalNetwork['name']: externalNetwork for externalNetwork in responseDict['values']})
+
+    def _checkOverlayBackedNetwork(self, nsxtObj, externalNetworkName):
+        """
+        Description :   Checks whether target external network of direct parent network is overlay backed
+                        Result is cached per external network as many vApps share the same parent network
+        Parameters  :   nsxtObj - NSX-T class object (OBJECT)
+                        externalNetworkName - name of target external network (STRING)
+        Returns     :   Name of external network if it is not overlay backed, 'NA' if it does not exist (STRING)
+        """
+        if externalNetworkName not in self._overlayBackedNetworkCheck:
+            self._overlayBackedNetworkCheck[externalNetworkName] = self._checkOverlayBackedExternalNetwork(
+                nsxtObj, externalNetworkName)
+        return self._overlayBackedNetworkCheck[externalNetworkName]
+
+    def _checkOverlayBackedExternalNetwork(self, nsxtObj, externalNetworkName):
+        self._getExternalNetworksByName({externalNetworkName})
+        externalNetwork = self._externalNetworksByName[externalNetworkName]
+        if not externalNetwork:
             return 'NA'
 
-        for backing in externalNetwork['values'][0]['networkBackings']['values']:
+        for backing in externalNetwork['networkBackings']['values']:
             if backing['backingTypeValue'] == 'IMPORTED_T_LOGICAL_SWITCH':
                 if not nsxtObj.isOverlayBackedSegment(backing['backingId']):
                     return externalNetworkName
 
-    def _validateRoutedVappNetworks(self, vApp, vAppValidations, nsxtObj):
-        response = self.restClientObj.get(vApp['@href'], self.headers)
-        responseDict = self.vcdUtils.parseXml(response.content)
-        if not response.status_code == requests.codes.ok:
-            raise Exception(
-                "Failed to get vapp {} details for own network due to {}".format(
-                    vApp['@name'], responseDict['Error']['@message']))
+    def _getDirectNetworkCount(self, parentNetwork):
+        """
+        Description :   Gets number of org VDC networks directly connected to external network of parent network
+                        Count is cached per external network as many vApps share the same parent network
+        Parameters  :   parentNetwork - details of parent network of vApp network (DICT)
+        Returns     :   Number of org VDC networks connected to external network (INT)
+        """
+        externalNetworkId = parentNetwork['parentNetworkId']['id']
+        if externalNetworkId not in self._directNetworkCountByExternalNetwork:
+            url = "{}{}{}".format(
+                vcdConstants.OPEN_API_URL.format(self.ipAddress),
+                vcdConstants.ALL_ORG_VDC_NETWORKS,
+                vcdConstants.QUERY_EXTERNAL_NETWORK.format(externalNetworkId))
+            response = self.restClientObj.get(url, self.headers)
+            responseDict = response.json()
+            if not response.status_code == requests.codes.ok:
+                raise Exception(
+                    f"Unable to get external network {parentNetwork['parentNetworkId']['name']} details: "
+                    f"{responseDict['message']}")
+            self._directNetworkCountByExternalNetwork[externalNetworkId] = responseDict['resultTotal']
+        return self._directNetworkCountByExternalNetwork[externalNetworkId]
 
-        vAppData = responseDict['VApp']
-        if not vAppData['NetworkConfigSection'].get('NetworkConfig'):
+    def _validateRoutedVappNetworks(self, vApp, vAppValidations, nsxtObj):
+        vAppData = self._getVappDetails(vApp)
+        routedVappNetworks = [
+            vAppNetwork
+            for vAppNetwork in listify(vAppData['NetworkConfigSection'].get('NetworkConfig'))
+            if vAppNetwork['@networkName'] != "none" and vAppNetwork['Configuration']['FenceMode'] == 'natRouted'
+        ]
+        if not routedVappNetworks:
             return
 
         vAppValidations['routerExternalIp'][vApp['@name']] = dict()
         vAppValidations['natExternalIp'][vApp['@name']] = dict()
-        for vAppNetwork in listify(vAppData['NetworkConfigSection']['NetworkConfig']):
-            if vAppNetwork['@networkName'] == "none":
-                continue
-
-            if vAppNetwork['Configuration']['FenceMode'] != 'natRouted':
-                continue
-
+        for vAppNetwork in routedVappNetworks:
             # Get parent network
-            response = self.restClientObj.get(
-                url="{}{}".format(
-                    vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                    vcdConstants.GET_ORG_VDC_NETWORK_BY_ID.format(
-                        urn_id(vAppNetwork['Configuration']['ParentNetwork']['@id'], _type='network'))
-                ),
-                headers=self.headers
-            )
-            parentNetwork = response.json()
-            if not response.status_code == requests.codes.ok:
-                raise Exception(
-                    f"Unable to get parent network {vAppNetwork['Configuration']['ParentNetwork']['@name']}"
-                    f" details: {parentNetwork['message']}")
+            parentNetwork = self._getParentNetwork(vAppNetwork)
 
             # Verify NAT rules
             natService = vAppNetwork['Configuration'].get('Features', {}).get('NatService', {})
+            natRules = listify(natService.get('NatRule'))
             if natService.get('NatType', '') == 'portForwarding':
-                for rule in listify(natService.get('NatRule')):
+                for rule in natRules:
                     rule = rule.get('VmRule')
                     if not rule:
                         continue
@@ -4821,32 +5216,19 @@ class VCDMigrationValidation:
             # target external network (-v2t suffixed) should be overlay backed
             if nsxtObj and parentNetwork['networkType'] == 'DIRECT':
                 # Verify the shared network is not dedicated
-                url = "{}{}{}".format(
-                    vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                    vcdConstants.ALL_ORG_VDC_NETWORKS,
-                    vcdConstants.QUERY_EXTERNAL_NETWORK.format(parentNetwork['parentNetworkId']['id']))
-                response = self.restClientObj.get(url, self.headers)
-                responseDict = response.json()
-                if not response.status_code == requests.codes.ok:
-                    raise Exception(
-                        f"Unable to get external network {parentNetwork['parentNetworkId']['name']} details: "
-                        f"{responseDict['message']}")
-
-                if int(responseDict['resultTotal']) > 1:
+                if int(self._getDirectNetworkCount(parentNetwork)) > 1:
                     if not parentNetwork['shared']:
                         if self.orgVdcInput.get('LegacyDirectNetwork', False):
                             # Service direct network legacy implementation
                             vAppValidations['legacyDirectNetwork'].add(f"{vApp['@name']}|{vAppNetwork['@networkName']}")
                         else:
                             # Service direct network default implementation
-                            externalNetworkName = self._checkOverlayBackedNetwork(nsxtObj, parentNetwork)
-                            if externalNetworkName:
-                                vAppValidations['vlanBackedNetworks'].add(f"{vApp['@name']}|{externalNetworkName}")
+                            vAppValidations['overlayBackingChecks'].add(
+                                (vApp['@name'], f"{parentNetwork['parentNetworkId']['name']}-v2t"))
                     else:
                         # Shared service direct network implementation
-                        externalNetworkName = self._checkOverlayBackedNetwork(nsxtObj, parentNetwork)
-                        if externalNetworkName:
-                            vAppValidations['vlanBackedNetworks'].add(f"{vApp['@name']}|{externalNetworkName}")
+                        vAppValidations['overlayBackingChecks'].add(
+                            (vApp['@name'], f"{parentNetwork['parentNetworkId']['name']}-v2t"))
                 else:
                     # Dedicated direct network implementation
                     vAppValidations['dedicatedDirectNetworks'].add(f"{vApp['@name']}|{vAppNetwork['@networkName']}")
@@ -4854,66 +5236,50 @@ class VCDMigrationValidation:
             # check the external router ips of routed vapp networks and NAT
             vAppValidations['routerExternalIp'][vApp['@name']].update(
                 {vAppNetwork['@networkName']: vAppNetwork['Configuration'].get('RouterInfo', {}).get('ExternalIp')})
-            if vAppNetwork['Configuration'].get('Features', {}).get('NatService', {}).get('NatRule'):
-                vAppValidations['natExternalIp'][vApp['@name']][vAppNetwork['@networkName']] = []
-                for rule in listify(vAppNetwork['Configuration']['Features']['NatService']['NatRule']):
-                    if rule.get('OneToOneVmRule', {}).get('ExternalIpAddress'):
-                        vAppValidations['natExternalIp'][vApp['@name']][vAppNetwork['@networkName']].append(
-                            rule['OneToOneVmRule'].get('ExternalIpAddress'))
+            if natRules:
+                vAppValidations['natExternalIp'][vApp['@name']][vAppNetwork['@networkName']] = [
+                    rule['OneToOneVmRule']['ExternalIpAddress']
+                    for rule in natRules
+                    if rule.get('OneToOneVmRule', {}).get('ExternalIpAddress')
+                ]
 
     def _validateRoutedVappNetworks_10_3_2_1(self, vApp, vAppValidations):
-        response = self.restClientObj.get(vApp['@href'], self.headers)
-        responseDict = self.vcdUtils.parseXml(response.content)
-        if not response.status_code == requests.codes.ok:
-            raise Exception(
-                "Failed to get vapp {} details for own network due to {}".format(
-                    vApp['@name'], responseDict['Error']['@message']))
-
-        vAppData = responseDict['VApp']
-        if not vAppData['NetworkConfigSection'].get('NetworkConfig'):
+        vAppData = self._getVappDetails(vApp)
+        vAppNetworks = [
+            vAppNetwork
+            for vAppNetwork in listify(vAppData['NetworkConfigSection'].get('NetworkConfig'))
+            if vAppNetwork['@networkName'] != "none"
+        ]
+        routedVappNetworks = [
+            vAppNetwork for vAppNetwork in vAppNetworks if vAppNetwork['Configuration']['FenceMode'] == 'natRouted']
+        if not routedVappNetworks:
             return
 
-        networkTypes = set()
-        for vAppNetwork in listify(vAppData['NetworkConfigSection']['NetworkConfig']):
-            if vAppNetwork['@networkName'] == "none":
-                continue
-
-            networkTypes.add(vAppNetwork['Configuration']['FenceMode'])
-            if vAppNetwork['Configuration']['FenceMode'] != 'natRouted':
-                continue
-
+        networkTypes = {vAppNetwork['Configuration']['FenceMode'] for vAppNetwork in vAppNetworks}
+        for vAppNetwork in routedVappNetworks:
             # Get parent network
-            response = self.restClientObj.get(
-                url="{}{}".format(
-                    vcdConstants.OPEN_API_URL.format(self.ipAddress),
-                    vcdConstants.GET_ORG_VDC_NETWORK_BY_ID.format(
-                        urn_id(vAppNetwork['Configuration']['ParentNetwork']['@id'], _type='network'))
-                ),
-                headers=self.headers
-            )
-            parentNetwork = response.json()
-            if not response.status_code == requests.codes.ok:
-                raise Exception(
-                    f"Unable to get parent network {vAppNetwork['Configuration']['ParentNetwork']['@name']}"
-                    f" details: {parentNetwork['message']}")
+            parentNetwork = self._getParentNetwork(vAppNetwork)
 
             # Verify NAT rules
             natService = vAppNetwork['Configuration'].get('Features', {}).get('NatService', {})
             if natService.get('NatType', '') == 'portForwarding':
+                # TODO pranshu: Check for duplicate Any port
+                externalPorts = set()
+                duplicateNatPort = False
                 for rule in listify(natService.get('NatRule')):
-                    rule = rule.get('VmRule')
+                    rule = rule.get('VmRule', {})
+                    # external ports are not tracked anymore once a duplicate is found
+                    if not duplicateNatPort:
+                        externalPort = rule.get('ExternalPort')
+                        duplicateNatPort = externalPort in externalPorts
+                        externalPorts.add(externalPort)
                     if not rule:
                         continue
 
                     if rule['Protocol'] == 'TCP_UDP':
                         vAppValidations['natPfTcpUdp'].add(f"{vApp['@name']}|{vAppNetwork['@networkName']}")
 
-                # TODO pranshu: Check for duplicate Any port
-                duplicateNatPorts = Counter(
-                    rule.get('VmRule', {}).get('ExternalPort')
-                    for rule in listify(natService.get('NatRule'))
-                )
-                if any(value > 1 for value in duplicateNatPorts.values()):
+                if duplicateNatPort:
                     vAppValidations['natPfDuplicatePort'].add(f"{vApp['@name']}|{vAppNetwork['@networkName']}")
 
             elif natService.get('NatType', '') == 'ipTranslation':
@@ -4922,19 +5288,25 @@ class VCDMigrationValidation:
 
                 else:
                     if parentNetwork['networkType'] == 'NAT_ROUTED':
-                        ipRangeAddresses = set(
-                            str(ipaddress.IPv4Address(ip))
+                        # static ip pools as sorted (start, end) intervals instead of expanding every address of pool
+                        # overlapping pools are merged as lookup of address expects non overlapping ranges
+                        ipPools = mergeRanges(
+                            (int(ipaddress.IPv4Address(ipPool['startAddress'])),
+                             int(ipaddress.IPv4Address(ipPool['endAddress'])))
                             for ipPool in parentNetwork['subnets']['values'][0]['ipRanges'].get('values', []) or []
-                            for ip in range(
-                                int(ipaddress.IPv4Address(ipPool['startAddress'])),
-                                int(ipaddress.IPv4Address(ipPool['endAddress']) + 1))
                         )
-                        outOfPoolIps = [
-                            natRule['OneToOneVmRule']['ExternalIpAddress']
-                            for natRule in listify(natService.get('NatRule'))
-                            if natRule['OneToOneVmRule'].get('ExternalIpAddress')
-                            if natRule['OneToOneVmRule']['ExternalIpAddress'] not in ipRangeAddresses
-                        ]
+                        outOfPoolIps = list()
+                        for natRule in listify(natService.get('NatRule')):
+                            externalIpAddress = natRule['OneToOneVmRule'].get('ExternalIpAddress')
+                            if not externalIpAddress:
+                                continue
+                            try:
+                                if isIPv4AddressInRanges(externalIpAddress, ipPools):
+                                    continue
+                            except ValueError:
+                                # malformed external ip address cannot be present in any static ip pool
+                                pass
+                            outOfPoolIps.append(externalIpAddress)
                         if outOfPoolIps:
                             vAppValidations['natIptOutOfPoolIps'].add(f"{vApp['@name']}|{vAppNetwork['@networkName']}|{','.join(outOfPoolIps)}")
 
@@ -4946,24 +5318,22 @@ class VCDMigrationValidation:
         """
         Description :   Validates there exists no vapp routed network in source vapps
         """
-        vAppList = self.getOrgVDCvAppsList(sourceOrgVDCId)
+        vAppList = self._getVappsListForValidation(sourceOrgVDCId)
         if not vAppList:
             return
 
+        # Networks may have changed since last validation
+        self.clearVappNetworkCaches()
+
         # Routed vapp support is added from VCD build 10.3.2.19442122. As API version is same for 10.3.2 and this build,
         # we are comparing VCD version directly.
         if version.parse(self.getVCDVersion()) < version.parse(vcdConstants.VCD_10_3_2_1_BUILD) and not v2tAssessmentMode:
             # iterating over the source vapps
             vAppNetworkList = []
             self.vAppNetworkDict = {}
-            for vApp in vAppList:
-            # spawn thread for check vapp with own network task
-                self.thread.spawnThread(self._checkVappWithOwnNetwork, vApp)
-            # halt the main thread till all the threads complete execution
-            self.thread.joinThreads()
-            if self.thread.stop():
-                raise Exception("Failed to validate vApp routed network exists in source org VDC. Check log file"
-                                " for errors")
+            self._validateVappsInParallel(
+                self._checkVappWithOwnNetwork, vAppList,
+                "Failed to validate vApp routed network exists in source org VDC. Check log file for errors")
 
             if self.vAppNetworkDict:
                 for key, value in self.vAppNetworkDict.items():
@@ -4975,7 +5345,7 @@ class VCDMigrationValidation:
             logger.debug('Validating routed vApp network configuration')
             errors = []
 
-            if float(self.version) < float(vcdConstants.API_VERSION_ANDROMEDA_10_3_3) and not v2tAssessmentMode:
+            if self.versionNumber < ANDROMEDA_10_3_3_VERSION and not v2tAssessmentMode:
                 # 10.3.2.1 only validations
                 vAppValidations = {
                     'mixedNetworkTypes': set(),
@@ -4985,11 +5355,9 @@ class VCDMigrationValidation:
                     'natIptOutOfPoolIps': set()
                 }
 
-                for vApp in vAppList:
-                    self.thread.spawnThread(self._validateRoutedVappNetworks_10_3_2_1, vApp, vAppValidations)
-                self.thread.joinThreads()
-                if self.thread.stop():
-                    raise Exception("Failed to validate vApp routed networks")
+                self._validateVappsInParallel(
+                    self._validateRoutedVappNetworks_10_3_2_1, vAppList, "Failed to validate vApp routed networks",
+                    vAppValidations)
 
                 if vAppValidations['mixedNetworkTypes']:
                     errors.append(
@@ -5017,16 +5385,23 @@ class VCDMigrationValidation:
                 'dedicatedDirectNetworks': set(),
                 'legacyDirectNetwork': set(),
                 'vlanBackedNetworks': set(),
+                'overlayBackingChecks': set(),
                 'natPfCustomToAny': set(),
                 'routerExternalIp': dict(),
                 'natExternalIp': dict(),
             }
 
-            for vApp in vAppList:
-                self.thread.spawnThread(self._validateRoutedVappNetworks, vApp, vAppValidations, nsxtObj)
-            self.thread.joinThreads()
-            if self.thread.stop():
-                raise Exception("Failed to validate vApp routed networks")
+            self._validateVappsInParallel(
+                self._validateRoutedVappNetworks, vAppList, "Failed to validate vApp routed networks",
+                vAppValidations, nsxtObj)
+
+            # target external networks of all vApps are retrieved together and then checked for overlay backing
+            self._getExternalNetworksByName(
+                {externalNetworkName for _, externalNetworkName in vAppValidations['overlayBackingChecks']})
+            for vAppName, externalNetworkName in vAppValidations['overlayBackingChecks']:
+                externalNetworkName = self._checkOverlayBackedNetwork(nsxtObj, externalNetworkName)
+                if externalNetworkName:
+                    vAppValidations['vlanBackedNetworks'].add(f"{vAppName}|{externalNetworkName}")
 
             if vAppValidations['dedicatedDirectNetworks']:
                 errors.append(
@@ -5046,14 +5421,20 @@ class VCDMigrationValidation:
                     f"(vApp|vApp_Network): {', '.join(vAppValidations['natPfCustomToAny'])}")
 
             # logic to identify router external IP conflicts with NAT
+            # vApp networks using a NAT external IP indexed by the IP
+            natExternalIpIndex = defaultdict(list)
+            for natVapp, natNetList in vAppValidations['natExternalIp'].items():
+                for natNet, natIpList in natNetList.items():
+                    for natIp in dict.fromkeys(natIpList):
+                        natExternalIpIndex[natIp].append((natVapp, natNet))
+
             for externalVapp, externalNetList in vAppValidations['routerExternalIp'].items():
                 for externalNet, externalIp in externalNetList.items():
-                    for natVapp, natNetList in vAppValidations['natExternalIp'].items():
-                        for natNet, natIpList in natNetList.items():
-                            if externalIp in natIpList and externalVapp != natVapp:
-                                errors.append(
-                                    "Router external IP of '{}' network of '{}' vapp is used for NAT external IP of "
-                                    "'{}' network of '{}' vapp".format(externalNet,externalVapp, natNet, natVapp))
+                    for natVapp, natNet in natExternalIpIndex.get(externalIp, ()):
+                        if externalVapp != natVapp:
+                            errors.append(
+                                "Router external IP of '{}' network of '{}' vapp is used for NAT external IP of "
+                                "'{}' network of '{}' vapp".format(externalNet, externalVapp, natNet, natVapp))
 
             if errors:
                 raise ValidationError('\n'.join(errors))
@@ -5061,34 +5442,29 @@ class VCDMigrationValidation:
             logger.debug('Successfully validated routed vApp network configuration')
 
     @isSessionExpired
-    def _checkVappWithIsolatedNetwork(self, vApp, migration=False):
+    def _checkVappWithIsolatedNetwork(self, vApp):
         """
         Description :   Send get request for vApp and check if vApp has its own vapp routed network in response
         Parameters  :   vApp - data related to a vApp (DICT)
+        Returns     :   Names of isolated vApp networks with DHCP enabled (LIST)
         """
-        # get api call to retrieve the vapp details
-        response = self.restClientObj.get(vApp['@href'], self.headers)
-        responseDict = self.vcdUtils.parseXml(response.content)
-        if not response.status_code == requests.codes.ok:
-            raise Exception('Error occurred while retrieving vapp details to validate isolated network'
-                            'for {} due to {}'.format(vApp['@name'],responseDict['Error']['@message']))
-        vAppData = responseDict['VApp']
+        # retrieve the vapp details
+        vAppData = self._getVappDetails(vApp)
         # checking if the networkConfig is present in vapp's NetworkConfigSection
         if vAppData['NetworkConfigSection'].get('NetworkConfig'):
-            vAppNetworkList = vAppData['NetworkConfigSection']['NetworkConfig'] if isinstance(
-                vAppData['NetworkConfigSection']['NetworkConfig'], list) else [
-                vAppData['NetworkConfigSection']['NetworkConfig']]
+            vAppNetworkList = listify(vAppData['NetworkConfigSection']['NetworkConfig'])
             if vAppNetworkList:
                 networkList = []
                 DHCPEnabledNetworkList = []
                 # iterating over the source vapp network list
                 for vAppNetwork in vAppNetworkList:
-                    if not vAppNetwork['Configuration'].get('ParentNetwork'):
+                    networkConfiguration = vAppNetwork['Configuration']
+                    if not networkConfiguration.get('ParentNetwork'):
                         # if parent network is absent then raising exception only if the  network gateway is not dhcp
-                        if vAppNetwork['Configuration']['IpScopes']['IpScope']['Gateway'] != '196.254.254.254':
+                        if networkConfiguration['IpScopes']['IpScope']['Gateway'] != vcdConstants.VAPP_DHCP_NETWORK_GATEWAY:
                             # Checking for dhcp configuration on vapp isolated networks
-                            if vAppNetwork['Configuration'].get('Features', {}).get('DhcpService', {}).get('IsEnabled') == 'true':
-                                if self.version >= vcdConstants.API_VERSION_ANDROMEDA:
+                            if getNestedValue(networkConfiguration, 'Features', 'DhcpService', 'IsEnabled') == 'true':
+                                if self.versionNumber >= ANDROMEDA_VERSION:
                                     logger.debug("validation successful the vApp networks {} in vApp {} is isolated "
                                                  "with DHCP enabled".format(vAppNetwork['@networkName'], vApp['@name']))
                                 else:
@@ -5098,10 +5474,7 @@ class VCDMigrationValidation:
                         else:
                             logger.debug("Validated successfully {} network within vApp {} is not a Vapp "
                                          "Network".format(vAppNetwork['@networkName'], vApp['@name']))
-                if DHCPEnabledNetworkList and not migration:
-                    self.DHCPEnabled[vApp['@name']] = DHCPEnabledNetworkList
-                else:
-                    return DHCPEnabledNetworkList
+                return DHCPEnabledNetworkList
 
         return []
 
@@ -5113,24 +5486,21 @@ class VCDMigrationValidation:
             vAppNetworkList = list()
             self.DHCPEnabled = dict()
 
-            vAppList = self.getOrgVDCvAppsList(sourceOrgVDCId)
+            vAppList = self._getVappsListForValidation(sourceOrgVDCId)
             if not vAppList:
                 return
 
-            # iterating over the source vapps
-            for vApp in vAppList:
-                # spawn thread for check vapp with own network task
-                self.thread.spawnThread(self._checkVappWithIsolatedNetwork, vApp)
-                # halt the main thread till all the threads complete execution
-            self.thread.joinThreads()
-            if self.thread.stop():
-                raise Exception("Failed to validate DHCP is enabled on Isolated vApp Network, Check log file "
-                                "for errors")
+            # networks are returned by each vApp check and merged here instead of being written by worker threads
+            DHCPEnabledNetworksByVapp = self._validateVappsInParallel(
+                self._checkVappWithIsolatedNetwork, vAppList,
+                "Failed to validate DHCP is enabled on Isolated vApp Network, Check log file for errors")
+            self.DHCPEnabled = {
+                vAppName: networkNames for vAppName, networkNames in DHCPEnabledNetworksByVapp.items() if networkNames}
             if self.DHCPEnabled:
                 for key, value in self.DHCPEnabled.items():
                     vAppNetworkList.append('vAppName: ' + key + ' : NetworkName: ' + ', '.join(value))
 
-                if float(self.version) >= float(vcdConstants.API_VERSION_ANDROMEDA):
+                if self.versionNumber >= ANDROMEDA_VERSION:
                     edgeGatewayData = self.getOrgVDCEdgeGateway(sourceOrgVDCId)
                     if len(edgeGatewayData) == 0:
                         if edgeGatewayDeploymentEdgeCluster is not None:
@@ -5145,42 +5515,42 @@ class VCDMigrationValidation:
         except Exception:
             raise
 
-    def _validateNamedDiskWithFastProvisioned(self, vApp, unsupportedVms):
-        vAppResponse = self.restClientObj.get(vApp['@href'], self.headers)
-        responseDict = self.vcdUtils.parseXml(vAppResponse.content)
-        if not vAppResponse.status_code == requests.codes.ok:
-            raise Exception("Failed to get vapp details in validateNamedDiskWithFastProvisioned due to {}".format(
-                responseDict['Error']['@message']))
-
-        if not responseDict['VApp'].get('Children'):
+    def _validateNamedDiskWithFastProvisioned(self, vApp):
+        """
+        Description :   Checks VMs of vApp having independent disk with storage policy different from that of VM
+        Parameters  :   vApp - data related to a vApp (DICT)
+        Returns     :   Names of unsupported VMs (LIST)
+        """
+        vAppData = self._getVappDetails(vApp)
+        if not vAppData.get('Children'):
             logger.debug('Source vApp {} has no VM present in it.'.format(vApp['@name']))
-            return
+            return []
 
-        for vm in listify(responseDict['VApp']['Children']['Vm']):
-            for disk in listify(vm.get('VmSpecSection', {}).get('DiskSection', {}).get('DiskSettings')):
-                if disk.get('Disk') and disk['StorageProfile']['@id'] != vm.get('StorageProfile', {}).get('@id'):
-                    unsupportedVms['vm'].append(vm['@name'])
-                    break
+        unsupportedVms = []
+        for vm in listify(vAppData['Children']['Vm']):
+            vmStorageProfileId = getNestedValue(vm, 'StorageProfile', '@id')
+            if any(disk.get('Disk') and disk['StorageProfile']['@id'] != vmStorageProfileId
+                   for disk in listify(getNestedValue(vm, 'VmSpecSection', 'DiskSection', 'DiskSettings'))):
+                unsupportedVms.append(vm['@name'])
+        return unsupportedVms
 
     def validateNamedDiskWithFastProvisioned(self, sourceOrgVDCId):
         if not self.validateOrgVDCFastProvisioned():
             return
 
-        vAppList = self.getOrgVDCvAppsList(sourceOrgVDCId)
+        vAppList = self._getVappsListForValidation(sourceOrgVDCId)
         if not vAppList:
             return
 
-        unsupportedVms = {'vm': []}
-        for vApp in vAppList:
-            self.thread.spawnThread(self._validateNamedDiskWithFastProvisioned, vApp, unsupportedVms)
-
-        self.thread.joinThreads()
-        if self.thread.stop():
-            raise Exception("Failed to validate independent Disks with Fast Provisioned enabled. Check log file for errors")
+        # unsupported VMs are returned by each vApp check instead of being appended to a list shared by threads
+        unsupportedVmsByVapp = self._validateVappsInParallel(
+            self._validateNamedDiskWithFastProvisioned, vAppList,
+            "Failed to validate independent Disks with Fast Provisioned enabled. Check log file for errors")
+        unsupportedVms = [vmName for vmNames in unsupportedVmsByVapp.values() for vmName in vmNames]
 
-        if unsupportedVms['vm']:
+        if unsupportedVms:
             raise ValidationError("VM/s ({}) has independent disk attached with different storage policies.".format(
-                ','.join(unsupportedVms['vm'])))
+                ','.join(unsupportedVms)))
 
         logger.debug("Validated Successfully, Independent Disks with Fast Provisioned enabled")
 
@@ -5191,45 +5561,36 @@ class VCDMigrationValidation:
             Parameters  :   vApp - data related to a vApp (DICT)
         """
         try:
-            hrefVapp = vApp['@href']
             vmWithMediaList = list()
-            # get api call to retrieve vapp details
-            response = self.restClientObj.get(hrefVapp, self.headers)
-            if response.status_code == requests.codes.ok:
-                responseDict = self.vcdUtils.parseXml(response.content)
-                # checking if vapp has vms in it
-                if responseDict['VApp'].get('Children'):
-                    vmList = responseDict['VApp']['Children']['Vm'] if isinstance(responseDict['VApp']['Children']['Vm'],
-                                                                                  list) else [
-                        responseDict['VApp']['Children']['Vm']]
-                    # iterating over vms in the vapp
-                    for vm in vmList:
-                        if vm.get('VmSpecSection', {}).get('MediaSection', {}):
-                            mediaSettings = vm.get('VmSpecSection', {}).get('MediaSection', {}).get('MediaSettings', []) if isinstance(
-                                vm.get('VmSpecSection', {}).get('MediaSection', {}).get('MediaSettings', []), list) else [
-                                vm.get('VmSpecSection', {}).get('MediaSection', {}).get('MediaSettings', [])
-                            ]
-                            # iterating over the list of media settings of vm
-                            for mediaSetting in mediaSettings:
-                                # checking for the ISO media type that should be disconnected, else raising exception
-                                if mediaSetting['MediaType'] == "ISO":
-                                    if mediaSetting['MediaState'] != "DISCONNECTED":
-                                        vmWithMediaList.append(vApp['@name'] + ':' + vm['@name'])
-                    if vmWithMediaList:
-                        return vmWithMediaList
-                    else:
-                        logger.debug("Validated successfully that media of source vm {} is not connected".format(vm['@name']))
+            # retrieve vapp details
+            vAppData = self._getVappDetails(vApp)
+            # checking if vapp has vms in it
+            if vAppData.get('Children'):
+                vmList = listify(vAppData['Children']['Vm'])
+                # iterating over vms in the vapp
+                for vm in vmList:
+                    mediaSettings = listify(getNestedValue(vm, 'VmSpecSection', 'MediaSection', 'MediaSettings'))
+                    # iterating over the list of media settings of vm
+                    for mediaSetting in mediaSettings:
+                        # checking for the ISO media type that should be disconnected, else raising exception
+                        if mediaSetting['MediaType'] == "ISO":
+                            if mediaSetting['MediaState'] != "DISCONNECTED":
+                                vmWithMediaList.append(vApp['@name'] + ':' + vm['@name'])
+                if vmWithMediaList:
+                    return vmWithMediaList
                 else:
-                    logger.debug("Source vApp {} has no VMs in it".format(vApp['@name']))
+                    logger.debug("Validated successfully that media of source vm {} is not connected".format(vm['@name']))
             else:
-                raise Exception('Unable to get vApp details from vApp: {}'.format(vApp['@name']))
+                logger.debug("Source vApp {} has no VMs in it".format(vApp['@name']))
         except Exception:
             raise
 
     def getVCDVersion(self):
         """
-           Description : Fetch vcd version from vCD cells information
+           Description : Fetch vcd version from vCD cells information, version is fetched once per run
         """
+        if self._vcdVersion:
+            return self._vcdVersion
         url = "{}{}".format(vcdConstants.OPEN_API_URL.format(self.ipAddress), vcdConstants.VCD_CELLS)
         response = self.restClientObj.get(url, self.headers)
         responseDict = response.json()
@@ -5242,9 +5603,8 @@ class VCDMigrationValidation:
                 raise Exception("Not able to fetch vCD version due to API response difference")
             elif version.parse(vCDVersion) < version.parse("10.4"):
                 logger.warning("VCD {} is not supported with current migration tool. Some features may not work as expected.".format(vCDVersion))
-                return vCDVersion
-            else:
-                return vCDVersion
+            self._vcdVersion = vCDVersion
+            return vCDVersion
         else:
             raise Exception(
                 "Failed to fetch vCD version information - {}".format(responseDict['message']))
@@ -5256,48 +5616,10 @@ class VCDMigrationValidation:
         """
 
         data = {}
-        # Query url to fetch the vm related data
-        acceptHeader = vcdConstants.GENERAL_JSON_ACCEPT_HEADER
-        headers = {'Authorization': self.headers['Authorization'], 'Accept': acceptHeader}
-        url = "{}{}&sortAsc=name".format(vcdConstants.XML_API_URL.format(self.ipAddress), vcdConstants.ORG_VDC_QUERY)
-        response = self.restClientObj.get(url, headers)
-        if response.status_code == requests.codes.ok:
-            responseDict = response.json()
-            resultTotal = responseDict['total']
-        else:
-            # failure in retrieving the data of org vdc
-            raise Exception(
-                "Failed to fetch the org vdc's data")
-
-        pageNo = 1
-        pageSizeCount = 0
-        resultList = []
-        logger.debug('Getting org vdc details')
-        while resultTotal > 0 and pageSizeCount < resultTotal:
-            # Query url to fetch the vm related data
-            url = "{}{}&page={}&pageSize={}&format=records&sortAsc=name".format(
-                vcdConstants.XML_API_URL.format(self.ipAddress),
-                vcdConstants.ORG_VDC_QUERY, pageNo,
-                25)
-            getSession(self)
-            # get api call to retrieve the media details of organization with page number and page size count
-            response = self.restClientObj.get(url, headers)
-            if response.status_code == requests.codes.ok:
-                responseDict = response.json()
-                listOfOrgVDC = responseDict["record"] if isinstance(
-                    responseDict["record"], list) else [responseDict["record"]]
-                resultList.extend(listOfOrgVDC)
-                pageSizeCount += len(responseDict['record'])
-                logger.debug('Org VDC result pageSize = {}'.format(pageSizeCount))
-                pageNo += 1
-                resultTotal = responseDict['total']
-            else:
-                # failure in retrieving the data of org vdc
-                raise Exception(
-                    "Failed to fetch the org vdc's data")
-        logger.debug('Total Org VDC result count = {}'.format(len(resultList)))
-
-        for orgVDC in resultList:
+        orgVDCRecords = self._iterQueryRecords(
+            vcdConstants.ORG_VDC_QUERY, vcdConstants.ORG_VDC_PAGE_SIZE, 'org vdc',
+            fields=('name', 'orgName', 'numberOfVApps', 'numberOfVMs', 'memoryUsedMB', 'numberOfRunningVMs'))
+        for orgVDC in orgVDCRecords:
             if orgVDC["orgName"] not in data:
                 data[orgVDC["orgName"]] = {}
             data[orgVDC["orgName"]][orgVDC["name"]] = {
@@ -5324,24 +5646,16 @@ class VCDMigrationValidation:
                 raise Exception('Error occurred while retrieving Org VDC - {} details'.format(OrgVDCID))
             if not responseDict['AdminVdc']['ResourceEntities']:
                 return
-            sourceOrgVDCEntityList = responseDict['AdminVdc']['ResourceEntities']['ResourceEntity'] if isinstance(
-                responseDict["AdminVdc"]['ResourceEntities']['ResourceEntity'], list) else [
-                responseDict["AdminVdc"]['ResourceEntities']['ResourceEntity']]
             # creating source vapp list
-            sourceVappList = [vAppEntity for vAppEntity in sourceOrgVDCEntityList if
-                              vAppEntity['@type'] == vcdConstants.TYPE_VAPP]
+            sourceVappList = [vAppEntity for vAppEntity in listify(
+                responseDict['AdminVdc']['ResourceEntities']['ResourceEntity'])
+                              if vAppEntity['@type'] == vcdConstants.TYPE_VAPP]
 
-            for sourceVapp in sourceVappList:
-                # spawn thread for check media connected to vm in vapp
-                self.thread.spawnThread(self._checkMediaAttachedToVM, sourceVapp, saveOutputKey=sourceVapp['@name'])
-                # halt the main thread till all the threads complete execution
-            self.thread.joinThreads()
-
-            if self.thread.stop():
-                raise Exception("Failed to Validate VM/s with media connected exists in Vapp/s. Check log file "
-                                "for errors")
+            vmsWithMedia = self._validateVappsInParallel(
+                self._checkMediaAttachedToVM, sourceVappList,
+                "Failed to Validate VM/s with media connected exists in Vapp/s. Check log file for errors")
             allVmWithMediaList = list()
-            for each_vApp, eachVmValues in self.thread.returnValues.items():
+            for each_vApp, eachVmValues in vmsWithMedia.items():
                 if eachVmValues is not None:
                     allVmWithMediaList.append(','.join(eachVmValues))
             if raiseError and allVmWithMediaList:
@@ -5359,40 +5673,51 @@ class VCDMigrationValidation:
             Description :   Fetch all the port groups that are present in vCenter
             Returns     :   List of port groups(LIST)
         """
-        # url to get the port group details
-        url = "{}{}".format(vcdConstants.XML_API_URL.format(self.ipAddress),
-                            vcdConstants.GET_PORTGROUP_INFO)
-        acceptHeader = vcdConstants.GENERAL_JSON_ACCEPT_HEADER
-        headers = {'Authorization': self.headers['Authorization'], 'Accept': acceptHeader}
-        # retrieving the details of the port group
-        response = self.restClientObj.get(url, headers)
-        responseDict = response.json()
-        if response.status_code == requests.codes.ok:
-            resultTotal = responseDict['total']
-        else:
-            raise Exception('Failed to retrieve PortGroup details due to: {}'.format(responseDict['message']))
+        resultList = list(self._iterQueryRecords(vcdConstants.GET_PORTGROUP_INFO,
+                                                 vcdConstants.PORT_GROUP_PAGE_SIZE, 'portgroup'))
+        logger.debug('Portgroup details successfully retrieved')
+        return resultList
+
+    def _iterQueryRecords(self, query, pageSize, entityName, fields=None):
+        """
+        Description :   Iterates over the records of a vCD query page by page. The total result count is taken
+                        from the first page itself, so no separate count request is made
+        Parameters  :   query - query type along with its filters (STRING)
+                        pageSize - number of records retrieved per page (INT)
+                        entityName - name of the queried entity used in logs and errors (STRING)
+                        fields - names of record attributes to be retrieved, all attributes if not provided (TUPLE)
+        Returns     :   Generator of query records (GENERATOR)
+        """
+        # session is validated by the callers, so it is checked again only if it expires while paging
+        headers = {'Authorization': self.headers['Authorization'], 'Accept': vcdConstants.GENERAL_JSON_ACCEPT_HEADER}
         pageNo = 1
         pageSizeCount = 0
-        resultList = []
-        logger.debug('Getting portgroup details')
-        while resultTotal > 0 and pageSizeCount < resultTotal:
-            url = "{}{}&page={}&pageSize={}&format=records&sortAsc=name".format(vcdConstants.XML_API_URL.format(self.ipAddress),
-                                                                   vcdConstants.GET_PORTGROUP_INFO, pageNo,
-                                                                   vcdConstants.PORT_GROUP_PAGE_SIZE)
-            getSession(self)
+        resultTotal = None
+        logger.debug('Getting {} details'.format(entityName))
+        queryUrl = "{}{}".format(vcdConstants.XML_API_URL.format(self.ipAddress), query)
+        if fields:
+            # records carrying only the required attributes keep the pages smaller to transfer and decode
+            queryUrl += "&fields={}".format(','.join(fields))
+        while resultTotal is None or pageSizeCount < resultTotal:
+            url = f"{queryUrl}&page={pageNo}&pageSize={pageSize}&format=records&sortAsc=name"
             response = self.restClientObj.get(url, headers)
+            if response.status_code == requests.codes.unauthorized:
+                getSession(self)
+                headers['Authorization'] = self.headers['Authorization']
+                response = self.restClientObj.get(url, headers)
+            if response.status_code != requests.codes.ok:
+                raise Exception('Failed to retrieve {} details due to: {}'.format(
+                    entityName, response.json().get('message')))
             responseDict = response.json()
-            if response.status_code == requests.codes.ok:
-                resultList.extend(responseDict['record'])
-                pageSizeCount += len(responseDict['record'])
-                logger.debug('Portgroup details result pageSize = {}'.format(pageSizeCount))
-                pageNo += 1
-                resultTotal = responseDict['total']
-            else:
-                raise Exception('Failed to retrieve PortGroup details due to: {}'.format(responseDict['message']))
-        logger.debug('Total Portgroup details result count = {}'.format(len(resultList)))
-        logger.debug('Portgroup details successfully retrieved')
-        return resultList
+            records = listify(responseDict.get('record'))
+            if not records:
+                break
+            resultTotal = responseDict['total']
+            pageSizeCount += len(records)
+            logger.debug('{} result pageSize = {}'.format(entityName, pageSizeCount))
+            pageNo += 1
+            yield from records
+        logger.debug('Total {} result count = {}'.format(entityName, pageSizeCount))
 
     @isSessionExpired
     def getSourceNetworkPoolBacking(self):
@@ -5406,6 +5731,10 @@ class VCDMigrationValidation:
         if not networkPool:
             return dict()
 
+        # backing type of network pool is fetched once per network pool
+        if networkPool['@id'] in self._networkPoolBackingById:
+            return self._networkPoolBackingById[networkPool['@id']]
+
         # get api call to retrieve the info of source org vdc network pool backing details
         url = "{}{}".format(vcdConstants.OPEN_API_URL.format(self.ipAddress), vcdConstants.NETWORK_POOL.format(
             networkPool['@id']))
@@ -5414,6 +5743,7 @@ class VCDMigrationValidation:
             raise Exception("Failed to fetch source network pool backing")
 
         networkPoolDict = networkPoolResponse.json()
+        self._networkPoolBackingById[networkPool['@id']] = networkPoolDict.get('poolType')
         return networkPoolDict.get('poolType')
 
     @isSessionExpired
@@ -5428,12 +5758,17 @@ class VCDMigrationValidation:
         if not networkPool:
             return dict()
 
+        # details of network pool are fetched once per network pool
+        if networkPool['@id'] in self._networkPoolDetailsById:
+            return self._networkPoolDetailsById[networkPool['@id']]
+
         # get api call to retrieve the info of source org vdc network pool
         networkPoolResponse = self.restClientObj.get(networkPool['@href'], self.headers)
         if networkPoolResponse.status_code != requests.codes.ok:
             raise Exception("Failed to fetch source network pool data")
 
         networkPoolDict = self.vcdUtils.parseXml(networkPoolResponse.content)
+        self._networkPoolDetailsById[networkPool['@id']] = networkPoolDict
         return networkPoolDict
 
     @isSessionExpired
@@ -5443,16 +5778,22 @@ class VCDMigrationValidation:
         Parameters  :  cloneOverlayIds - Flag that decides whether the overlay id's will be cloned or not (BOOLEAN)
         """
         try:
-            # Getting source network pool details
-            networkPoolBackingType = self.getSourceNetworkPoolBacking()
-            networkPoolDict = self.getSourceNetworkPoolDetails()
+            # Getting source network pool backing and details concurrently as they are independent of each other
+            self.thread.spawnThread(self.getSourceNetworkPoolBacking)
+            self.thread.spawnThread(self.getSourceNetworkPoolDetails)
+            # halt the main thread till all the threads complete execution
+            self.thread.joinThreads()
+            if self.thread.stop():
+                raise Exception('Failed to get source network pool details')
+            networkPoolBackingType = self.thread.returnValues['getSourceNetworkPoolBacking']
+            networkPoolDict = self.thread.returnValues['getSourceNetworkPoolDetails']
 
             # checking for the network pool associated with source org vdc
             if not networkPoolDict:
                 return
 
             # checking if cloneOverlayIds parameter is set to true
-            if cloneOverlayIds and float(self.version) < float(vcdConstants.API_VERSION_ANDROMEDA_10_3_1):
+            if cloneOverlayIds and self.versionNumber < ANDROMEDA_10_3_1_VERSION:
                 raise Exception("'cloneOverlayIds' parameter is set to 'True' but "
                                 "not supported on current VCD version : ", self.version)
 
@@ -5476,13 +5817,12 @@ class VCDMigrationValidation:
                                     f"network pool '{networkPoolDict['VMWNetworkPool']['@name']}' "
                                     f"are not Distributed Port Group")
 
-                # Fetching all port groups present in vCenter
-                allPortGroups = self.fetchAllPortGroups()
+                # Fetching morefs of all port groups present in vCenter which don't have VLAN
+                morefsWithoutVlan = {portGroup['moref'] for portGroup in self.fetchAllPortGroups()
+                                     if not portGroup['vlanId']}
 
                 # Filtering port groups without VLAN
-                portGroupsWithoutVlan = [moref for moref, portGroupType in portGroupMoref.items()
-                                         for portGroup in allPortGroups
-                                         if portGroup['moref'] == moref and not portGroup['vlanId']]
+                portGroupsWithoutVlan = [moref for moref in portGroupMoref if moref in morefsWithoutVlan]
                 # If port groups without VLAN are present raise an exception
                 if portGroupsWithoutVlan:
                     raise Exception(f"Port Groups - '{', '.join(portGroupsWithoutVlan)}' backing the source "
@@ -5502,12 +5842,10 @@ class VCDMigrationValidation:
         try:
             data = self.rollback.apiData
             # retrieving list instance of org vdcs under the specified organization in user input file
-            orgVDCsList = data['Organization']['Vdcs']['Vdc'] if isinstance(data['Organization']['Vdcs']['Vdc'], list) else [data['Organization']['Vdcs']['Vdc']]
-            # iterating over the list of org vdcs under the specified organization
-            for orgVDC in orgVDCsList:
-                # checking if target org vdc's name already exist in the given organization; if so raising exception
-                if orgVDC['@name'] == "{}-v2t".format(sourceOrgVDCName):
-                    raise Exception("Target Org VDC '{}-v2t' already exists".format(sourceOrgVDCName))
+            targetOrgVDCName = "{}-v2t".format(sourceOrgVDCName)
+            # checking if target org vdc's name already exist in the given organization; if so raising exception
+            if any(orgVDC['@name'] == targetOrgVDCName for orgVDC in listify(data['Organization']['Vdcs']['Vdc'])):
+                raise Exception("Target Org VDC '{}' already exists".format(targetOrgVDCName))
             logger.debug("Validated successfully, no target org VDC named '{}-v2t' exists".format(sourceOrgVDCName))
         except Exception:
             raise
@@ -5522,8 +5860,7 @@ class VCDMigrationValidation:
         try:
             if edgeClusterName:
                 edgeClusterData = nsxObj.fetchEdgeClusterDetails(edgeClusterName)
-                edgeNodes = edgeClusterData['members'] if isinstance(edgeClusterData['members'], list) \
-                    else [edgeClusterData['members']]
+                edgeNodes = listify(edgeClusterData['members'])
                 if len(edgeNodes) < 1:
                     raise Exception(
                         "Edge Transport Nodes are not present in the cluster - {}, minimum 1 node should be present for edge gateway deployment"
@@ -5541,48 +5878,9 @@ class VCDMigrationValidation:
         Returns     : List of all org vdcs (LIST)
         """
         data = list()
-        # Query url to fetch the vm related data
-        acceptHeader = vcdConstants.GENERAL_JSON_ACCEPT_HEADER
-        headers = {'Authorization': self.headers['Authorization'], 'Accept': acceptHeader}
-        url = "{}{}&sortAsc=name".format(vcdConstants.XML_API_URL.format(self.ipAddress), vcdConstants.ORG_VDC_QUERY)
-        response = self.restClientObj.get(url, headers)
-        if response.status_code == requests.codes.ok:
-            responseDict = response.json()
-            resultTotal = responseDict['total']
-        else:
-            # failure in retrieving the data of org vdc
-            raise Exception(
-                "Failed to fetch the org vdc's data")
-
-        pageNo = 1
-        pageSizeCount = 0
-        resultList = []
-        logger.debug('Getting org vdc details')
-        while resultTotal > 0 and pageSizeCount < resultTotal:
-            # Query url to fetch the vm related data
-            url = "{}{}&page={}&pageSize={}&format=records&sortAsc=name".format(
-                vcdConstants.XML_API_URL.format(self.ipAddress),
-                vcdConstants.ORG_VDC_QUERY, pageNo,
-                25)
-            getSession(self)
-            # get api call to retrieve the media details of organization with page number and page size count
-            response = self.restClientObj.get(url, headers)
-            if response.status_code == requests.codes.ok:
-                responseDict = response.json()
-                listOfOrgVDC = responseDict["record"] if isinstance(
-                    responseDict["record"], list) else [responseDict["record"]]
-                resultList.extend(listOfOrgVDC)
-                pageSizeCount += len(responseDict['record'])
-                logger.debug('Org VDC result pageSize = {}'.format(pageSizeCount))
-                pageNo += 1
-                resultTotal = responseDict['total']
-            else:
-                # failure in retrieving the data of org vdc
-                raise Exception(
-                    "Failed to fetch the org vdc's data")
-        logger.debug('Total Org VDC result count = {}'.format(len(resultList)))
-
-        for orgVDC in resultList:
+        orgVDCRecords = self._iterQueryRecords(vcdConstants.ORG_VDC_QUERY, vcdConstants.ORG_VDC_PAGE_SIZE, 'org vdc',
+                                               fields=('name', 'orgName', 'vcName'))
+        for orgVDC in orgVDCRecords:
             data.append({
                         "name": orgVDC["name"],
                         "id": f"urn:vcloud:vdc:{orgVDC['href'].split('/')[-1]}",
@@ -5591,10 +5889,21 @@ class VCDMigrationValidation:
                         })
         return data
 
-    @isSessionExpired
     def getBackingTypeOfOrgVDC(self, orgVDCId):
         """
         Description : Method that returns backing type of org vdc
+                      Backing type of org vdc doesn't change, so it is fetched once per org vdc
+        Parameters  : orgVDCId   -   ID of org vdc (STRING)
+        Returns     : Backing type of org vdc - NSX_V/NSX_T (STRING)
+        """
+        if orgVDCId not in self._orgVDCBackingTypes:
+            self._orgVDCBackingTypes[orgVDCId] = self._fetchBackingTypeOfOrgVDC(orgVDCId)
+        return self._orgVDCBackingTypes[orgVDCId]
+
+    @isSessionExpired
+    def _fetchBackingTypeOfOrgVDC(self, orgVDCId):
+        """
+        Description : Method that fetches backing type of org vdc from its capabilities
         Parameters  : orgVDCId   -   ID of org vdc (STRING)
         Returns     : Backing type of org vdc - NSX_V/NSX_T (STRING)
         """
@@ -5602,18 +5911,14 @@ class VCDMigrationValidation:
         response = self.restClientObj.get(url, self.headers)
         responseDict = response.json()
         if response.status_code == requests.codes.ok:
-            values = responseDict['values']
-            for value in values:
-                # Checking backing type key in response values
-                if value['name'] == 'vdcGroupNetworkProviderTypes':
-                    if not value['value']:
-                        return 'NONE'
-                    else:
-                        return value['value'][0]
-                if value['name'] == 'networkProvider':
-                    return value['value']
-            else:
-                raise Exception("Unable to fetch backing type from capabilities of org vdc")
+            capabilities = {value['name']: value['value'] for value in responseDict['values']}
+            # Checking backing type key in response values
+            if 'vdcGroupNetworkProviderTypes' in capabilities:
+                providerTypes = capabilities['vdcGroupNetworkProviderTypes']
+                return providerTypes[0] if providerTypes else 'NONE'
+            if 'networkProvider' in capabilities:
+                return capabilities['networkProvider']
+            raise Exception("Unable to fetch backing type from capabilities of org vdc")
         else:
             # failure in retrieving the capabilities of org vdc
             raise Exception("Failed to fetch the capabilities of org vdc due to error - {}".format(responseDict['message']))
@@ -5625,32 +5930,39 @@ class VCDMigrationValidation:
                       nsxvObj         - Object of NSXV operations class holding all functions related to NSXV (OBJECT)
                       cloneOverlayIds - Flag to decide whether to validate the VNI pools or not (BOOLEAN)
         """
-        try:
-            # If clone overlay id parameter is False, then we don't need to validate the pool ranges
-            if not cloneOverlayIds or (float(self.version) < float(vcdConstants.API_VERSION_ANDROMEDA_10_3_1)):
-                logger.debug("'CloneOverlayIds' parameter is set to 'False' or not provided in user input file or not "
-                             "supported in current vcd version, so skipping the VNI pool validation")
-                return
-
-            # If clone overlay id parameter is True,
-            # and NSXV details are not provided in input file then we cannot perform validation
-            if not nsxvObj.ipAddress or not nsxvObj.username:
-                raise Exception(
-                    "'CloneOverlayIds' parameter is set to 'True', "
-                    "but NSX-V details are not provided in user input file")
-
-            # Fetching target NSXT pool id's
-            targetVNIPoolIds = nsxtObj.getNsxtVniPoolIds()
-            # Fetching source NSXV pool id's
-            sourceVNIPoolIds = nsxvObj.getNsxvVniPoolIds()
+        # If clone overlay id parameter is False, then we don't need to validate the pool ranges
+        if not cloneOverlayIds or self.versionNumber < ANDROMEDA_10_3_1_VERSION:
+            logger.debug("'CloneOverlayIds' parameter is set to 'False' or not provided in user input file or not "
+                         "supported in current vcd version, so skipping the VNI pool validation")
+            return
 
-            # If source NSXV VNI pool id's are not subset of
-            if not sourceVNIPoolIds.issubset(targetVNIPoolIds):
+        # If clone overlay id parameter is True,
+        # and NSXV details are not provided in input file then we cannot perform validation
+        if not nsxvObj.ipAddress or not nsxvObj.username:
+            raise Exception(
+                "'CloneOverlayIds' parameter is set to 'True', "
+                "but NSX-V details are not provided in user input file")
+
+        # Fetching target NSXT and source NSXV pool ranges concurrently as they are retrieved from different managers
+        # separate thread object is used as this validation runs on worker thread of thread object
+        threadObj = Thread(maxNumberOfThreads=2)
+        threadObj.spawnThread(nsxtObj.getNsxtVniPoolRanges, threadName=threading.current_thread().name)
+        threadObj.spawnThread(nsxvObj.getNsxvVniPoolRanges, threadName=threading.current_thread().name)
+        # halt the current thread till all the threads complete execution
+        threadObj.joinThreads()
+        if threadObj.stop():
+            raise Exception('Failed to get NSX-T and NSX-V VNI pool ranges')
+        targetVNIPoolRanges = threadObj.returnValues['getNsxtVniPoolRanges']
+        sourceVNIPoolRanges = threadObj.returnValues['getNsxvVniPoolRanges']
+
+        # Target ranges are merged, so every source range must lie within a single target range
+        for start, end in sourceVNIPoolRanges:
+            # index of last target range starting at or before the source range
+            index = bisect.bisect_right(targetVNIPoolRanges, (start, float('inf'))) - 1
+            if index < 0 or targetVNIPoolRanges[index][1] < end:
                 raise Exception("All the source NSX-V Segment IDs are not present in target NSX-T VNI pools")
-            else:
-                logger.debug('Validated successfully that the source NSX-V VNI pool is subset of target NSX-T VNI pools')
-        except:
-            raise
+        else:
+            logger.debug('Validated successfully that the source NSX-V VNI pool is subset of target NSX-T VNI pools')
 
     @description("Checking Bridging Components")
     @remediate
@@ -5663,17 +5975,24 @@ class VCDMigrationValidation:
                       vcenterObj  -  Object of vCenter operations class holding all functions related to vCenter (OBJECT)
                       vcdObjList  -  Objects of vCD operations class holding all functions related to vCD (OBJECT)
         """
+        # thread name is restored on failure too, so that later log lines are not tagged as bridging checks
+        threadName = threading.current_thread().name
         try:
-            orgVdcNetworkList = list()
+            # networks of org vdcs are retrieved concurrently
             for sourceOrgVDCId in orgVDCIDList:
-                orgVdcNetworkList += self.getOrgVDCNetworks(sourceOrgVDCId, 'sourceOrgVDCNetworks', saveResponse=False)
-            orgVdcNetworkList = list(filter(lambda network: network['networkType'] != 'DIRECT', orgVdcNetworkList))
+                self.thread.spawnThread(self.getOrgVDCNetworks, sourceOrgVDCId, 'sourceOrgVDCNetworks',
+                                        saveResponse=False, saveOutputKey=sourceOrgVDCId)
+            # halt the main thread till all the threads complete execution
+            self.thread.joinThreads()
+            if self.thread.stop():
+                raise Exception('Failed to get source Org VDC networks')
+            orgVdcNetworkList = [
+                network for sourceOrgVDCId in orgVDCIDList for network in self.thread.returnValues[sourceOrgVDCId]
+                if network['networkType'] != 'DIRECT']
             if orgVdcNetworkList:
                 # Checking if any org vdc has network pool with VXLAN backing
-                vxlanBackingPresent = any([True if
-                                           vcdObj.getSourceNetworkPoolBacking() == vcdConstants.VXLAN
-                                           else False
-                                           for vcdObj in vcdObjList])
+                vxlanBackingPresent = any(vcdObj.getSourceNetworkPoolBacking() == vcdConstants.VXLAN
+                                          for vcdObj in vcdObjList)
                 threading.current_thread().name = "BridgingChecks"
                 logger.info("Checking for Bridging Components")
 
@@ -5693,10 +6012,8 @@ class VCDMigrationValidation:
                 nsxtObj.validateEdgeNodesNotInUse(inputDict, orgVdcNetworkList, vcdObjList)
                 logger.info("Successfully completed checks for Bridging Components")
 
-        except:
-            raise
-        else:
-            threading.current_thread().name = "MainThread"
+        finally:
+            threading.current_thread().name = threadName
 
     @description("Performing OrgVDC related validations")
     @remediate
@@ -5711,14 +6028,23 @@ class VCDMigrationValidation:
         # Flag to check whether the org vdc was disabled or not
         disableOrgVDC = False
         try:
-            logger.info(f'Starting with PreMigration validation tasks for org vdc "{self.orgVdcInput["OrgVDCName"]}"')
+            # input values used across the validations
+            orgVDCName = self.orgVdcInput["OrgVDCName"]
+            sourceProviderVDCName = self.orgVdcInput["NSXVProviderVDCName"]
+            targetProviderVDCName = self.orgVdcInput["NSXTProviderVDCName"]
+            edgeGatewayDeploymentEdgeCluster = self.orgVdcInput.get('EdgeGatewayDeploymentEdgeCluster', None)
+            vcdInput = inputDict["VCloudDirector"]
+            cloneOverlayIds = vcdInput.get("CloneOverlayIds")
+            dummyExternalNetworkName = vcdInput.get("DummyExternalNetwork")
+
+            logger.info(f'Starting with PreMigration validation tasks for org vdc "{orgVDCName}"')
 
             logger.info('Validating NSX-T manager details')
             self.getNsxDetails(inputDict["NSXT"]["Common"]["ipAddress"])
 
             # validating whether target org vdc with same name as that of source org vdc exists
             logger.info("Validating whether target Org VDC already exists")
-            self.validateNoTargetOrgVDCExists(self.orgVdcInput["OrgVDCName"])
+            self.validateNoTargetOrgVDCExists(orgVDCName)
 
             # Getting Org VDC Edge Gateway Id
             sourceEdgeGatewayData = self.getOrgVDCEdgeGateway(sourceOrgVDCId)
@@ -5733,12 +6059,12 @@ class VCDMigrationValidation:
             self.getTargetExternalNetworks(sourceEdgeGatewayData, validateVRF=True)
 
             # getting the source dummy External Network details
-            logger.info('Getting the source dummy External Network - {} details.'.format(inputDict["VCloudDirector"].get("DummyExternalNetwork")))
-            self.getDummyExternalNetwork(inputDict["VCloudDirector"].get("DummyExternalNetwork"))
+            logger.info('Getting the source dummy External Network - {} details.'.format(dummyExternalNetworkName))
+            self.getDummyExternalNetwork(dummyExternalNetworkName)
 
             # getting the source provider VDC details and checking if its NSX-V backed
-            logger.info('Getting the source Provider VDC - {} details.'.format(self.orgVdcInput["NSXVProviderVDCName"]))
-            sourceProviderVDCId, isNSXTbacked = self.getProviderVDCId(self.orgVdcInput["NSXVProviderVDCName"])
+            logger.info('Getting the source Provider VDC - {} details.'.format(sourceProviderVDCName))
+            sourceProviderVDCId, isNSXTbacked = self.getProviderVDCId(sourceProviderVDCName)
             self.getProviderVDCDetails(sourceProviderVDCId, isNSXTbacked)
 
             # validating provider gateways
@@ -5747,7 +6073,7 @@ class VCDMigrationValidation:
 
             # validating the source network pool backing
             logger.info("Validating Source Network Pool backing")
-            self.validateSourceNetworkPools(cloneOverlayIds=inputDict["VCloudDirector"].get("CloneOverlayIds"))
+            self.validateSourceNetworkPools(cloneOverlayIds=cloneOverlayIds)
 
             # validating whether source org vdc is NSX-V backed
             logger.info('Validating whether source Org VDC is NSX-V backed')
@@ -5755,27 +6081,27 @@ class VCDMigrationValidation:
 
             #  getting the target provider VDC details and checking if its NSX-T backed
             logger.info(
-                'Getting the target Provider VDC - {} details.'.format(self.orgVdcInput["NSXTProviderVDCName"]))
-            targetProviderVDCId, isNSXTbacked = self.getProviderVDCId(self.orgVdcInput["NSXTProviderVDCName"])
+                'Getting the target Provider VDC - {} details.'.format(targetProviderVDCName))
+            targetProviderVDCId, isNSXTbacked = self.getProviderVDCId(targetProviderVDCName)
             self.getProviderVDCDetails(targetProviderVDCId, isNSXTbacked)
 
             # validating hardware version of source and target Provider VDC
-            logging.info('Validating Hardware version of Source Provider VDC: {} and Target Provider VDC: {}'.format(
-                self.orgVdcInput["NSXVProviderVDCName"], self.orgVdcInput["NSXTProviderVDCName"]))
+            logger.info('Validating Hardware version of Source Provider VDC: {} and Target Provider VDC: {}'.format(
+                sourceProviderVDCName, targetProviderVDCName))
             self.validateHardwareVersion()
 
             # validating if the target provider vdc is enabled or not
             logger.info(
-                'Validating Target Provider VDC {} is enabled'.format(self.orgVdcInput["NSXTProviderVDCName"]))
+                'Validating Target Provider VDC {} is enabled'.format(targetProviderVDCName))
             self.validateTargetProviderVdc()
 
             # disable the source Org VDC so that operations cant be performed on it
-            logger.info('Disabling the source Org VDC - {}'.format(self.orgVdcInput["OrgVDCName"]))
+            logger.info('Disabling the source Org VDC - {}'.format(orgVDCName))
             disableOrgVDC = self.disableOrgVDC(sourceOrgVDCId)
 
             # validating the source org vdc placement policies exist in target PVDC also
             logger.info('Validating whether source org vdc - {} placement policies are present in target PVDC'.format(
-                self.orgVdcInput["OrgVDCName"]))
+                orgVDCName))
             self.validateVMPlacementPolicy(sourceOrgVDCId)
 
             # validating whether source and target P-VDC have same vm storage profiles
@@ -5783,7 +6109,7 @@ class VCDMigrationValidation:
             self.validateStorageProfiles()
 
             logger.info("Validating Edge cluster for target edge gateway deployment")
-            self.validateEdgeGatewayDeploymentEdgeCluster(self.orgVdcInput.get('EdgeGatewayDeploymentEdgeCluster', None), nsxtObj)
+            self.validateEdgeGatewayDeploymentEdgeCluster(edgeGatewayDeploymentEdgeCluster, nsxtObj)
 
             # getting the source External Network details
             logger.info('Getting the source External Network details.')
@@ -5818,7 +6144,7 @@ class VCDMigrationValidation:
             self.validateOrgVDCNetworkSubnetConflict()
 
             # getting the source Org VDC networks
-            logger.info('Getting the Org VDC networks of source Org VDC {}'.format(self.orgVdcInput["OrgVDCName"]))
+            logger.info('Getting the Org VDC networks of source Org VDC {}'.format(orgVDCName))
             orgVdcNetworkList = self.getOrgVDCNetworks(sourceOrgVDCId, 'sourceOrgVDCNetworks')
 
             # Validating static Ip pool for OrgVDC network.
@@ -5830,7 +6156,6 @@ class VCDMigrationValidation:
             self.getOrgVDCNetworkDHCPConfig(orgVdcNetworkList)
 
             # validating whether DHCP is enabled on source Isolated Org VDC network
-            edgeGatewayDeploymentEdgeCluster = self.orgVdcInput.get('EdgeGatewayDeploymentEdgeCluster', None)
             self.validateDHCPEnabledonIsolatedVdcNetworks(orgVdcNetworkList, sourceEdgeGatewayIdList, edgeGatewayDeploymentEdgeCluster,nsxtObj)
 
             # validating whether any org vdc network is shared or not
@@ -5839,27 +6164,28 @@ class VCDMigrationValidation:
 
             # validating whether any source org vdc network is not direct network
             logger.info('Validating Source OrgVDC Direct networks')
-            providerVDCImportedNeworkTransportZone = inputDict["VCloudDirector"].get("ImportedNetworkTransportZone", None)
+            providerVDCImportedNeworkTransportZone = vcdInput.get("ImportedNetworkTransportZone", None)
 
             self.validateOrgVDCNetworkDirect(orgVdcNetworkList, providerVDCImportedNeworkTransportZone, nsxtObj)
 
-            # validating NSX-V and NSX-T VNI pool ranges
-            logger.info('Validating whether the source NSX-V Segment ID Pool is subset of target NSX-T VNI pool or not')
-            self.validateVniPoolRanges(nsxtObj, nsxvObj,
-                                       cloneOverlayIds=inputDict['VCloudDirector'].get('CloneOverlayIds'))
-
-            # validating target external network pools
             nsxtNetworkPoolName = self.orgVdcInput.get('NSXTNetworkPoolName', None)
-            logger.info('Validating Target NSXT backed Network Pools')
-            self.validateTargetPvdcNetworkPools(nsxtNetworkPoolName)
-
-            # validating cross vdc networking
-            logger.info('Validating Cross VDC Networking is enabled or not')
-            self.validateCrossVdcNetworking(sourceOrgVDCId)
-
-            # validating published catalogs
-            logger.info("Validating published/subscribed catalogs")
-            self.getOrgVDCPublishedCatalogs(sourceOrgVDCId, inputDict['VCloudDirector']['Organization']['OrgName'])
+            # validating NSX-V and NSX-T VNI pool ranges, target external network pools, cross vdc networking and
+            # published catalogs, these only read the details retrieved above so they are run concurrently
+            independentValidations = [
+                ('Validating Target NSXT backed Network Pools',
+                 self.validateTargetPvdcNetworkPools, (nsxtNetworkPoolName,)),
+                ('Validating Cross VDC Networking is enabled or not',
+                 self.validateCrossVdcNetworking, (sourceOrgVDCId,)),
+                ('Validating published/subscribed catalogs',
+                 self.getOrgVDCPublishedCatalogs,
+                 (sourceOrgVDCId, vcdInput['Organization']['OrgName'])),
+            ]
+            # VNI pools are validated only when overlay ids are cloned, which is supported from vCD 10.3.1
+            if cloneOverlayIds and self.versionNumber >= ANDROMEDA_10_3_1_VERSION:
+                independentValidations.insert(0, (
+                    'Validating whether the source NSX-V Segment ID Pool is subset of target NSX-T VNI pool or not',
+                    self.validateVniPoolRanges, (nsxtObj, nsxvObj, cloneOverlayIds)))
+            self._runIndependentValidations(independentValidations)
 
         except:
             # Enabling source Org VDC if premigration validation fails
@@ -5869,6 +6195,37 @@ class VCDMigrationValidation:
         else:
             return True
 
+    def _runIndependentValidations(self, validations):
+        """
+        Description :   Runs validations which do not depend on each other on the worker threads of thread object
+                        Exception of the first failed validation in the given order is raised once all of them finish
+        Parameters  :   validations - tuples of log message, validation method and its arguments (LIST)
+        """
+        # session is renewed here once, otherwise every worker thread would re-login concurrently on expiry
+        getSession(self)
+        for message, validation, args in validations:
+            self.thread.spawnThread(self._runIndependentValidation, message, validation, *args,
+                                    saveOutputKey=message, threadName=self.vdcName)
+        # halt the main thread till all the threads complete execution
+        self.thread.joinThreads()
+        for message, _, _ in validations:
+            if isinstance(self.thread.returnValues.get(message), Exception):
+                raise self.thread.returnValues[message]
+
+    def _runIndependentValidation(self, message, validation, *args):
+        """
+        Description :   Runs a validation on worker thread and logs its message when it starts
+        Parameters  :   message - log message of validation (STRING)
+                        validation - validation method (METHOD)
+                        args - arguments of validation method
+        Returns     :   Exception raised by validation if it fails (EXCEPTION)
+        """
+        logger.info(message)
+        try:
+            validation(*args)
+        except Exception as err:
+            return err
+
     @description("Performing services related validations")
     @remediate
     def servicesValidations(self, sourceOrgVDCId, nsxtObj, nsxvObj):
@@ -5878,22 +6235,18 @@ class VCDMigrationValidation:
                       nsxtObj        -  Object of NSXT operations class holding all functions related to NSXT (OBJECT)
                       nsxvObj        -  Object of NSXV operations class holding all functions related to NSXV (OBJECT)
         """
-        try:
-            # if NSXTProviderVDCNoSnatDestinationSubnet is passed to sampleInput else set it to None
-            noSnatDestSubnet = self.orgVdcInput.get("NoSnatDestinationSubnet")
+        # if NSXTProviderVDCNoSnatDestinationSubnet is passed to sampleInput else set it to None
+        noSnatDestSubnet = self.orgVdcInput.get("NoSnatDestinationSubnet")
 
-            # get distributed firewall configuration
-            logger.info('Validating Distributed Firewall configuration')
-            dfwConfigReturn = self.getDistributedFirewallConfig(sourceOrgVDCId, validation=True)
-            if isinstance(dfwConfigReturn, Exception):
-                raise dfwConfigReturn
+        # get distributed firewall configuration
+        logger.info('Validating Distributed Firewall configuration')
+        dfwConfigReturn = self.getDistributedFirewallConfig(sourceOrgVDCId, validation=True)
+        if isinstance(dfwConfigReturn, Exception):
+            raise dfwConfigReturn
 
-            # get the list of services configured on source Edge Gateway
-            self.getEdgeGatewayServices(nsxtObj, nsxvObj, noSnatDestSubnet)
-        except:
-            raise
-        else:
-            return True
+        # get the list of services configured on source Edge Gateway
+        self.getEdgeGatewayServices(nsxtObj, nsxvObj, noSnatDestSubnet)
+        return True
 
     @description("Performing vApp related validations")
     @remediate
@@ -5902,66 +6255,65 @@ class VCDMigrationValidation:
         Description : Pre migration validation tasks related to vApps present in org vdc
         Parameters  : sourceOrgVDCId -  ID of source org vdc (STRING)
         """
-        try:
-            # validating whether vApp name exceeds 118 character limit
-            logger.info('Validating whether vApp name exceeds 118 character limit')
-            self.validateVappNameLength(sourceOrgVDCId)
+        # vApps might have changed since last validation
+        self.clearVappDetailsCache(sourceOrgVDCId)
 
-            # validating whether there are empty vapps in source org vdc
-            logger.info('Validating if empty vApps or vApps in failed creation/unresolved/unrecognized/inconsistent state do not exist in source org VDC')
-            self.validateNoEmptyVappsExistInSourceOrgVDC(sourceOrgVDCId)
+        # validating whether vApp name exceeds 118 character limit
+        logger.info('Validating whether vApp name exceeds 118 character limit')
+        self.validateVappNameLength(sourceOrgVDCId)
 
-            # validating the source org vdc does not have any suspended state vms in any of the vapps
-            logger.info('Validating VMs/vApps in suspended/partially suspended state or '
-                        'in maintenance mode do not exists in source OrgVDC')
-            self.validateSourceSuspendedVMsInVapp(sourceOrgVDCId)
+        # validating whether there are empty vapps in source org vdc
+        logger.info('Validating if empty vApps or vApps in failed creation/unresolved/unrecognized/inconsistent state do not exist in source org VDC')
+        self.validateNoEmptyVappsExistInSourceOrgVDC(sourceOrgVDCId)
 
-            # Validating if fencing is enabled on vApps in source OrgVDC
-            logger.info('Validating if fencing is enabled on vApps in source OrgVDC')
-            self.validateVappFencingMode(sourceOrgVDCId)
+        # validating the source org vdc does not have any suspended state vms in any of the vapps
+        logger.info('Validating VMs/vApps in suspended/partially suspended state or '
+                    'in maintenance mode do not exists in source OrgVDC')
+        self.validateSourceSuspendedVMsInVapp(sourceOrgVDCId)
 
-            # validating that No vApps have its own vApp Networks
-            logger.info('Validating routed vApp Networks')
-            self.validateRoutedVappNetworks(sourceOrgVDCId, nsxtObj=nsxtObj)
+        # Validating if fencing is enabled on vApps in source OrgVDC
+        logger.info('Validating if fencing is enabled on vApps in source OrgVDC')
+        self.validateVappFencingMode(sourceOrgVDCId)
 
-            # validating that No vApps have isolated networks with dhcp configured
-            logger.info('Validating isolated vApp networks with DHCP enabled')
-            self.validateDHCPOnIsolatedvAppNetworks(sourceOrgVDCId, self.orgVdcInput.get('EdgeGatewayDeploymentEdgeCluster', None), nsxtObj)
+        # validating that No vApps have its own vApp Networks
+        logger.info('Validating routed vApp Networks')
+        self.validateRoutedVappNetworks(sourceOrgVDCId, nsxtObj=nsxtObj)
 
-            logger.info("Validating Independent Disks")
-            self.validateIndependentDisks(sourceOrgVDCId)
+        # validating that No vApps have isolated networks with dhcp configured
+        logger.info('Validating isolated vApp networks with DHCP enabled')
+        self.validateDHCPOnIsolatedvAppNetworks(sourceOrgVDCId, self.orgVdcInput.get('EdgeGatewayDeploymentEdgeCluster', None), nsxtObj)
 
-            logger.info('Validating a VM does not have independent disks with different storage policies when fast provisioning is enabled')
-            self.validateNamedDiskWithFastProvisioned(sourceOrgVDCId)
+        logger.info("Validating Independent Disks")
+        self.validateIndependentDisks(sourceOrgVDCId)
 
-            logger.info('Validating whether media is attached to any vApp VMs')
-            self.validateVappVMsMediaNotConnected(sourceOrgVDCId)
+        logger.info('Validating a VM does not have independent disks with different storage policies when fast provisioning is enabled')
+        self.validateNamedDiskWithFastProvisioned(sourceOrgVDCId)
 
-            # get the affinity rules of source Org VDC
-            logger.info('Getting the VM affinity rules of source Org VDC {}'.format(self.orgVdcInput["OrgVDCName"]))
-            self.getOrgVDCAffinityRules(sourceOrgVDCId)
+        logger.info('Validating whether media is attached to any vApp VMs')
+        self.validateVappVMsMediaNotConnected(sourceOrgVDCId)
 
-            # disabling Affinity rules
-            logger.info('Disabling source Org VDC affinity rules if its enabled')
-            self.disableSourceAffinityRules()
-        except:
-            raise
-        else:
-            return True
+        # get the affinity rules of source Org VDC
+        logger.info('Getting the VM affinity rules of source Org VDC {}'.format(self.orgVdcInput["OrgVDCName"]))
+        self.getOrgVDCAffinityRules(sourceOrgVDCId)
+
+        # disabling Affinity rules
+        logger.info('Disabling source Org VDC affinity rules if its enabled')
+        self.disableSourceAffinityRules()
+        return True
 
     def checkVlanSegmentFromMultipleVDCs(self, vcdObjList):
         """
         Description : Validation vlan segment backed to multiple edge gateways belonging to dofferent VDCs
         """
-        if float(self.version) < float(vcdConstants.API_VERSION_CASTOR_10_4_1) or len(vcdObjList) == 1:
+        if self.versionNumber < CASTOR_10_4_1_VERSION or len(vcdObjList) == 1:
             return
-        segmentList = list()
+        seenSegments = set()
         for vcdObj in vcdObjList:
             for segment in vcdObj.rollback.apiData.get('vlanSegmentToGatewayMapping', {}):
-                segmentList.append(segment)
-        if len(set(segmentList)) < len(segmentList):
-            raise Exception("Multiple edge gateways from Org VDCs are trying to connect to segment backed network."
-                            "Only 1 edge gateways can be connected to segment backed network")
+                if segment in seenSegments:
+                    raise Exception("Multiple edge gateways from Org VDCs are trying to connect to segment backed network."
+                                    "Only 1 edge gateways can be connected to segment backed network")
+                seenSegments.add(segment)
 
     def updateEdgeGatewayInputDict(self, sourceOrgVDCId):
         """
@@ -5969,11 +6321,12 @@ class VCDMigrationValidation:
         Parameters  : sourceOrgVDCId -  ID of source org vdc (STRING)
         """
         # validations at org vdc level
-        errorList = self.validateEdgeGatewayInputFields(self.orgVdcInput, self.orgVdcInput.get("OrgVDCName"), skipbgpinput=self.orgVdcInput.get("SkipBGPMigration", False))
+        skipBGPMigration = self.orgVdcInput.get("SkipBGPMigration", False)
+        errorList = self.validateEdgeGatewayInputFields(self.orgVdcInput, self.orgVdcInput.get("OrgVDCName"), skipbgpinput=skipBGPMigration)
 
         # validations at EdgeGateway level
         for EdgeGateway, value in self.orgVdcInput.get('EdgeGateways', {}).items():
-            errorList.extend(self.validateEdgeGatewayInputFields(value, EdgeGateway, skipbgpinput=self.orgVdcInput.get("SkipBGPMigration", False)))
+            errorList.extend(self.validateEdgeGatewayInputFields(value, EdgeGateway, skipbgpinput=skipBGPMigration))
 
         if errorList:
             logger.error('\n'.join(errorList))
@@ -5991,18 +6344,13 @@ class VCDMigrationValidation:
             'NonDistributedNetworks': self.orgVdcInput.get('NonDistributedNetworks', False),
             'serviceNetworkDefinition': self.orgVdcInput.get('serviceNetworkDefinition', '192.168.255.255/27'),
         }
+        edgeGateways = self.orgVdcInput.setdefault('EdgeGateways', {})
         for egw in self.getOrgVDCEdgeGateway(sourceOrgVDCId):
-            self.orgVdcInput.setdefault('EdgeGateways', {})
-            if egw['name'] in self.orgVdcInput.get('EdgeGateways', {}):
-                self.orgVdcInput['EdgeGateways'][egw['name']] = {
-                    **edgeGwInputs,
-                    **self.orgVdcInput['EdgeGateways'].get(egw['name'], {})
-                }
-            else:
-                self.orgVdcInput['EdgeGateways'][egw['name']] = {
-                    **edgeGwInputs
-                }
-        logger.debug(self.orgVdcInput.get('EdgeGateways'))
+            edgeGateways[egw['name']] = {
+                **edgeGwInputs,
+                **edgeGateways.get(egw['name'], {})
+            }
+        logger.debug(edgeGateways)
 
     @staticmethod
     def validateEdgeGatewayInputFields(edgeGatewayFields, entity, skipbgpinput=False):
@@ -6016,16 +6364,14 @@ class VCDMigrationValidation:
         if edgeGatewayFields.get('NoSnatDestinationSubnet'):
             if isinstance(edgeGatewayFields.get('NoSnatDestinationSubnet'), list):
                 for NoSnatDestAddr in edgeGatewayFields.get('NoSnatDestinationSubnet'):
-                    if edgeGatewayFields.get('NoSnatDestinationSubnet'):
-                        try:
-                            ipaddress.ip_network(NoSnatDestAddr)
-                            ipAdd = NoSnatDestAddr.split('/')[0]
-                            if not isinstance(ipaddress.ip_address(ipAdd), ipaddress.IPv4Address):
-                                errorList.append('NoSnatDestinationSubnet field has invalid IPv4 IP.')
-                        except ValueError as e:
-                            errorList.append(
-                                "NoSnatDestinationSubnet value  for {} is not in proper CIDR format. {}".format(
-                                    entity, e))
+                    try:
+                        # version of network is that of its address, so CIDR is parsed once for both checks
+                        if ipaddress.ip_network(NoSnatDestAddr).version != 4:
+                            errorList.append('NoSnatDestinationSubnet field has invalid IPv4 IP.')
+                    except ValueError as e:
+                        errorList.append(
+                            "NoSnatDestinationSubnet value  for {} is not in proper CIDR format. {}".format(
+                                entity, e))
             else:
                 errorList.append(
                     "NoSnatDestinationSubnet value  for {} is not in valid format, please provide in the list format".format(
@@ -6036,66 +6382,23 @@ class VCDMigrationValidation:
                 "SkipBGPMigration and AdvertisedRoutedNetworks both cannot be TRUE incase of skip bgp for Edge Gateway {}".format(
                     entity))
 
-        # validation for LoadBalancerVIPSubnet
-        if edgeGatewayFields.get('LoadBalancerVIPSubnet'):
+        # validation for CIDR format and IP version of load balancer subnets
+        for fieldName, ipVersion, invalidVersionMessage in EDGE_GATEWAY_CIDR_FIELDS:
+            fieldValue = edgeGatewayFields.get(fieldName)
+            if not fieldValue:
+                continue
             try:
-                LoadBalancerVIPSubnetData = edgeGatewayFields.get('LoadBalancerVIPSubnet')
-                # validate CIDR format
-                ipaddress.ip_network(LoadBalancerVIPSubnetData, strict=False)
-                ipAdd = LoadBalancerVIPSubnetData.split('/')[0]
-                # Validate IPV4 only.
-                if not isinstance(ipaddress.ip_address(ipAdd), ipaddress.IPv4Address):
-                    errorList.append("LoadBalancerVIPSubnetData field has invalid IPV4 IP.")
+                if ipaddress.ip_network(fieldValue, strict=False).version != ipVersion:
+                    errorList.append(invalidVersionMessage)
             except ValueError as e:
-                errorList.append("LoadBalancerVIPSubnet value  for {} is not in proper CIDR format. {}".format(
-                    entity, e))
+                errorList.append("{} value  for {} is not in proper CIDR format. {}".format(fieldName, entity, e))
 
-        # validation for LoadBalancerServiceNetwork
-        if edgeGatewayFields.get('LoadBalancerServiceNetwork'):
-            try:
-                LoadBalancerServiceNetworkData = edgeGatewayFields.get('LoadBalancerServiceNetwork')
-                # validate CIDR format
-                ipaddress.ip_network(LoadBalancerServiceNetworkData, strict=False)
-                ipAdd = LoadBalancerServiceNetworkData.split('/')[0]
-                # Validate IPV4 only.
-                if not isinstance(ipaddress.ip_address(ipAdd), ipaddress.IPv4Address):
-                    errorList.append("LoadBalancerServiceNetwork field has invalid IPV4 IP.")
-            except ValueError as e:
+        # validation for boolean fields
+        for fieldName, displayName in EDGE_GATEWAY_BOOLEAN_FIELDS:
+            if not isinstance(edgeGatewayFields.get(fieldName, False), bool):
                 errorList.append(
-                    "LoadBalancerServiceNetwork value  for {} is not in proper CIDR format. {}".format(
-                        entity, e))
-
-        # validation for LoadBalancerServiceNetworkIPv6
-        if edgeGatewayFields.get('LoadBalancerServiceNetworkIPv6'):
-            try:
-                LoadBalancerServiceNetworkIPv6Data = edgeGatewayFields.get('LoadBalancerServiceNetworkIPv6')
-                # validate CIDR format
-                ipaddress.ip_network(LoadBalancerServiceNetworkIPv6Data, strict=False)
-                ipAdd = LoadBalancerServiceNetworkIPv6Data.split('/')[0]
-                # Validate IPV6 only.
-                if not isinstance(ipaddress.ip_address(ipAdd), ipaddress.IPv6Address):
-                    errorList.append("LoadBalancerServiceNetworkIPv6 field has invalid IPV6 IP.")
-            except ValueError as e:
-                errorList.append("LoadBalancerServiceNetworkIPv6 value  for {} is not in proper CIDR format. {}".format(
-                    entity, e))
-
-        # validation for AdvertiseRoutedNetworks
-        if not isinstance(edgeGatewayFields.get('AdvertiseRoutedNetworks', False), bool):
-            errorList.append(
-                "AdvertiseRoutedNetworks for {} is not in valid format, please provide it in the Boolean format".format(
-                    entity))
-
-        # validation for SkipBGPMigration
-        if not isinstance(edgeGatewayFields.get('SkipBGPMigration', False), bool):
-            errorList.append(
-                "SkipBGPMigration for {} is not in valid format, please provide it in the Boolean format".format(
-                    entity))
-
-        # validation for NonDistributedNetworks
-        if not isinstance(edgeGatewayFields.get('NonDistributedNetworks', False), bool):
-            errorList.append(
-                "NonDistributedNetwork for {} is not in valid format, please provide it in the Boolean format".format(
-                    entity))
+                    "{} for {} is not in valid format, please provide it in the Boolean format".format(
+                        displayName, entity))
         return errorList
 
     def preMigrationValidation(self, inputDict, sourceOrgVDCId, nsxtObj, nsxvObj, vcdObjList, validateVapp=False, validateServices=False):
@@ -6112,6 +6415,9 @@ class VCDMigrationValidation:
             # Replacing thread name with org vdc name
             threading.current_thread().name = self.vdcName
 
+            # IP Spaces might have changed since last validation
+            self._providerGatewayIpSpaces.clear()
+
             self.getNsxDetails(inputDict["NSXT"]["Common"]["ipAddress"])
 
             if any([
@@ -6129,31 +6435,39 @@ class VCDMigrationValidation:
             logger.error(traceback.format_exc())
             raise
 
-    @isSessionExpired
-    def checkSameExternalNetworkUsedByOtherVDC(self, sourceOrgVDC, inputDict, externalNetworkName):
+    @staticmethod
+    def getOrgVdcNamesByExternalNetwork(inputDict):
         """
-        Description :   Validate if the External network is dedicatedly used by any other Org VDC edge gateway mentioned in the user specs file.
+        Description :   Maps external networks to Org VDCs using them at Org VDC or edge gateway level in the user specs file.
+        Parameters  :   inputDict - dictionary of all the input yaml file key/values (DICT)
+        Returns     :   Org VDC names in order of user specs file keyed by external network name (DICT)
         """
-        orgVdcNameList = list()
+        orgVdcNamesByExternalNetwork = defaultdict(list)
         for vdc in inputDict['VCloudDirector']['SourceOrgVDC']:
-            if vdc['OrgVDCName'] == sourceOrgVDC:
-                continue
-
             # Check at org VDC level
-            if vdc.get('Tier0Gateways') == externalNetworkName:
-                orgVdcNameList.append(vdc['OrgVDCName'])
-                continue
+            externalNetworkNames = OrderedDict.fromkeys([vdc.get('Tier0Gateways')])
 
             # Check at edge GW level
-            if not isinstance(vdc.get('EdgeGateways', {}), dict):
-                continue
+            if isinstance(vdc.get('EdgeGateways', {}), dict):
+                externalNetworkNames.update(
+                    (egw.get('Tier0Gateways'), None) for egw in vdc.get('EdgeGateways', {}).values())
 
-            for egw in vdc.get('EdgeGateways', {}).values():
-                if egw.get('Tier0Gateways') == externalNetworkName:
-                    orgVdcNameList.append(vdc['OrgVDCName'])
-                    break
+            for externalNetworkName in externalNetworkNames:
+                if externalNetworkName:
+                    orgVdcNamesByExternalNetwork[externalNetworkName].append(vdc['OrgVDCName'])
+        return orgVdcNamesByExternalNetwork
 
-        return orgVdcNameList
+    @isSessionExpired
+    def checkSameExternalNetworkUsedByOtherVDC(self, sourceOrgVDC, inputDict, externalNetworkName,
+                                               orgVdcNamesByExternalNetwork=None):
+        """
+        Description :   Validate if the External network is dedicatedly used by any other Org VDC edge gateway mentioned in the user specs file.
+        Parameters  :   orgVdcNamesByExternalNetwork - mapping from getOrgVdcNamesByExternalNetwork, built from inputDict if not provided (DICT)
+        """
+        if orgVdcNamesByExternalNetwork is None:
+            orgVdcNamesByExternalNetwork = self.getOrgVdcNamesByExternalNetwork(inputDict)
+        return [orgVdcName for orgVdcName in orgVdcNamesByExternalNetwork.get(externalNetworkName, [])
+                if orgVdcName != sourceOrgVDC]
 
     @isSessionExpired
     def validateDedicatedExternalNetwork(self, inputDict):
@@ -6174,10 +6488,22 @@ class VCDMigrationValidation:
             if self.orgVdcInput.get("SkipBGPMigration", False):
                 return
 
-            for sourceEdgeGateway in self.rollback.apiData['sourceEdgeGateway']:
-                sourceEdgeGatewayId = sourceEdgeGateway['id'].split(':')[-1]
-                bgpConfigDict = self.getEdgegatewayBGPconfig(sourceEdgeGatewayId, validation=False)
+            sourceEdgeGateways = self.rollback.apiData['sourceEdgeGateway']
+            # BGP configs of edge gateways are retrieved concurrently, validations below update shared metadata so
+            # they are still performed one edge gateway at a time
+            for sourceEdgeGateway in sourceEdgeGateways:
+                self.thread.spawnThread(self.getEdgegatewayBGPconfig, sourceEdgeGateway['id'].split(':')[-1],
+                                        validation=False, saveOutputKey=sourceEdgeGateway['id'])
+            # halt the main thread till all the threads complete execution
+            self.thread.joinThreads()
+            if self.thread.stop():
+                raise Exception('Failed to get BGP configuration of source edge gateways')
+            bgpConfigs = [self.thread.returnValues[sourceEdgeGateway['id']] for sourceEdgeGateway in sourceEdgeGateways]
 
+            # Org VDCs using each external network in user specs file, checked for every edge gateway below
+            orgVdcNamesByExternalNetwork = self.getOrgVdcNamesByExternalNetwork(inputDict)
+
+            for sourceEdgeGateway, bgpConfigDict in zip(sourceEdgeGateways, bgpConfigs):
                 externalNetworkName = self.orgVdcInput['EdgeGateways'][sourceEdgeGateway['name']]['Tier0Gateways']
                 if not externalNetworkName:
                     continue
@@ -6191,36 +6517,52 @@ class VCDMigrationValidation:
                 if targetExternalNetwork.get('usingIpSpace'):
                     self._validateIpSpaceTier0ForBGP(targetExternalNetwork, sourceEdgeGateway, bgpConfigDict, errorList)
                 else:
-                    self._validateNonIpSpaceTier0ForBGP(targetExternalNetwork, sourceEdgeGateway,
-                                                        sourceOrgVDC, inputDict, bgpConfigDict, errorList)
+                    self._validateNonIpSpaceTier0ForBGP(targetExternalNetwork, sourceEdgeGateway, sourceOrgVDC, inputDict,
+                                                        bgpConfigDict, errorList, orgVdcNamesByExternalNetwork)
 
             # Only validate dedicated ext-net if source edge gateways are present
             if errorList:
                 raise Exception('; '.join(errorList))
 
-            for extNetName, extNetDetails in data['targetExternalNetwork'].items():
-                if extNetDetails.get('usingIpSpace'):
-                    continue
-                external_network_id = extNetDetails['id']
-                url = "{}{}{}".format(vcdConstants.OPEN_API_URL.format(self.ipAddress), vcdConstants.ALL_EDGE_GATEWAYS,
-                                      vcdConstants.VALIDATE_DEDICATED_EXTERNAL_NETWORK_FILTER.format(
-                                          external_network_id))
-                response = self.restClientObj.get(url, self.headers)
-                if response.status_code == requests.codes.ok:
+            externalNetworkNames = {
+                extNetDetails['id']: extNetName
+                for extNetName, extNetDetails in data['targetExternalNetwork'].items()
+                if not extNetDetails.get('usingIpSpace')
+            }
+            externalNetworkIds = list(externalNetworkNames)
+            # edge gateways connected to any of the external networks in a batch are retrieved by a single filter
+            for index in range(0, len(externalNetworkIds), vcdConstants.DEDICATED_EXTERNAL_NETWORK_BATCH_SIZE):
+                uplinkFilter = ','.join(
+                    vcdConstants.EDGE_GATEWAY_UPLINK_ID_FILTER.format(externalNetworkId) for externalNetworkId in
+                    externalNetworkIds[index:index + vcdConstants.DEDICATED_EXTERNAL_NETWORK_BATCH_SIZE])
+                pageNo = 1
+                pageSizeCount = 0
+                resultTotal = 1
+                while pageSizeCount < resultTotal:
+                    url = "{}{}{}".format(vcdConstants.OPEN_API_URL.format(self.ipAddress), vcdConstants.ALL_EDGE_GATEWAYS,
+                                          vcdConstants.VALIDATE_DEDICATED_EXTERNAL_NETWORKS_FILTER.format(
+                                              uplinkFilter, pageNo, vcdConstants.DEDICATED_EXTERNAL_NETWORK_PAGE_SIZE))
+                    response = self.restClientObj.get(url, self.headers)
+                    if response.status_code != requests.codes.ok:
+                        raise Exception("Failed to retrieve edge gateway uplinks")
                     responseDict = response.json()
-                    values = responseDict['values']
-                    # checking whether values is a list if not converting it into a list
-                    values = values if isinstance(values, list) else [values]
+                    values = listify(responseDict['values'])
+                    if not values:
+                        break
                     # iterating all the edge gateways
                     for value in values:
                         # checking whether the dedicated flag is enabled
-                        if value['edgeGatewayUplinks'][0]['dedicated']:
-                            errorList.append(
-                                "Edge Gateway {} are using dedicated external network {} and hence new edge gateway cannot be created.".format(
-                                    value['name'], extNetName))
-                    logger.debug('Validated Successfully, No other edge gateways are using dedicated external network')
-                else:
-                    raise Exception("Failed to retrieve edge gateway uplinks")
+                        if not value['edgeGatewayUplinks'][0]['dedicated']:
+                            continue
+                        for uplink in value['edgeGatewayUplinks']:
+                            if uplink['uplinkId'] in externalNetworkNames:
+                                errorList.append(
+                                    "Edge Gateway {} are using dedicated external network {} and hence new edge gateway cannot be created.".format(
+                                        value['name'], externalNetworkNames[uplink['uplinkId']]))
+                    pageSizeCount += len(values)
+                    resultTotal = responseDict['resultTotal']
+                    pageNo += 1
+            logger.debug('Validated Successfully, No other edge gateways are using dedicated external network')
         except Exception:
             raise
 
@@ -6232,11 +6574,14 @@ class VCDMigrationValidation:
         advertisedEdges = self.rollback.apiData.get("advertiseEdgeNetworks", [])
         bgpEnabled = bgpConfigDict and isinstance(bgpConfigDict, dict) and bgpConfigDict['enabled'] == 'true'
         advertiseRoutedNetworks = self.orgVdcInput['EdgeGateways'][sourceEdgeGateway['name']]['AdvertiseRoutedNetworks']
+        # whether provider gateway is private i.e. dedicated to this organization
+        dedicatedToOrganization = bool(
+            targetExternalNetwork.get("dedicatedOrg") and targetExternalNetwork["dedicatedOrg"].get("id") ==
+            self.rollback.apiData.get("Organization", {}).get("@id"))
 
         if advertiseRoutedNetworks:
             # Private provider gateway is required
-            if not(targetExternalNetwork.get("dedicatedOrg") and targetExternalNetwork.get("dedicatedOrg", {}).get("id") ==
-                    self.rollback.apiData.get("Organization", {}).get("@id")):
+            if not dedicatedToOrganization:
                 errorList.append(
                     "Edge Gateway - {} : 'AdvertiseRoutedNetworks' is set to 'True', so Private Provider"
                     " Gateway dedicated to this Organization is required.".format(sourceEdgeGateway['name']))
@@ -6248,8 +6593,7 @@ class VCDMigrationValidation:
                         bgpRedistributionRule['from']['connected'] == 'true' and \
                         bgpRedistributionRule['action'] == 'permit':
                     # If permitted rule with from type "Connected" rule with prefix type "Any" is present
-                    if not(targetExternalNetwork.get("dedicatedOrg") and targetExternalNetwork.get("dedicatedOrg", {}).get("id") ==
-                           self.rollback.apiData.get("Organization", {}).get("@id")):
+                    if not dedicatedToOrganization:
                         errorList.append(
                             "Edge Gateway - {} : All Routed networks connected to edge are being advertised through BGP, so Private Provider"
                             " Gateway dedicated to this Organization is required.".format(sourceEdgeGateway['name']))
@@ -6276,23 +6620,37 @@ class VCDMigrationValidation:
 
             if sourceIpPrefixData and bgpRedistribution:
                 # Fetching all the IP Space uplinks of Provider Gateway
-                ipSpaces = self.getProviderGatewayIpSpaces(targetExternalNetwork)
+                ipSpaces = self._getProviderGatewayIpSpacesForValidation(targetExternalNetwork)
+                # internal scopes and ip prefixes of public IP Spaces parsed once for all the ip prefixes of edge gateway
+                publicIpSpaceNetworks = {
+                    ipSpace["id"]: (
+                        [ipaddress.ip_network(internalScope, strict=False)
+                         for internalScope in ipSpace.get("ipSpaceInternalScope", [])],
+                        [ipaddress.ip_network("{}/{}".format(
+                            ipSpacePrefix["ipPrefixSequence"][0]["startingPrefixIpAddress"],
+                            ipSpacePrefix["ipPrefixSequence"][0]["prefixLength"]), strict=False)
+                         for ipSpacePrefix in ipSpace.get("ipSpacePrefixes", [])])
+                    for ipSpace in ipSpaces if ipSpace["type"] == "PUBLIC"
+                }
+                # names of ip prefixes redistributed from connected networks, rules without prefix apply to any prefix
+                # and are validated above
+                connectedPrefixNames = {
+                    bgpRedistributionRule['prefixName']
+                    for bgpRedistributionRule in listify((bgpRedistribution.get('rules') or {}).get('rule'))
+                    if bgpRedistributionRule.get('prefixName') and
+                    bgpRedistributionRule.get("from", {}).get("connected") == 'true'}
                 for ipPrefix in listify(sourceIpPrefixData):
-                    if not any([ipPrefix["name"] == bgpRedistributionRule.get('prefixName') and bgpRedistributionRule.get("from", {}).get("connected") == 'true'
-                           for bgpRedistributionRule in listify((bgpRedistribution.get('rules') or {}).get('rule'))]):
+                    if ipPrefix["name"] not in connectedPrefixNames:
                         continue
+                    ipPrefixNetwork = ipaddress.ip_network(ipPrefix["ipAddress"], strict=False)
                     for ipSpace in ipSpaces:
                         if ipSpace["type"] == "PUBLIC":
-                            if any([internalScope for internalScope in ipSpace.get("ipSpaceInternalScope", [])
-                                    if type(ipaddress.ip_network(ipPrefix["ipAddress"], strict=False)) == type(
-                                    ipaddress.ip_network(internalScope, strict=False)) and
-                                    self.subnetOf(ipaddress.ip_network(ipPrefix["ipAddress"], strict=False),
-                                                  ipaddress.ip_network(internalScope, strict=False))]):
-                                if any([ipSpacePrefix for ipSpacePrefix in ipSpace.get("ipSpacePrefixes", [])
-                                        if ipaddress.ip_network(ipPrefix["ipAddress"], strict=False).overlaps(
-                                        ipaddress.ip_network("{}/{}".format(ipSpacePrefix["ipPrefixSequence"][0][
-                                        "startingPrefixIpAddress"], ipSpacePrefix["ipPrefixSequence"][0][
-                                            "prefixLength"]), strict=False))]):
+                            internalScopeNetworks, ipSpacePrefixNetworks = publicIpSpaceNetworks[ipSpace["id"]]
+                            if any(type(ipPrefixNetwork) == type(internalScopeNetwork) and
+                                   self.subnetOf(ipPrefixNetwork, internalScopeNetwork)
+                                   for internalScopeNetwork in internalScopeNetworks):
+                                if any(ipPrefixNetwork.overlaps(ipSpacePrefixNetwork)
+                                       for ipSpacePrefixNetwork in ipSpacePrefixNetworks):
                                     ipSpacePrefixErrorList.append(
                                         "Edge Gateway - {} : IP Prefix - '{}' overlaps with IP Prefix present in IP Space - '{}'"
                                         " uplink connected to Provider Gateway - '{}'".format(sourceEdgeGateway['name'],
@@ -6311,8 +6669,7 @@ class VCDMigrationValidation:
                     # if internalScopeErrorList exists which means there are some prefixes not present in internal scope of public ip space uplinks
                     # So it should be created as private ip space and connect to provider gateway, which means provider gateway should be private to this tenant..
                     # since private ip spaces are available as uplink to only private provider gateways
-                    if not(targetExternalNetwork.get("dedicatedOrg") and targetExternalNetwork.get("dedicatedOrg", {}).get("id") ==
-                           self.rollback.apiData.get("Organization", {}).get("@id")):
+                    if not dedicatedToOrganization:
                         errorList.append(
                             "Edge Gateway - {} : BGP is configured with IP Prefixes - {} which does not"
                             " belong to any internal scopes of public IP Space uplinks of Provider Gateway, either"
@@ -6333,7 +6690,8 @@ class VCDMigrationValidation:
                     if ipBlockToBeAddedToIpSpaceUplinks:
                         self.rollback.apiData["ipBlockToBeAddedToIpSpaceUplinks"] = ipBlockToBeAddedToIpSpaceUplinks
 
-    def _validateNonIpSpaceTier0ForBGP(self, targetExternalNetwork, sourceEdgeGateway, sourceOrgVDC, inputDict, bgpConfigDict, errorList):
+    def _validateNonIpSpaceTier0ForBGP(self, targetExternalNetwork, sourceEdgeGateway, sourceOrgVDC, inputDict, bgpConfigDict, errorList,
+                                       orgVdcNamesByExternalNetwork=None):
         """
         Description :   Validates Tier0 (NON-IP SPace enabled) for BGP
         """
@@ -6341,7 +6699,7 @@ class VCDMigrationValidation:
         advertiseRoutedNetworks = self.orgVdcInput['EdgeGateways'][sourceEdgeGateway['name']]['AdvertiseRoutedNetworks']
         # 1. User input validation Across Org VDC
         orgVdcNameList = self.checkSameExternalNetworkUsedByOtherVDC(
-            sourceOrgVDC, inputDict, targetExternalNetwork["name"])
+            sourceOrgVDC, inputDict, targetExternalNetwork["name"], orgVdcNamesByExternalNetwork)
         if orgVdcNameList:
             if bgpEnabled:
                 errorList.append(
@@ -6419,10 +6777,12 @@ class VCDMigrationValidation:
                                    vcdConstants.UPDATE_EDGE_GATEWAY_BY_ID.format(edgeGatewayId))
             getResponse = self.restClientObj.get(getUrl, headers=self.headers)
             if getResponse.status_code == requests.codes.ok:
-                responseDict = self.vcdUtils.parseXml(getResponse.content)
-                edgeGatewayDict = responseDict['EdgeGateway']
+                # only dns relay flag is read from edge gateway XML instead of converting whole XML to dict
+                useDefaultRouteForDnsRelay = next(
+                    (element.text for element in ElementTree.fromstring(getResponse.content).iter()
+                     if xmlLocalName(element.tag) == 'UseDefaultRouteForDnsRelay'), None)
                 # checking if use default route for dns relay is enabled on edge gateway, if not then return
-                if edgeGatewayDict['Configuration']['UseDefaultRouteForDnsRelay'] != 'true':
+                if useDefaultRouteForDnsRelay != 'true':
                     return []
             logger.debug("Getting DNS Services Configuration Details of Source Edge Gateway")
             # url to get DNS config details of specified edge gateway
@@ -6450,52 +6810,20 @@ class VCDMigrationValidation:
             raise
 
     @isSessionExpired
-    def _checkVappIsEmpty(self, vApp):
-        """
-        Description :   Send get request for vApp and check if vApp has VM or not in response
-        Parameters  :   vApp - data related to a vApp (DICT)
-        """
-        try:
-            vAppResponse = self.restClientObj.get(vApp['@href'], self.headers)
-            responseDict = self.vcdUtils.parseXml(vAppResponse.content)
-            if vAppResponse.status_code == requests.codes.ok:
-                # checking if the vapp has vms present in it and different states of vApp
-                if 'VApp' in responseDict.keys():
-                    if not responseDict['VApp'].get('Children') or responseDict['VApp']["@status"] in [
-                        code for state, code in vcdConstants.VAPP_STATUS.items()
-                        if state in ['FAILED_CREATION', 'UNRESOLVED', 'UNRECOGNIZED', 'INCONSISTENT_STATE']
-                    ]:
-                        return True
-                else:
-                    raise Exception(f"Failed to get vApp {vApp['@name']} details.")
-            else:
-                raise Exception(f"Failed to get vApp {vApp['@name']} details: {responseDict['Error']['@message']}")
-
-        except Exception:
-            raise
-
     def validateNoEmptyVappsExistInSourceOrgVDC(self, sourceOrgVDCId):
         """
         Description :   Validates that there are no empty vapps in source org vdc
                         If found atleast single empty vapp in source org vdc then raises exception
         """
         try:
-            emptyvAppList = list()
-            sourceVappsList = self.getOrgVDCvAppsList(sourceOrgVDCId)
-            if not sourceVappsList:
-                return
-
-            # iterating over the source vapps
-            for vApp in sourceVappsList:
-                # spawn thread for check empty vApp task
-                self.thread.spawnThread(self._checkVappIsEmpty, vApp, saveOutputKey=vApp['@name'])
-            # halt the main thread till all the threads complete execution
-            self.thread.joinThreads()
-            if self.thread.stop():
-                raise Exception("Failed to validate empty vapp/s exist in Source Org VDC, Check log file for errors")
-            for vAppName, status in self.thread.returnValues.items():
-                if status == True:
-                    emptyvAppList.append(vAppName)
+            # VM count and status of all the vApps are retrieved by query instead of fetching each vApp
+            vAppRecords = self._iterQueryRecords(
+                vcdConstants.ADMIN_VAPP_BY_VDC_QUERY.format(sourceOrgVDCId.split(':')[-1]),
+                vcdConstants.VAPP_QUERY_PAGE_SIZE, 'vApp', fields=('name', 'status', 'numberOfVMs'))
+            emptyvAppList = [
+                vAppRecord['name'] for vAppRecord in vAppRecords
+                if not int(vAppRecord.get('numberOfVMs') or 0)
+                or vAppRecord.get('status') in vcdConstants.VAPP_UNSUPPORTED_STATUS_NAMES]
             if emptyvAppList:
                 logger.warning('vApp: {} is either empty or in failed '
                                'creation/unresolved/unrecognized/inconsistent state'.format(','.join(emptyvAppList)))
@@ -6512,20 +6840,15 @@ class VCDMigrationValidation:
         try:
             # Reading api data from metadata
             data = self.rollback.apiData
-            highestSourceVersion = 0
-            highestSourceVersionName = str()
-            highestTargetVersionName = str()
-            for eachSourceVersionDetail in data['sourceProviderVDC']['Capabilities']['SupportedHardwareVersions']['SupportedHardwareVersion']:
-                [name, currentVersion] = eachSourceVersionDetail['@name'].split('-')
-                if int(currentVersion) > highestSourceVersion:
-                    highestSourceVersion = int(currentVersion)
-                highestSourceVersionName = '-'.join([name, str(highestSourceVersion)])
-            highestTargetVersion = 0
-            for eachTargetVersionDetail in data['targetProviderVDC']['Capabilities']['SupportedHardwareVersions']['SupportedHardwareVersion']:
-                [name, currentVersion] = eachTargetVersionDetail['@name'].split('-')
-                if int(currentVersion) > highestTargetVersion:
-                    highestTargetVersion = int(currentVersion)
-                highestTargetVersionName = '-'.join([name, str(highestTargetVersion)])
+            # highest hardware version number along with its name e.g. (19, 'vmx-19') of source and target PVDC
+            highestSourceVersion, highestSourceVersionName = max(
+                ((int(versionDetail['@name'].rsplit('-', 1)[1]), versionDetail['@name']) for versionDetail in listify(
+                    data['sourceProviderVDC']['Capabilities']['SupportedHardwareVersions']['SupportedHardwareVersion'])),
+                default=(0, str()))
+            highestTargetVersion, highestTargetVersionName = max(
+                ((int(versionDetail['@name'].rsplit('-', 1)[1]), versionDetail['@name']) for versionDetail in listify(
+                    data['targetProviderVDC']['Capabilities']['SupportedHardwareVersions']['SupportedHardwareVersion'])),
+                default=(0, str()))
             if highestSourceVersion > highestTargetVersion:
                 raise Exception(
                     'Hardware version on both Source Provider VDC and Target Provider VDC are not compatible, either both should be same or target PVDC hardware version'
@@ -6550,9 +6873,12 @@ class VCDMigrationValidation:
                                    vcdConstants.ORG_VDC_BY_ID.format(targetOrgVdcId))
             # get api call retrieve the specified provider vdc details
             response = self.restClientObj.get(url, self.headers)
-            responseDict = self.vcdUtils.parseXml(response.content)
             if response.status_code == requests.codes.ok:
-                if responseDict['AdminVdc']['@id'] == targetOrgVDCId and responseDict['AdminVdc']['IsEnabled'] == "true":
+                # only id and state are read from org vdc XML instead of converting whole XML to dict
+                adminVdc = ElementTree.fromstring(response.content)
+                isEnabled = next(
+                    (child.text for child in adminVdc if xmlLocalName(child.tag) == 'IsEnabled'), None)
+                if adminVdc.get('id') == targetOrgVDCId and isEnabled == "true":
                     logger.debug('Target Org VDC is enabled')
                     return
                 else:
@@ -6560,44 +6886,39 @@ class VCDMigrationValidation:
         except Exception:
             raise
 
+    def _getCatalogMediaPage(self, orgId, pageNo):
+        """
+        Description : Gets a single page of media objects of specific Organization
+        Parameters  : orgId - Organization Id (STRING)
+                      pageNo - number of the page to be retrieved (INT)
+        Returns     : Response of the media page (DICT)
+        """
+        # url to get the media info of specified organization with page number and page size count
+        url = "{}{}&page={}&pageSize={}&format=records&sortAsc=name".format(
+            vcdConstants.XML_API_URL.format(self.ipAddress),
+            vcdConstants.GET_MEDIA_INFO, pageNo,
+            vcdConstants.MEDIA_PAGE_SIZE)
+        headers = {'Authorization': self.headers['Authorization'], 'Accept': vcdConstants.GENERAL_JSON_ACCEPT_HEADER,
+                   'X-VMWARE-VCLOUD-TENANT-CONTEXT': orgId}
+        # get api call to retrieve the media details of organization with page number and page size count
+        response = self.restClientObj.get(url, headers)
+        if response.status_code != requests.codes.ok:
+            raise Exception('Failed to get media details page {} with error code {}'.format(
+                pageNo, response.status_code))
+        return response.json()
+
     @isSessionExpired
     def getCatalogMedia(self, orgId):
         """
         Description : Get all media objects of specific Organization
+                      Pages after the first one are retrieved in parallel once total result count is known
         Parameters  : orgId - Organization Id (STRING)
         """
         try:
-            # url to get the media info of specified organization
-            url = "{}{}&sortAsc=name".format(vcdConstants.XML_API_URL.format(self.ipAddress),
-                                vcdConstants.GET_MEDIA_INFO)
-            acceptHeader = vcdConstants.GENERAL_JSON_ACCEPT_HEADER
-            headers = {'Authorization': self.headers['Authorization'], 'Accept': acceptHeader,
-                       'X-VMWARE-VCLOUD-TENANT-CONTEXT': orgId}
-            # get api call to retrieve the media details of organization
-            response = self.restClientObj.get(url, headers)
-            if response.status_code == requests.codes.ok:
-                responseDict = response.json()
-                resultTotal = responseDict['total']
-            pageNo = 1
-            pageSizeCount = 0
-            resultList = []
             logger.debug('Getting media details')
-            while resultTotal > 0 and pageSizeCount < resultTotal:
-                # url to get the media info of specified organization with page number and page size count
-                url = "{}{}&page={}&pageSize={}&format=records&sortAsc=name".format(
-                    vcdConstants.XML_API_URL.format(self.ipAddress),
-                    vcdConstants.GET_MEDIA_INFO, pageNo,
-                    vcdConstants.MEDIA_PAGE_SIZE)
-                getSession(self)
-                # get api call to retrieve the media details of organization with page number and page size count
-                response = self.restClientObj.get(url, headers)
-                if response.status_code == requests.codes.ok:
-                    responseDict = response.json()
-                    resultList.extend(responseDict['record'])
-                    pageSizeCount += len(responseDict['record'])
-                    logger.debug('Media details result pageSize = {}'.format(pageSizeCount))
-                    pageNo += 1
-                    resultTotal = responseDict['total']
+            resultList = self._getPagesInParallel(
+                lambda pageNo: self._getCatalogMediaPage(orgId, pageNo), vcdConstants.MEDIA_PAGE_SIZE,
+                vcdConstants.MEDIA_PAGE_FETCH_WORKERS, 'total', 'record', 'media details')
             logger.debug('Total media details result count = {}'.format(len(resultList)))
             logger.debug('Media details successfully retrieved')
             return resultList
@@ -6897,8 +7218,11 @@ class VCDMigrationValidation:
     def getServiceEngineGroupDetails(self):
         """
         Description : Retrieve service engine group list from VCD
+                      Service engine groups are fetched once and reused on subsequent calls
         Return      : List of service engine groups (LIST)
         """
+        if self._serviceEngineGroupsByName is not None:
+            return list(self._serviceEngineGroupsByName.values())
         try:
             logger.debug("Getting Service Engine Group Details")
             # url to retrieve service engine group details
@@ -6929,10 +7253,22 @@ class VCDMigrationValidation:
                     pageNo += 1
                     resultTotal = responseDict['resultTotal']
 
+            self._serviceEngineGroupsByName = {
+                serviceEngineGroup['name']: serviceEngineGroup for serviceEngineGroup in resultList}
             return resultList
         except Exception:
             raise
 
+    def getServiceEngineGroupByName(self, serviceEngineGroupName):
+        """
+        Description : Retrieve service engine group details by name
+        Parameters  : serviceEngineGroupName - Name of the service engine group (STRING)
+        Return      : Details of service engine group or None if it does not exist (DICT)
+        """
+        if self._serviceEngineGroupsByName is None:
+            self.getServiceEngineGroupDetails()
+        return self._serviceEngineGroupsByName.get(serviceEngineGroupName)
+
     @isSessionExpired
     def networkConflictValidation(self, sourceOrgVDCId):
         """
@@ -6946,26 +7282,23 @@ class VCDMigrationValidation:
                                                        sharedNetwork=True)
             idList = list()
             if orgvdcNetworkList:
-                # Iterating over network list
-                for network in orgvdcNetworkList:
+                # Creating ip_network from gateway cidr
+                networkAddressList = [
+                    ipaddress.ip_network(
+                        f"{network['subnets']['values'][0]['gateway']}/"
+                        f"{network['subnets']['values'][0]['prefixLength']}", strict=False)
+                    for network in orgvdcNetworkList]
+                # Overlapping networks conclude a conflict, entry is added for each network conflicting with...
+                # isolated network, in order of networks
+                conflicts = sorted(
+                    conflict for i, j in overlappingNetworkPairs(networkAddressList) for conflict in ((i, j), (j, i)))
+                for index, _ in conflicts:
+                    network = orgvdcNetworkList[index]
                     # We need to check conflict only for isolated networks
                     if network['networkType'] == 'ISOLATED':
-                        # Creating ip_network from gateway cidr
-                        isolatedNetworkAddress = ipaddress.ip_network(
-                            f"{network['subnets']['values'][0]['gateway']}/"
-                            f"{network['subnets']['values'][0]['prefixLength']}", strict=False)
-                        # Iteraing over network list to check for conflicts
-                        for networkToCheck in orgvdcNetworkList:
-                            if network != networkToCheck:
-                                # Creating ip_network from gateway cidr
-                                networkToCheckAddress = ipaddress.ip_network(
-                                    f"{networkToCheck['subnets']['values'][0]['gateway']}/"
-                                    f"{networkToCheck['subnets']['values'][0]['prefixLength']}", strict=False)
-                                # If the networks overlap it concludes a conflict
-                                if isolatedNetworkAddress.overlaps(networkToCheckAddress):
-                                    idList.append({'name': network['name'],
-                                                   'id': network['id'],
-                                                   'shared': network['shared']})
+                        idList.append({'name': network['name'],
+                                       'id': network['id'],
+                                       'shared': network['shared']})
                 self.rollback.apiData['ConflictNetworks'] = idList
                 return idList
         except Exception:
@@ -845,8 +845,8 @@ class VMwareCloudDirectorNSXMigrator():
             for orgVDCId, vcdObj in zip([data["id"] for data in self.orgVDCData.values()], self.vcdObjList):
                 orgVdcNetworkList += vcdObj.retrieveNetworkListFromMetadata(orgVDCId, orgVDCType='source')
             # filtering the org vdc list as direct networks do not need to be bridged
-            filteredList = copy.deepcopy(orgVdcNetworkList)
-            filteredList = list(filter(lambda network: network['networkType'] != 'DIRECT', filteredList))
+            filteredList = copy.deepcopy(
+                [network for network in orgVdcNetworkList if network['networkType'] != 'DIRECT'])
             if filteredList:
                 # Perform checks related to bridging
                 orgVDCIDList = [data["id"] for data in self.orgVDCData.values()]
@@ -877,8 +877,8 @@ class VMwareCloudDirectorNSXMigrator():
             for orgVDCId, vcdObj in zip([data["id"] for data in self.orgVDCData.values()], self.vcdObjList):
                 orgVdcNetworkList += vcdObj.retrieveNetworkListFromMetadata(orgVDCId, orgVDCType='source')
             # filtering the org vdc list as direct networks do not need to be bridged
-            filteredList = copy.deepcopy(orgVdcNetworkList)
-            filteredList = list(filter(lambda network: network['networkType'] != 'DIRECT', filteredList))
+            filteredList = copy.deepcopy(
+                [network for network in orgVdcNetworkList if network['networkType'] != 'DIRECT'])
 
             # only if org vdc networks exist bridging will be configured
             if filteredList:
@@ -222,10 +222,8 @@ class VMwareCloudDirectorNSXMigratorAssessmentMode():
             filteredList = list(filter(lambda network: network['networkType'] != 'DIRECT', networkList))
 
             # Checking if any org vdc has VXLAN backed network pool
-            vxlanBackingPresent = any([True if
-                                       vcdObj.getSourceNetworkPoolBacking() == vcdConstants.VXLAN
-                                       else False
-                                       for vcdObj in self.vcdObjList])
+            vxlanBackingPresent = any(vcdObj.getSourceNetworkPoolBacking() == vcdConstants.VXLAN
+                                      for vcdObj in self.vcdObjList)
 
             # Restoring thread name
             threading.current_thread().name = "MainThread"